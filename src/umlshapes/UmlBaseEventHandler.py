@@ -53,8 +53,8 @@ class UmlBaseEventHandler(ShapeEvtHandler):
 
     def OnDragLeft(self, draw, x, y, keys=0, attachment=0):
         """
-        Move this shape, then subsequently send messages to move the other
-        selected shapes (if any)
+        Move this shape, then subsequently move the other selected shapes (if any)
+        via the frame's drag session
 
         Args:
             draw:
@@ -69,7 +69,7 @@ class UmlBaseEventHandler(ShapeEvtHandler):
         from umlshapes.ShapeTypes import UmlShapeGenre
 
         from umlshapes.frames.UmlFrame import UmlFrame
-        from umlshapes.frames.ShapeMoveInfo import ShapeId
+        from umlshapes.frames.DragSession import DragSession
 
         umlShape: UmlShapeGenre = cast(UmlShapeGenre, self.GetShape())
         umlFrame: UmlFrame      = self._extractFrame()
@@ -78,18 +78,15 @@ class UmlBaseEventHandler(ShapeEvtHandler):
             #
             # Only the move master moves himself
             # The first time through we have no way of calculating the delta
-            # The other selected shapes get moved by the frame operations listener (indirectly)
+            # The other selected shapes get moved by the drag session;  It captures the
+            # selection once, so each tick is a single pass with no message fan out
             #
             if self._previousPosition is NO_POSITION:
                 self._previousPosition = UmlPosition(x=x, y=y)
                 umlShape.moveMaster = True
-                self._saveSelectedShapesInitialPositions()
 
-                umlFrame.markShapeAsMoved(umlShape=umlShape)
-                #
-                # Save the master shape position, in case he is not selected
-                #
-                self._initialPositions[ShapeId(umlShape.id)] = umlShape.position
+                dragSession: DragSession = umlFrame.beginDragSession(moveMaster=umlShape)
+                self._initialPositions = dragSession.initialPositions
 
                 self._baseLogger.info(f'Initial Position Count: {len(self._initialPositions)}')
 
@@ -102,7 +99,10 @@ class UmlBaseEventHandler(ShapeEvtHandler):
                 )
                 self._previousPosition = UmlPosition(x=x, y=y)
 
-                self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.SHAPE_MOVING, frameId=umlShape.umlFrame.id, deltaXY=deltaXY)
+                if umlFrame.dragSession is None:
+                    self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.SHAPE_MOVING, frameId=umlShape.umlFrame.id, deltaXY=deltaXY)
+                else:
+                    umlFrame.dragSession.moveBy(deltaXY=deltaXY)
 
         super().OnDragLeft(draw, x, y, keys, attachment)
 
@@ -137,7 +137,7 @@ class UmlBaseEventHandler(ShapeEvtHandler):
         self._baseLogger.debug(f'Pre clear {umlFrame.shapesMoving=}')
 
         self._debugDumpMovedShapes(umlFrame)
-        umlFrame.clearMovedShapes()
+        umlFrame.endDragSession()
         self._initialPositions = InitialPositions({})
 
         self._baseLogger.debug(f'Post clear {umlFrame.shapesMoving=}')
@@ -196,7 +196,10 @@ class UmlBaseEventHandler(ShapeEvtHandler):
 
         umlShape: UmlShapeGenre = cast(UmlShapeGenre, shape)
         umlShape.size = UmlDimensions(width=w, height=h)
-        umlShape.umlFrame.refresh()
+        #
+        # No refresh;  The move and the resize damaged the canvas and the canvas
+        # repaints only that area at the end of the mouse event
+        #
 
     def _unSelectAllShapesOnCanvas(self, shape: Shape, canvas: ShapeCanvas, dc: ClientDC):
 
@@ -205,42 +208,22 @@ class UmlBaseEventHandler(ShapeEvtHandler):
             shape.Select(False, dc)
             canvas.Refresh(False)
         else:
-            shapeList: ShapeList = canvas.GetDiagram().GetShapeList()
-            toUnselect: ShapeList = ShapeList([])
-
-            for s in shapeList:
-                if s.Selected() is True:
-                    # If we unselect it, then some objects in
-                    # shapeList will become invalid (the control points are
-                    # shapes too!) and bad things will happen...
-                    toUnselect.append(s)
+            from umlshapes.frames.DiagramFrame import DiagramFrame
+            #
+            # A copy;  If we unselect it, then some objects in
+            # shapeList will become invalid (the control points are
+            # shapes too!) and bad things will happen...
+            #
+            diagramFrame: DiagramFrame = cast(DiagramFrame, canvas)
+            toUnselect:   ShapeList    = ShapeList(diagramFrame.selectionModel.shapes)
 
             if len(toUnselect) > 0:
-                for s in toUnselect:
-                    s.Select(False, dc)
+                with diagramFrame.selectionModel.batch():
+                    for s in toUnselect:
+                        s.Select(False, dc)
 
                 canvas.Refresh(False)
 
-    def _saveSelectedShapesInitialPositions(self):
-        """
-        Save initial positions of selected shapes so when the drag ends we can
-        inject them into the `ShapesMovedCommand`
-        """
-        from umlshapes.frames.ShapeMoveInfo import ShapeId
-
-        from umlshapes.links.UmlLink import UmlLink
-        from umlshapes.ShapeTypes import UmlShapeGenre
-        from umlshapes.frames.UmlFrame import UmlFrame
-        from umlshapes.links.UmlLinkLabel import UmlLinkLabel
-
-        umlFrame: UmlFrame = self._extractFrame()
-
-        shapes = umlFrame.selectedShapes
-        for s in shapes:
-            umlShape: UmlShapeGenre = cast(UmlShapeGenre, s)
-            if not isinstance(umlShape, UmlLink) and not isinstance(umlShape, UmlLinkLabel):
-                self._initialPositions[ShapeId(umlShape.id)] = umlShape.position
-
     def _extractFrame(self) -> 'UmlFrame':
         """
         Convenience method so I can isolate this deep coupling
@@ -1,27 +1,94 @@
-
+from typing import Dict
+from typing import Hashable
 from typing import List
 from typing import NewType
+from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import TYPE_CHECKING
+from typing import cast
 
 from logging import Logger
 from logging import getLogger
 
+from math import ceil
+from math import floor
+
 from collections.abc import Iterable
 
+from wx import DC
+from wx import Rect
+
+from umlshapes.lib.ogl import CONTROL_POINT_SIZE
+from umlshapes.lib.ogl import DAMAGE_MARGIN
+from umlshapes.lib.ogl import ControlPoint
 from umlshapes.lib.ogl import Diagram
+from umlshapes.lib.ogl import LineShape
+from umlshapes.lib.ogl import PolygonShape
 from umlshapes.lib.ogl import Shape
 
 from umlshapes.frames.DiagramFrame import DiagramFrame
+from umlshapes.frames.SelectionModel import SelectionModel
+
+from umlshapes.spatialindex.SpatialIndex import SpatialIndex
+from umlshapes.spatialindex.SpatialIndex import IndexHits
+
+from umlshapes.mixins.IdentifierMixin import IdentifierMixin
+from umlshapes.mixins.TopLeftMixin import TopLeftMixin
+
+from umlshapes.types.Common import Rectangle
 
 if TYPE_CHECKING:
     from umlshapes.frames.UmlFrame import UmlFrame
 
 Shapes = NewType('Shapes', List[Shape])
 
+ShapeMap = NewType('ShapeMap', Dict[int, Shape])
+ZOrder   = NewType('ZOrder',   Dict[int, int])
+
+ShapesById      = NewType('ShapesById',      Dict[str, Shape])
+ShapesByModelId = NewType('ShapesByModelId', Dict[Hashable, ShapeMap])
+ModelIds        = NewType('ModelIds',        Dict[int, Hashable])
+
+LollipopsByAttachment = NewType('LollipopsByAttachment', Dict[int, ShapeMap])
+LollipopAttachments   = NewType('LollipopAttachments',   Dict[int, int])
+
+#
+# The properties through which the UML shapes expose their data model
+#
+MODEL_PROPERTIES: Tuple[str, ...] = (
+    'modelClass', 'modelNote', 'modelText', 'modelActor', 'modelUseCase', 'modelLink', 'modelInterface'
+)
+
+#
+# Matches the minimum size and the mousing allowance that Shape.HitTest uses
+#
+MINIMUM_HIT_SIZE: int = 4
+HIT_TOLERANCE:    int = 4
+
+#
+# Hit tests that only look inside the shape bounding box
+#
+BOUNDED_HIT_TESTS = (Shape.HitTest, PolygonShape.HitTest)
+
 
 class UmlDiagram(Diagram):
     """
     Modernity wrapper
+
+    Shapes that hit test within their bounding box are kept in a spatial index so
+    that finding the shape under the mouse does not have to hit test every shape
+    on the diagram.  Lines, control points, and shapes with a custom hit test are
+    'volatile';  They are always returned as candidates.
+
+    Shapes report geometry changes via Shape.GeometryChanged();  Changed shapes are
+    marked dirty and re-indexed on the next query.  The same index limits repaints
+    to the shapes that intersect the damaged area.
+
+    Shapes are keyed by their Python id because some UML shapes define __eq__ and __hash__
+    on their data model.  The UML shapes are also indexed by their identifier and by the
+    identifier of their data model, so membership, lookup, and removal do not scan the
+    shape list
     """
     def __init__(self, diagramFrame: DiagramFrame):
         """
@@ -34,6 +101,21 @@ class UmlDiagram(Diagram):
 
         super().__init__()
 
+        self._spatialIndex:   SpatialIndex = SpatialIndex()
+        self._indexedShapes:  ShapeMap     = ShapeMap({})
+        self._volatileShapes: ShapeMap     = ShapeMap({})
+        self._dirtyShapes:    Set[int]     = set()
+        self._zOrder:         ZOrder       = ZOrder({})
+        self._nextZ:          int          = 0
+        self._zOrderStale:    bool         = False
+
+        self._shapesById:      ShapesById      = ShapesById({})
+        self._shapesByModelId: ShapesByModelId = ShapesByModelId({})
+        self._modelIds:        ModelIds        = ModelIds({})
+
+        self._lollipops:           LollipopsByAttachment = LollipopsByAttachment({})
+        self._lollipopAttachments: LollipopAttachments   = LollipopAttachments({})
+
         self.SetCanvas(diagramFrame)
 
     @property
@@ -46,4 +128,431 @@ class UmlDiagram(Diagram):
 
     @shapes.setter
     def shapes(self, shapeList):
-        self._shapeList = shapeList
+        self.SetShapeList(shapeList)
+        self._rebuildIndex()
+        if self.GetCanvas() is not None:
+            self.GetCanvas().Invalidate()
+            selectionModel: SelectionModel = self.GetCanvas().selectionModel
+            for shape in selectionModel.shapes:
+                if id(shape) not in self._zOrder:
+                    selectionModel.discard(shape)
+
+    @property
+    def drawnShapeCount(self) -> int:
+        """
+        Diagnostics
+
+        Returns:  The number of shapes the last redraw drew
+        """
+        return self.GetDrawnCount()
+
+    @property
+    def skippedShapeCount(self) -> int:
+        """
+        Diagnostics
+
+        Returns:  The number of shapes the last redraw culled because they were outside the redrawn area
+        """
+        return self.GetSkippedCount()
+
+    @property
+    def spatialIndex(self) -> SpatialIndex:
+        """
+        Callers must not modify the index;  Use it for read only queries
+        """
+        self._refreshDirtyShapes()
+        return self._spatialIndex
+
+    def AddShape(self, shape, addAfter=None):
+
+        shapeCount: int = self.GetCount()
+        super().AddShape(shape, addAfter)
+
+        if self.GetCount() > shapeCount:
+            if addAfter is None:
+                self._zOrder[id(shape)] = self._nextZ
+                self._nextZ += 1
+            else:
+                self._zOrderStale = True
+            self._trackShape(shape)
+
+    def InsertShape(self, shape):
+
+        super().InsertShape(shape)
+
+        self._zOrderStale = True
+        self._trackShape(shape)
+
+    def RemoveShape(self, shape):
+
+        super().RemoveShape(shape)
+        self._untrackShape(shape)
+        if self.GetCanvas() is not None:
+            self.GetCanvas().selectionModel.discard(shape)
+
+    def ContainsShape(self, shape) -> bool:
+
+        shapeId: int = id(shape)
+
+        return shapeId in self._indexedShapes or shapeId in self._volatileShapes
+
+    def FindShape(self, shapeId):
+        """
+        The UML shapes raise an exception on the ogl GetId();  Look them up by their
+        UML identifier
+
+        Args:
+            shapeId:  The UML generated ID
+
+        Returns:  The shape or `None`
+        """
+        return self.findShapeById(shapeId=shapeId)
+
+    def findShapeById(self, shapeId: str) -> Optional[Shape]:
+        """
+        Args:
+            shapeId:  The UML generated ID
+
+        Returns:  The shape with that identifier, or `None` if it is not on this diagram
+        """
+        return self._shapesById.get(shapeId)
+
+    def findByModelId(self, modelId: Hashable) -> Shapes:
+        """
+        More than one shape may present the same model object;  For example, the
+        lollipops of an interface
+
+        Args:
+            modelId:  The identifier of a data model object
+
+        Returns:  The shapes that present that model object, bottommost first
+        """
+        shapeMap: Optional[ShapeMap] = self._shapesByModelId.get(modelId)
+        if shapeMap is None:
+            return Shapes([])
+
+        return self._sortByZOrder(Shapes(list(shapeMap.values())), topmostFirst=False)
+
+    def shapeIdentifierChanged(self, shape: IdentifierMixin, oldId: str):
+        """
+        Called by the identifier mixin when a shape on this diagram gets a new identifier
+
+        Args:
+            shape:  The shape
+            oldId:  The identifier the shape was indexed under
+        """
+        umlShape: Shape = cast(Shape, shape)
+        if self._shapesById.get(oldId) is umlShape:
+            del self._shapesById[oldId]
+            self._shapesById[shape.id] = umlShape
+
+    def shapeModelChanged(self, shape: Shape):
+        """
+        Called by a shape on this diagram when it is given a different data model;  Re-keys
+        the shape in the model identifier index
+
+        Args:
+            shape:  The shape
+        """
+        if self.ContainsShape(shape) is True:
+            self._untrackModelId(shape)
+            self._trackModelId(shape)
+
+    def lollipopAttachmentChanged(self, shape: Shape):
+        """
+        Called by a lollipop interface on this diagram when it is attached to a different
+        class;  Re-keys the lollipop in the attachment index
+
+        Args:
+            shape:  The lollipop interface
+        """
+        if self.ContainsShape(shape) is True:
+            self._untrackLollipop(shape)
+            self._trackLollipop(shape)
+
+    def RemoveAllShapes(self):
+
+        super().RemoveAllShapes()
+        self._clearIndex()
+        if self.GetCanvas() is not None:
+            self.GetCanvas().selectionModel.clear()
+
+    def OnShapeGeometryChanged(self, shape):
+
+        shapeId: int = id(shape)
+        if shapeId in self._indexedShapes:
+            self._dirtyShapes.add(shapeId)
+        #
+        # Lollipops paint relative to the class they are attached to
+        #
+        lollipops: Optional[ShapeMap] = self._lollipops.get(shapeId)
+        if lollipops is not None:
+            for lollipop in lollipops.values():
+                lollipop.Invalidate()
+
+    def GetCandidateShapes(self, x, y):
+        """
+        Only returns the shapes whose bounding box contains the point plus the volatile shapes
+
+        Args:
+            x:  The x position
+            y:  The y position
+
+        Returns:  The candidate shapes, topmost first
+        """
+        self._refreshDirtyShapes()
+
+        candidates: Shapes = Shapes([self._indexedShapes[shapeId] for shapeId in self._spatialIndex.pointQuery(x, y)])
+        candidates.extend(self._volatileShapes.values())
+
+        return self._sortByZOrder(candidates, topmostFirst=True)
+
+    def shapesInRectangle(self, rectangle: Rectangle) -> Shapes:
+        """
+        The shapes that a rubber band selection rectangle fully contains.  Only the shapes
+        whose hit rectangle intersects it are checked;  A contained shape's always does.
+        Lines are contained when both of their ends are.  Control points are never returned
+
+        Args:
+            rectangle:  The selection rectangle
+
+        Returns:  The contained shapes, bottommost first
+        """
+        self._refreshDirtyShapes()
+
+        left:   int = rectangle.left
+        top:    int = rectangle.top
+        right:  int = rectangle.right
+        bottom: int = rectangle.bottom
+
+        contained: Shapes = Shapes([])
+        for shapeId in self._spatialIndex.rectangleQuery(rectangle):
+            shape: Shape = self._indexedShapes[shapeId]
+            if isinstance(shape, TopLeftMixin) and shape.isInsideRectangle(rectangle) is True:
+                contained.append(shape)
+
+        for shape in self._volatileShapes.values():
+            if isinstance(shape, ControlPoint):
+                continue
+            if isinstance(shape, LineShape):
+                x1, y1, x2, y2 = shape.GetEnds()
+                if left <= x1 <= right and top <= y1 <= bottom and left <= x2 <= right and top <= y2 <= bottom:
+                    contained.append(shape)
+            elif isinstance(shape, TopLeftMixin) and shape.isInsideRectangle(rectangle) is True:
+                contained.append(shape)
+
+        return self._sortByZOrder(contained, topmostFirst=False)
+
+    def Redraw(self, dc: DC, rect: Optional[Rect] = None):
+        """
+        When given an area only draws the shapes that intersect it, bottommost first
+
+        Args:
+            dc:     The device context
+            rect:   The visible or damaged area in logical coordinates
+        """
+        if rect is None:
+            super().Redraw(dc)
+            return
+
+        self._refreshDirtyShapes()
+        #
+        # The index holds hit rectangles;  Grow the query to cover what shapes paint outside of them
+        #
+        margin: int = CONTROL_POINT_SIZE + DAMAGE_MARGIN
+        query: Rectangle = Rectangle(
+            left=rect.GetLeft() - margin,
+            top=rect.GetTop() - margin,
+            right=rect.GetRight() + margin,
+            bottom=rect.GetBottom() + margin
+        )
+        hits:   IndexHits = self._spatialIndex.rectangleQuery(query)
+        shapes: Shapes    = Shapes([self._indexedShapes[shapeId] for shapeId in hits])
+        for shape in self._volatileShapes.values():
+            if shape.GetDamageRectangle().Intersects(rect):
+                shapes.append(shape)
+
+        for shape in self._sortByZOrder(shapes, topmostFirst=False):
+            shape.Draw(dc)
+
+        self.SetRedrawCounts(len(shapes), self.GetCount() - len(shapes))
+
+    def sortByZOrder(self, shapes: Shapes) -> Shapes:
+        """
+        Args:
+            shapes:  Shapes on this diagram;  Sorted in place
+
+        Returns:  The shapes in the order they appear in the shape list, bottommost first
+        """
+        return self._sortByZOrder(shapes, topmostFirst=False)
+
+    def _sortByZOrder(self, shapes: Shapes, topmostFirst: bool) -> Shapes:
+
+        if self._zOrderStale is True:
+            self._renumberZOrder()
+
+        zOrder: ZOrder = self._zOrder
+        shapes.sort(key=lambda s: zOrder.get(id(s), -1), reverse=topmostFirst)
+
+        return shapes
+
+    def _trackShape(self, shape: Shape):
+
+        shapeId: int = id(shape)
+        self._trackIdentifiers(shape)
+        self._trackLollipop(shape)
+        if shape.Selected() is True and self.GetCanvas() is not None:
+            self.GetCanvas().selectionModel.add(shape)
+        if self._isVolatile(shape) is True:
+            self._volatileShapes[shapeId] = shape
+        else:
+            self._indexedShapes[shapeId] = shape
+            self._dirtyShapes.add(shapeId)
+
+    def _untrackShape(self, shape: Shape):
+
+        shapeId: int = id(shape)
+
+        self._volatileShapes.pop(shapeId, None)
+        self._untrackLollipop(shape)
+        self._indexedShapes.pop(shapeId, None)
+        self._dirtyShapes.discard(shapeId)
+        self._zOrder.pop(shapeId, None)
+        self._spatialIndex.remove(shapeId)
+        self._untrackIdentifiers(shape)
+
+    def _trackLollipop(self, shape: Shape):
+
+        from umlshapes.links.UmlLollipopInterface import UmlLollipopInterface
+
+        if isinstance(shape, UmlLollipopInterface) and shape.attachedTo is not None:
+            attachedId: int = id(shape.attachedTo)
+            self._lollipops.setdefault(attachedId, ShapeMap({}))[id(shape)] = shape
+            self._lollipopAttachments[id(shape)] = attachedId
+
+    def _untrackLollipop(self, shape: Shape):
+
+        shapeId:    int           = id(shape)
+        attachedId: Optional[int] = self._lollipopAttachments.pop(shapeId, None)
+        if attachedId is not None:
+            lollipops: ShapeMap = self._lollipops[attachedId]
+            del lollipops[shapeId]
+            if len(lollipops) == 0:
+                del self._lollipops[attachedId]
+
+    def _trackIdentifiers(self, shape: Shape):
+
+        if isinstance(shape, IdentifierMixin):
+            self._shapesById[shape.id] = shape
+
+        self._trackModelId(shape)
+
+    def _untrackIdentifiers(self, shape: Shape):
+
+        if isinstance(shape, IdentifierMixin) and self._shapesById.get(shape.id) is shape:
+            del self._shapesById[shape.id]
+
+        self._untrackModelId(shape)
+
+    def _trackModelId(self, shape: Shape):
+
+        modelId: Optional[Hashable] = self._modelId(shape)
+        if modelId is not None:
+            self._shapesByModelId.setdefault(modelId, ShapeMap({}))[id(shape)] = shape
+            self._modelIds[id(shape)] = modelId
+
+    def _untrackModelId(self, shape: Shape):
+
+        #
+        # The model identifier the shape was indexed under
+        #
+        modelId: Optional[Hashable] = self._modelIds.pop(id(shape), None)
+        if modelId is not None:
+            shapeMap: Optional[ShapeMap] = self._shapesByModelId.get(modelId)
+            if shapeMap is not None:
+                shapeMap.pop(id(shape), None)
+                if len(shapeMap) == 0:
+                    del self._shapesByModelId[modelId]
+
+    def _modelId(self, shape: Shape) -> Optional[Hashable]:
+        """
+        Args:
+            shape:
+
+        Returns:  The identifier of the shape's data model;  `None` if it does not have one
+        """
+        for modelProperty in MODEL_PROPERTIES:
+            model = getattr(shape, modelProperty, None)
+            if model is not None:
+                return getattr(model, 'id', None)
+
+        return None
+
+    def _clearIndex(self):
+
+        self._spatialIndex.clear()
+        self._indexedShapes  = ShapeMap({})
+        self._volatileShapes = ShapeMap({})
+        self._dirtyShapes    = set()
+        self._zOrder         = ZOrder({})
+        self._nextZ          = 0
+        self._zOrderStale    = False
+
+        self._shapesById      = ShapesById({})
+        self._shapesByModelId = ShapesByModelId({})
+        self._modelIds        = ModelIds({})
+
+        self._lollipops           = LollipopsByAttachment({})
+        self._lollipopAttachments = LollipopAttachments({})
+
+    def _rebuildIndex(self):
+
+        self._clearIndex()
+        for shape in self._shapes:
+            self._trackShape(shape)
+        self._renumberZOrder()
+
+    def _renumberZOrder(self):
+
+        self._zOrder = ZOrder({id(shape): z for z, shape in enumerate(self._shapes)})
+        self._nextZ       = len(self._shapes)
+        self._zOrderStale = False
+
+    def _refreshDirtyShapes(self):
+
+        for shapeId in self._dirtyShapes:
+            shape: Shape = self._indexedShapes[shapeId]
+            self._spatialIndex.insert(shapeId, self._hitRectangle(shape))
+
+        self._dirtyShapes.clear()
+
+    def _hitRectangle(self, shape: Shape) -> Rectangle:
+        """
+        Mirrors the box that Shape.HitTest checks
+
+        Args:
+            shape:
+
+        Returns:  The area in which the shape can report a hit
+        """
+        width, height = shape.GetBoundingBoxMax()
+
+        halfWidth:  float = (max(abs(width),  MINIMUM_HIT_SIZE) + HIT_TOLERANCE) / 2.0
+        halfHeight: float = (max(abs(height), MINIMUM_HIT_SIZE) + HIT_TOLERANCE) / 2.0
+
+        x: float = shape.GetX()
+        y: float = shape.GetY()
+
+        return Rectangle(
+            left=floor(x - halfWidth),
+            top=floor(y - halfHeight),
+            right=ceil(x + halfWidth),
+            bottom=ceil(y + halfHeight)
+        )
+
+    def _isVolatile(self, shape: Shape) -> bool:
+
+        if isinstance(shape, (LineShape, ControlPoint)):
+            return True
+
+        return type(shape).HitTest not in BOUNDED_HIT_TESTS
@@ -6,6 +6,8 @@ from logging import getLogger
 
 from datetime import datetime
 
+from sys import getsizeof
+
 from wx import Command
 
 from umlmodel.UmlModelBase import UmlModelBase
@@ -49,6 +51,14 @@ class BaseCommand(Command):
     def CanUndo(self):
         return True
 
+    def estimatedSize(self) -> int:
+        """
+        Returns:  The estimated bytes this command holds;  Mostly its model object
+        """
+        from umlshapes.commands.UndoHistory import estimateSize
+
+        return getsizeof(self) + getsizeof(self._name) + estimateSize(self._baseAttributes)
+
     def _setupEventHandler(self, umlShape, eventHandler: 'UmlBaseEventHandler'):
 
         eventHandler.SetShape(umlShape)
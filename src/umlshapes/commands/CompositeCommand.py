@@ -0,0 +1,112 @@
+
+from typing import List
+from typing import NewType
+from typing import TYPE_CHECKING
+
+from logging import Logger
+from logging import getLogger
+
+from datetime import datetime
+
+from sys import getsizeof
+
+from wx import Command
+
+if TYPE_CHECKING:
+    from umlshapes.frames.UmlFrame import UmlFrame
+
+Commands = NewType('Commands', List[Command])
+
+
+class CompositeCommand(Command):
+    """
+    A macro;  Groups commands into a single undoable unit.
+
+    The children run inside a single frame batch update, so however many there are,
+    the frame repaints once and sends a single frame modified message.  Undo runs
+    the children in reverse order.  Submit the composite, not its children
+    """
+    def __init__(self, partialName: str, umlFrame: 'UmlFrame'):
+        """
+
+        Args:
+            partialName:    Start of the name shown for the command
+            umlFrame:       The frame the child commands modify
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._umlFrame: 'UmlFrame' = umlFrame
+        self._commands: Commands   = Commands([])
+
+        dt: datetime = datetime.now()
+        self._name: str = f'{partialName}-{dt.microsecond}'      # Because Command.GetName() does not really work
+
+        super().__init__(canUndo=True, name=self._name)
+
+    @property
+    def commands(self) -> Commands:
+        """
+        Returns:  A copy of the child commands in the order they run
+        """
+        return Commands(list(self._commands))
+
+    def addCommand(self, command: Command):
+        self._commands.append(command)
+
+    def GetName(self) -> str:
+        return self._name
+
+    def CanUndo(self) -> bool:
+
+        for command in self._commands:
+            if command.CanUndo() is False:
+                return False
+
+        return True
+
+    def estimatedSize(self) -> int:
+        """
+        Returns:  The estimated bytes held by the children
+        """
+        from umlshapes.commands.UndoHistory import estimateCommandSize
+
+        size: int = getsizeof(self) + getsizeof(self._commands)
+        for command in self._commands:
+            size += estimateCommandSize(command)
+
+        return size
+
+    def Do(self) -> bool:
+        """
+        If a child fails, the children that already ran are undone
+
+        Returns:  `True` if all the children succeeded
+        """
+        completed: Commands = Commands([])
+        with self._umlFrame.batchUpdate():
+            for command in self._commands:
+                if command.Do() is False:
+                    self.logger.error(f'{self._name}: {command.GetName()} failed;  Undoing {len(completed)} command(s)')
+                    for completedCommand in reversed(completed):
+                        completedCommand.Undo()
+                    return False
+                completed.append(command)
+
+        return True
+
+    def Undo(self) -> bool:
+
+        ans: bool = True
+        with self._umlFrame.batchUpdate():
+            for command in reversed(self._commands):
+                if command.Undo() is False:
+                    self.logger.error(f'{self._name}: Undo of {command.GetName()} failed')
+                    ans = False
+
+        return ans
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def __str__(self) -> str:
+        return f'{self._name} - {len(self)} command(s)'
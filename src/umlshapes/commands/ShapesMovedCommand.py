@@ -1,22 +1,34 @@
 
+from typing import Optional
 from typing import TYPE_CHECKING
+from typing import NewType
+from typing import MutableMapping
 
 from logging import Logger
 from logging import getLogger
 
 from datetime import datetime
 
+from sys import getsizeof
+
+from weakref import WeakValueDictionary
+
 from wx import ClientDC
 from wx import Command
 
 from umlshapes.ShapeTypes import UmlShapeGenre
+from umlshapes.frames.ShapeMoveInfo import ShapeId
 from umlshapes.frames.ShapeMoveInfo import FinalPositions
 from umlshapes.frames.ShapeMoveInfo import InitialPositions
 
+from umlshapes.types.UmlPosition import UmlPosition
+
 if TYPE_CHECKING:
     from umlshapes.frames.UmlFrame import UmlFrame
     from umlshapes.frames.ShapeMoveInfo import MovedShapes
 
+MovedShapeRefs = NewType('MovedShapeRefs', MutableMapping[ShapeId, UmlShapeGenre])
+
 
 class ShapesMovedCommand(Command):
     """
@@ -25,18 +37,19 @@ class ShapesMovedCommand(Command):
 
     def __init__(self, umlFrame: 'UmlFrame', movedShapes: 'MovedShapes', initialPositions: InitialPositions):
         """
+        The command holds its shapes weakly;  A shape that is deleted later does not
+        stay alive in the undo history.  Undo and Redo skip it
+
         Args:
             umlFrame: The diagram frame where shapes are being moved.
             movedShapes: A dictionary mapping shape IDs to ShapeMovedInfo 
                          (which contains the shape and its original position).
         """
-        from umlshapes.frames.ShapeMoveInfo import MovedShapes
-
         self.logger: Logger = getLogger(__name__)
 
         self._umlFrame:          UmlFrame         = umlFrame
-        self._movedShapes:       MovedShapes      = movedShapes
-        self._initialPositions:  InitialPositions = initialPositions
+        self._shapes:            MovedShapeRefs   = MovedShapeRefs(WeakValueDictionary())
+        self._initialPositions:  InitialPositions = InitialPositions(dict(initialPositions))
         self._finalPositions:    FinalPositions   = FinalPositions({})
         self._initialDoComplete: bool             = False
 
@@ -47,7 +60,8 @@ class ShapesMovedCommand(Command):
         #
         # Command is not created until shapes are completely moved
         #
-        for shapeId, info in self._movedShapes.items():
+        for shapeId, info in movedShapes.items():
+            self._shapes[shapeId]         = info.umlShape
             self._finalPositions[shapeId] = info.umlShape.position
 
         super().__init__(canUndo=True, name=self._name)
@@ -69,6 +83,43 @@ class ShapesMovedCommand(Command):
 
         return True
 
+    def coalesce(self, command: Command) -> bool:
+        """
+        Absorb the next move of the same shapes, so that undo reverts both at once
+
+        Args:
+            command:  The command submitted after this one
+
+        Returns:  `True` if this command absorbed it
+        """
+        if not isinstance(command, ShapesMovedCommand) or command._umlFrame is not self._umlFrame:
+            return False
+        if command._finalPositions.keys() != self._finalPositions.keys():
+            return False
+        #
+        # Only consecutive moves;  Something else moved the shapes in between
+        #
+        for shapeId, umlPosition in command._initialPositions.items():
+            if self._finalPositions.get(shapeId) != umlPosition:
+                return False
+
+        self._finalPositions = FinalPositions(dict(command._finalPositions))
+
+        return True
+
+    def estimatedSize(self) -> int:
+        """
+        Returns:  The estimated bytes this command holds;  The shapes belong to the diagram
+        """
+        position:     UmlPosition = UmlPosition()
+        positionSize: int         = getsizeof(position) + getsizeof(vars(position))
+        size:         int         = getsizeof(self) + getsizeof(self._initialPositions) + getsizeof(self._finalPositions)
+
+        for shapeId in self._finalPositions.keys():
+            size += getsizeof(shapeId)
+
+        return size + (len(self._initialPositions) + len(self._finalPositions)) * positionSize
+
     def Undo(self) -> bool:
         """
         Restore shapes to their original positions.
@@ -78,15 +129,13 @@ class ShapesMovedCommand(Command):
         dc: ClientDC = ClientDC(self._umlFrame)
         self._umlFrame.PrepareDC(dc)
 
-        from umlshapes.frames.ShapeMoveInfo import ShapeMoveInfo
-        from umlshapes.ShapeTypes import UmlShapeGenre
-
         for shapeId, umlPosition in self._initialPositions.items():
-            shapeMoveInfo: ShapeMoveInfo = self._movedShapes[shapeId]
-            umlShape: UmlShapeGenre = shapeMoveInfo.umlShape
+            umlShape: Optional[UmlShapeGenre] = self._shapes.get(shapeId)
+            if umlShape is None:
+                continue
             umlShape.position = umlPosition
             umlShape.MoveLinks(dc)
-            
+
         self._umlFrame.refresh()
         return True
 
@@ -100,8 +149,9 @@ class ShapesMovedCommand(Command):
         self._umlFrame.PrepareDC(dc)
 
         for sid, finalPos in self._finalPositions.items():
-            info = self._movedShapes[sid]
-            umlShape: UmlShapeGenre = info.umlShape
+            umlShape: Optional[UmlShapeGenre] = self._shapes.get(sid)
+            if umlShape is None:
+                continue
 
             umlShape.position = finalPos
             umlShape.MoveLinks(dc)
@@ -0,0 +1,411 @@
+
+from typing import Any
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Set
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from sys import getsizeof
+
+from wx import ID_REDO
+from wx import ID_UNDO
+
+from wx import Command
+from wx import Menu
+
+DEFAULT_MAX_ENTRIES: int = 200
+DEFAULT_MAX_BYTES:   int = 16 * 1024 * 1024
+
+DEFAULT_UNDO_ACCELERATOR: str = '\tCtrl+Z'
+DEFAULT_REDO_ACCELERATOR: str = '\tCtrl+Y'
+
+#
+# How far estimateSize() follows references;  Deep enough for a model class with its
+# methods and their parameters, shallow enough not to wander off through the diagram
+#
+MAXIMUM_ESTIMATE_DEPTH: int = 6
+
+
+def estimateSize(obj: Any, depth: int = MAXIMUM_ESTIMATE_DEPTH, seen: Optional[Set[int]] = None) -> int:
+    """
+    An estimate of the memory an object holds;  Follows containers and instance
+    dictionaries `depth` levels down, counting each object once.  Commands use it
+    for the things they own, such as a model object;  Never hand it a shape or a frame
+
+    Args:
+        obj:    The object to measure
+        depth:  How many references to follow
+        seen:   The ids of the objects already counted
+
+    Returns:  The estimated size in bytes
+    """
+    if seen is None:
+        seen = set()
+
+    objId: int = id(obj)
+    if objId in seen:
+        return 0
+    seen.add(objId)
+
+    size: int = getsizeof(obj)
+    if depth == 0 or isinstance(obj, (str, bytes, int, float, bool)):
+        return size
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += estimateSize(key, depth - 1, seen) + estimateSize(value, depth - 1, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += estimateSize(item, depth - 1, seen)
+    elif hasattr(obj, '__dict__'):
+        size += estimateSize(vars(obj), depth - 1, seen)
+
+    return size
+
+
+def estimateCommandSize(command: Command) -> int:
+    """
+    Commands that know what they hold implement `estimatedSize()`;  For the others
+    count the command and its attribute dictionary
+
+    Args:
+        command:  A command in the history
+
+    Returns:  The estimated size in bytes
+    """
+    estimatedSize = getattr(command, 'estimatedSize', None)
+    if callable(estimatedSize) is True:
+        return estimatedSize()      # type: ignore
+
+    size: int = getsizeof(command)
+    if hasattr(command, '__dict__'):
+        size += getsizeof(vars(command))
+
+    return size
+
+
+@dataclass
+class HistoryEntry:
+    command:        Command
+    estimatedBytes: int
+
+
+HistoryEntries = NewType('HistoryEntries', List[HistoryEntry])
+
+
+@dataclass
+class HistoryFootprint:
+    """
+    How much the undo history holds
+    """
+    undoCount:      int = 0
+    redoCount:      int = 0
+    estimatedBytes: int = 0
+    maxEntries:     int = 0
+    maxBytes:       int = 0
+
+    @property
+    def entryCount(self) -> int:
+        return self.undoCount + self.redoCount
+
+
+class UndoHistory:
+    """
+    The command processor for a frame.  It implements the part of the `wx.CommandProcessor`
+    interface that the frames and applications use;  Submitting, undo and redo, the edit
+    menu, and dirty tracking.  It is not a `wx.CommandProcessor`;  That class owns and
+    deletes the commands it stores and cannot forget its oldest commands by size, so this
+    one keeps the only copy of the history.
+
+    When the history holds more than `maxEntries` commands or more than `maxBytes`
+    estimated bytes, the oldest commands are forgotten.  The newest command is always kept.
+
+    A submitted command may absorb into the previous one;  If the previous command has a
+    `coalesce(command)` method and it returns `True`, the submitted command is not
+    stored.  The shape move command uses this to turn consecutive moves of the same
+    selection into a single undo step.  Commands are never coalesced into a command
+    that has been undone or that was current when the frame was saved.
+    """
+    def __init__(self, maxEntries: int = DEFAULT_MAX_ENTRIES, maxBytes: int = DEFAULT_MAX_BYTES, coalesceMoves: bool = True):
+        """
+
+        Args:
+            maxEntries:     The most commands to remember
+            maxBytes:       The most estimated bytes to remember
+            coalesceMoves:  When `True`, commands may absorb the next one
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxEntries:    int  = maxEntries
+        self._maxBytes:      int  = maxBytes
+        self._coalesceMoves: bool = coalesceMoves
+
+        self._entries:        HistoryEntries = HistoryEntries([])
+        self._current:        int            = 0        # entries before this index are done;  The rest can be redone
+        self._savedIndex:     int            = 0        # the value of _current when the frame was saved;  -1 when forgotten
+        self._estimatedBytes: int            = 0
+
+        self._editMenu:        Optional[Menu] = None
+        self._undoAccelerator: str            = DEFAULT_UNDO_ACCELERATOR
+        self._redoAccelerator: str            = DEFAULT_REDO_ACCELERATOR
+
+    @property
+    def maxEntries(self) -> int:
+        return self._maxEntries
+
+    @maxEntries.setter
+    def maxEntries(self, newValue: int):
+        self._maxEntries = newValue
+        self._trim()
+
+    @property
+    def maxBytes(self) -> int:
+        return self._maxBytes
+
+    @maxBytes.setter
+    def maxBytes(self, newValue: int):
+        self._maxBytes = newValue
+        self._trim()
+
+    @property
+    def coalesceMoves(self) -> bool:
+        return self._coalesceMoves
+
+    @coalesceMoves.setter
+    def coalesceMoves(self, newValue: bool):
+        self._coalesceMoves = newValue
+
+    @property
+    def estimatedBytes(self) -> int:
+        """
+        Returns:  The estimated memory held by the commands in the history
+        """
+        return self._estimatedBytes
+
+    @property
+    def footprint(self) -> HistoryFootprint:
+        return HistoryFootprint(
+            undoCount=self._current,
+            redoCount=len(self._entries) - self._current,
+            estimatedBytes=self._estimatedBytes,
+            maxEntries=self._maxEntries,
+            maxBytes=self._maxBytes,
+        )
+
+    def Submit(self, command: Command, storeIt: bool = True) -> bool:
+        """
+        Run the command and remember it
+
+        Args:
+            command:    The command to run
+            storeIt:    When `False` the command is run and forgotten
+
+        Returns:  `False` if the command failed
+        """
+        if command.Do() is False:
+            self.logger.warning(f'{command.GetName()} failed')
+            return False
+        if storeIt is True:
+            self.Store(command)
+        self.SetMenuStrings()
+
+        return True
+
+    def Store(self, command: Command):
+        """
+        Remember a command without running it;  It may be absorbed by the current command
+
+        Args:
+            command:    A command that has been done
+        """
+        self._forgetRedoEntries()
+
+        if self._coalesce(command) is False:
+            self._entries.append(HistoryEntry(command=command, estimatedBytes=estimateCommandSize(command)))
+            self._estimatedBytes += self._entries[-1].estimatedBytes
+            self._current += 1
+            self._trim()
+
+    def Undo(self) -> bool:
+
+        if self.CanUndo() is False:
+            return False
+
+        command: Command = self._entries[self._current - 1].command
+        if command.Undo() is False:
+            return False
+        self._current -= 1
+        self.SetMenuStrings()
+
+        return True
+
+    def Redo(self) -> bool:
+
+        if self.CanRedo() is False:
+            return False
+
+        command: Command = self._entries[self._current].command
+        if command.Do() is False:
+            return False
+        self._current += 1
+        self.SetMenuStrings()
+
+        return True
+
+    def CanUndo(self) -> bool:
+        return self._current > 0 and self._entries[self._current - 1].command.CanUndo()
+
+    def CanRedo(self) -> bool:
+        return self._current < len(self._entries)
+
+    def GetCurrentCommand(self) -> Optional[Command]:
+        """
+        Returns:  The command that the next Undo() reverts
+        """
+        if self._current == 0:
+            return None
+        return self._entries[self._current - 1].command
+
+    def GetCommands(self) -> List[Command]:
+        return [entry.command for entry in self._entries]
+
+    def GetMaxCommands(self) -> int:
+        return self._maxEntries
+
+    def SetEditMenu(self, menu: Optional[Menu]):
+        """
+        Args:
+            menu:  The menu whose Undo and Redo items track this history;  `None` to detach it
+        """
+        self._editMenu = menu
+        self.SetMenuStrings()
+
+    def GetEditMenu(self) -> Optional[Menu]:
+        return self._editMenu
+
+    def SetUndoAccelerator(self, accelerator: str):
+        self._undoAccelerator = accelerator
+
+    def GetUndoAccelerator(self) -> str:
+        return self._undoAccelerator
+
+    def SetRedoAccelerator(self, accelerator: str):
+        self._redoAccelerator = accelerator
+
+    def GetRedoAccelerator(self) -> str:
+        return self._redoAccelerator
+
+    def GetUndoMenuLabel(self) -> str:
+        """
+        Returns:  The edit menu label that wx.CommandProcessor would show for Undo
+        """
+        command: Optional[Command] = self.GetCurrentCommand()
+        if command is None:
+            return f'&Undo{self.GetUndoAccelerator()}'
+        if command.CanUndo() is True:
+            return f'&Undo {self._commandName(command)}{self.GetUndoAccelerator()}'
+
+        return f"Can't &Undo {self._commandName(command)}{self.GetUndoAccelerator()}"
+
+    def GetRedoMenuLabel(self) -> str:
+        """
+        Returns:  The edit menu label that wx.CommandProcessor would show for Redo
+        """
+        if self.CanRedo() is False:
+            return f'&Redo{self.GetRedoAccelerator()}'
+
+        return f'&Redo {self._commandName(self._entries[self._current].command)}{self.GetRedoAccelerator()}'
+
+    def SetMenuStrings(self):
+
+        editMenu: Optional[Menu] = self.GetEditMenu()
+        if editMenu is None:
+            return
+
+        if editMenu.FindItemById(ID_UNDO) is not None:
+            editMenu.SetLabel(ID_UNDO, self.GetUndoMenuLabel())
+            editMenu.Enable(ID_UNDO, self.CanUndo())
+        if editMenu.FindItemById(ID_REDO) is not None:
+            editMenu.SetLabel(ID_REDO, self.GetRedoMenuLabel())
+            editMenu.Enable(ID_REDO, self.CanRedo())
+
+    def Initialize(self):
+        self.SetMenuStrings()
+
+    def ClearCommands(self):
+
+        savedWasCurrent: bool = self.IsDirty() is False
+
+        self._entries        = HistoryEntries([])
+        self._current        = 0
+        self._estimatedBytes = 0
+        self._savedIndex     = 0 if savedWasCurrent is True else -1
+
+        self.SetMenuStrings()
+
+    def MarkAsSaved(self):
+        self._savedIndex = self._current
+
+    def IsDirty(self) -> bool:
+        return self._current != self._savedIndex
+
+    def _commandName(self, command: Command) -> str:
+
+        name: str = command.GetName()
+        if name == '':
+            name = 'Unnamed command'
+
+        return name
+
+    def _coalesce(self, command: Command) -> bool:
+        """
+        Returns:  `True` if the current command absorbed the new one
+        """
+        if self._coalesceMoves is False or self._current == 0 or self._current == self._savedIndex:
+            return False
+
+        entry: HistoryEntry = self._entries[self._current - 1]
+        coalesce = getattr(entry.command, 'coalesce', None)
+        if callable(coalesce) is False or coalesce(command) is False:      # type: ignore
+            return False
+
+        newSize: int = estimateCommandSize(entry.command)
+        self._estimatedBytes += newSize - entry.estimatedBytes
+        entry.estimatedBytes = newSize
+
+        self.logger.debug(f'{entry.command.GetName()} absorbed {command.GetName()}')
+
+        return True
+
+    def _forgetRedoEntries(self):
+
+        for entry in self._entries[self._current:]:
+            self._estimatedBytes -= entry.estimatedBytes
+        del self._entries[self._current:]
+
+        if self._savedIndex > self._current:
+            self._savedIndex = -1
+
+    def _trim(self):
+        """
+        Forget the oldest commands until the history fits;  Keep at least the newest
+        one that can be undone.  Commands that can be redone are never forgotten here
+        """
+        while self._current > 1 and (len(self._entries) > self._maxEntries or self._estimatedBytes > self._maxBytes):
+            entry: HistoryEntry = self._entries.pop(0)
+            self._estimatedBytes -= entry.estimatedBytes
+            self._current       -= 1
+            self._savedIndex     = self._savedIndex - 1 if self._savedIndex > 0 else -1
+
+            self.logger.debug(f'Forgot {entry.command.GetName()}')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        return f'UndoHistory - entries: {len(self)} estimatedBytes: {self._estimatedBytes}'
@@ -238,6 +238,8 @@ class DlgEditClass(DlgEditClassCommon):
         self._modelClass.fields      = self._modeInterfaceCopy.fields
         self._modelClass.description = self._modeInterfaceCopy.description
 
+        self._invalidateRenderCaches(self._modelClass)
+
         prefs: UmlPreferences = UmlPreferences()
 
         if prefs.autoResizeShapesOnEdit:
@@ -277,6 +279,20 @@ class DlgEditClass(DlgEditClassCommon):
 
         return umlClasses.pop(0)
 
+    def _invalidateRenderCaches(self, modelClass: Class):
+        """
+        The UML classes that display the model class must not blit what they looked like
+        before the edit
+
+        Args:
+            modelClass:  Model class
+        """
+        from umlshapes.shapes.UmlClass import UmlClass
+
+        for umlShape in self._getUmlShapes():
+            if isinstance(umlShape, UmlClass) and umlShape.modelClass is modelClass:
+                umlShape.invalidateRenderCache()
+
     def _getUmlShapes(self) -> UmlShapes:
         """
         The frame may contain no UML shapes.
@@ -2,6 +2,7 @@
 from typing import cast
 from typing import NewType
 from typing import Optional
+from typing import Tuple
 from typing import TYPE_CHECKING
 
 from logging import Logger
@@ -12,6 +13,7 @@ from enum import Enum
 from wx import VERTICAL
 from wx import HORIZONTAL
 from wx import SUNKEN_BORDER
+from wx import TRANSPARENT_PEN
 from wx import PenStyle
 
 from wx import Point
@@ -22,10 +24,12 @@ from wx import ClientDC
 from wx import Colour
 from wx import DC
 from wx import MemoryDC
+from wx import NullBitmap
 from wx import PaintDC
 from wx import PaintEvent
 from wx import Pen
 from wx import PenInfo
+from wx import Rect
 from wx import SystemAppearance
 from wx import SystemSettings
 
@@ -36,17 +40,21 @@ from umlshapes.lib.ogl import ShapeCanvas
 from umlshapes.utils.IDUtil import IDUtil
 
 from umlshapes.frames.ShapeSelector import ShapeSelector
+from umlshapes.frames.SelectionModel import SelectionModel
 
 from umlshapes.types.UmlColor import UmlColor
 from umlshapes.types.UmlPenStyle import UmlPenStyle
 
 from umlshapes.preferences.UmlPreferences import UmlPreferences
+from umlshapes.preferences.PreferencesSnapshot import PreferencesSnapshot
 
 if TYPE_CHECKING:
     from umlshapes.UmlDiagram import UmlDiagram
 
 FrameId = NewType('FrameId', str)
 
+GridTileKey = Tuple
+
 
 class WheelAxis(Enum):
     WHEEL_AXIS_VERTICAL   = 0
@@ -103,7 +111,10 @@ class DiagramFrame(ShapeCanvas):
         # The ShapeCanvas ID is an integer;  use our own
         self._id: FrameId = FrameId(IDUtil.getID())
 
-        self._selector: Optional[ShapeSelector] = None
+        self._selector:       Optional[ShapeSelector] = None
+        self._gridBrush:      Optional[Brush]         = None
+        self._gridTileKey:    Optional[GridTileKey]   = None
+        self._selectionModel: SelectionModel          = SelectionModel()
 
     @property
     def umlDiagram(self) -> 'UmlDiagram':
@@ -122,20 +133,67 @@ class DiagramFrame(ShapeCanvas):
         """
         return self._id
 
+    @property
+    def selectionModel(self) -> SelectionModel:
+        """
+        Kept up to date as shapes are selected, deselected, and removed
+        """
+        return self._selectionModel
+
+    @property
+    def visibleRectangle(self) -> Rect:
+        """
+        Returns:  The part of the virtual area shown in the client area, in logical coordinates
+        """
+        w, h = self.GetSize()
+        x, y = self.CalcUnscrolledPosition(0, 0)
+
+        return Rect(x, y, w, h)
+
     def refresh(self):
         w, h = self.GetSize()
         x, y = self.CalcUnscrolledPosition(0, 0)
 
+        self.ClearDamage()      # We repaint everything
         dc: DC = self._createDC(w, h)
 
-        self.Redraw(dc)
-        client: ClientDC = ClientDC(self)
-
-        if self._umlPreferences.backGroundGridEnabled is True:
+        if self._umlPreferences.snapshot.backGroundGridEnabled is True:
             self._drawGrid(memDC=dc, width=w, height=h, startX=x, startY=y)
 
+        self.Redraw(dc, self.visibleRectangle)
+        client: ClientDC = ClientDC(self)
+
         client.Blit(0, 0, w, h, dc, x, y)
 
+    def Draw(self):
+        """
+        Override the parent method which repaints an off-screen buffer the size of the
+        virtual area at the end of every mouse event.  Instead, ask the window to
+        repaint only the area the shapes reported as damaged.  Mouse events that
+        damage nothing cost nothing.
+        """
+        if self.IsFullyDamaged() is True:
+            self.ClearDamage()
+            self.Refresh(eraseBackground=False)
+        else:
+            damagedRect: Optional[Rect] = self.GetDamagedRect()
+            if damagedRect is not None:
+                self.ClearDamage()
+                x, y = self.CalcScrolledPosition(damagedRect.x, damagedRect.y)
+                self.RefreshRect(Rect(x, y, damagedRect.width, damagedRect.height), eraseBackground=False)
+
+    def OnShapeSelectionChanged(self, shape):
+        """
+        Override the parent method to maintain the selection model
+
+        Args:
+            shape:  The shape that was selected or deselected
+        """
+        if shape.Selected() is True:
+            self._selectionModel.add(shape)
+        else:
+            self._selectionModel.discard(shape)
+
     def RedrawWithBackground(self):
         """
         Redraw the screen using the background.
@@ -178,6 +236,8 @@ class DiagramFrame(ShapeCanvas):
 
         I copied this from the legacy Mini OGL package
 
+        Only the shapes that intersect the invalidated area are redrawn
+
         Args:
             event:
         """
@@ -189,11 +249,18 @@ class DiagramFrame(ShapeCanvas):
 
         x, y = self.CalcUnscrolledPosition(0, 0)
 
-        if self._umlPreferences.backGroundGridEnabled is True:
+        updateBox: Rect = self.GetUpdateRegion().GetBox()
+        if updateBox.IsEmpty() is True:
+            updateBox = Rect(0, 0, w, h)
+        damagedRect: Rect = Rect(updateBox.x + x, updateBox.y + y, updateBox.width, updateBox.height)
+
+        mem.SetClippingRegion(damagedRect)
+        if self._umlPreferences.snapshot.backGroundGridEnabled is True:
             self._drawGrid(memDC=mem, width=w, height=h, startX=x, startY=y)
-        self.Redraw(mem)
+        self.Redraw(mem, damagedRect)
+        mem.DestroyClippingRegion()
 
-        dc.Blit(0, 0, w, h, mem, x, y)
+        dc.Blit(updateBox.x, updateBox.y, updateBox.width, updateBox.height, mem, damagedRect.x, damagedRect.y)
 
     def OnMouseEvent(self, mouseEvent: MouseEvent):
         """
@@ -225,45 +292,71 @@ class DiagramFrame(ShapeCanvas):
         super().OnMouseEvent(evt=mouseEvent)
 
     def _drawGrid(self, memDC: DC, width: int, height: int, startX: int, startY: int):
+        """
+        Fill the area with the cached grid tile.  The cost does not depend on how many
+        grid lines are visible.  The tile is opaque;  Draw the grid before the shapes
 
-        # self.clsLogger.info(f'{width=} {height=} {startX=} {startY=}')
-        savePen = memDC.GetPen()
+        Args:
+            memDC:  The device context
+            width:  Area width
+            height: Area height
+            startX: Logical x of the area's left side
+            startY: Logical y of the area's top
+        """
+        saveBrush: Brush = memDC.GetBrush()
+        savePen:   Pen   = memDC.GetPen()
 
-        newPen: Pen = self._getGridPen()
-        memDC.SetPen(newPen)
+        memDC.SetBrush(self._getGridBrush())
+        memDC.SetPen(TRANSPARENT_PEN)
+        memDC.DrawRectangle(startX, startY, width, height)
 
-        self._drawHorizontalLines(memDC=memDC, width=width, height=height, startX=startX, startY=startY)
-        self._drawVerticalLines(memDC=memDC,   width=width, height=height, startX=startX, startY=startY)
+        memDC.SetBrush(saveBrush)
         memDC.SetPen(savePen)
 
-    def _drawHorizontalLines(self, memDC: DC, width: int, height: int, startX: int, startY: int):
-
-        x1:   int = 0
-        x2:   int = startX + width
-        stop: int = height + startY
-        step: int = self._umlPreferences.backgroundGridInterval
-        for movingY in range(startY, stop, step):
-            memDC.DrawLine(x1, movingY, x2, movingY)
-
-    def _drawVerticalLines(self, memDC: DC, width: int, height: int, startX: int, startY: int):
-
-        y1:   int = 0
-        y2:   int = startY + height
-        stop: int = width + startX
-        step: int = self._umlPreferences.backgroundGridInterval
+    def _getGridBrush(self) -> Brush:
+        """
+        One grid cell, the background plus a horizontal and a vertical grid line,
+        rendered once and tiled as a stipple brush.  The tile is redone only when its
+        look changes
 
-        for movingX in range(startX, stop, step):
-            memDC.DrawLine(movingX, y1, movingX, y2)
+        Returns:  The grid brush
+        """
+        snapshot: PreferencesSnapshot = self._umlPreferences.snapshot
+        gridTileKey: GridTileKey = (
+            snapshot.backgroundGridInterval,
+            snapshot.gridLineColor,
+            snapshot.darkModeGridLineColor,
+            snapshot.gridLineStyle,
+            self._darkMode,
+            self.GetBackgroundColour().GetRGB(),
+        )
+        if self._gridBrush is None or gridTileKey != self._gridTileKey:
+            interval: int = max(snapshot.backgroundGridInterval, 1)
+
+            tile:   Bitmap   = Bitmap(interval, interval)
+            tileDC: MemoryDC = MemoryDC(tile)
+            tileDC.SetBackground(Brush(self.GetBackgroundColour()))
+            tileDC.Clear()
+            tileDC.SetPen(self._getGridPen())
+            tileDC.DrawLine(0, 0, interval, 0)
+            tileDC.DrawLine(0, 0, 0, interval)
+            tileDC.SelectObject(NullBitmap)
+
+            self._gridBrush   = Brush(tile)
+            self._gridTileKey = gridTileKey
+            self._dfLogger.debug(f'New grid tile {gridTileKey=}')
+
+        return self._gridBrush
 
     def _getGridPen(self) -> Pen:
 
         # noinspection PySimplifyBooleanCheck
         if self._darkMode is True:
-            gridLineColor: Colour = UmlColor.toWxColor(self._umlPreferences.darkModeGridLineColor)
+            gridLineColor: Colour = UmlColor.toWxColor(self._umlPreferences.snapshot.darkModeGridLineColor)
         else:
-            gridLineColor = UmlColor.toWxColor(self._umlPreferences.gridLineColor)
+            gridLineColor = UmlColor.toWxColor(self._umlPreferences.snapshot.gridLineColor)
 
-        gridLineStyle: PenStyle = UmlPenStyle.toWxPenStyle(self._umlPreferences.gridLineStyle)
+        gridLineStyle: PenStyle = UmlPenStyle.toWxPenStyle(self._umlPreferences.snapshot.gridLineStyle)
 
         pen:           Pen    = Pen(PenInfo(gridLineColor).Style(gridLineStyle).Width(1))
 
@@ -0,0 +1,138 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import TYPE_CHECKING
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from wx import ClientDC
+
+from umlshapes.lib.ogl import LineShape
+
+from umlshapes.types.DeltaXY import DeltaXY
+from umlshapes.types.UmlPosition import UmlPosition
+
+from umlshapes.frames.ShapeMoveInfo import ShapeId
+from umlshapes.frames.ShapeMoveInfo import InitialPositions
+
+if TYPE_CHECKING:
+    from umlshapes.frames.UmlFrame import UmlFrame
+    from umlshapes.ShapeTypes import UmlShapes
+    from umlshapes.ShapeTypes import UmlShapeGenre
+
+AffectedLinks = NewType('AffectedLinks', List[LineShape])
+
+
+class DragSession:
+    """
+    Moves all the selected shapes while the user drags one of them (the move master).
+
+    The selection, the initial positions, and the links to recompute are captured
+    once when the drag starts.  Each mouse tick then moves the other selected shapes
+    by the delta in a single pass and recomputes each affected link exactly once.
+    The shapes damage the canvas as they move; the canvas repaints the damaged area
+    once at the end of the mouse event.
+
+    Links attached to the move master are not in the affected links;  The master
+    recomputes them when it moves itself, after the other shapes are in place.
+    """
+    def __init__(self, umlFrame: 'UmlFrame', moveMaster: 'UmlShapeGenre'):
+        """
+
+        Args:
+            umlFrame:   The frame we are dragging on
+            moveMaster: The shape the user is dragging
+        """
+        from umlshapes.links.UmlLink import UmlLink
+        from umlshapes.links.UmlLinkLabel import UmlLinkLabel
+
+        from umlshapes.ShapeTypes import UmlShapes
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._umlFrame:   'UmlFrame'      = umlFrame
+        self._moveMaster: 'UmlShapeGenre' = moveMaster
+
+        self._followers:        UmlShapes        = UmlShapes([])
+        self._initialPositions: InitialPositions = InitialPositions({})
+
+        for s in umlFrame.selectedShapes:
+            if isinstance(s, (UmlLink, UmlLinkLabel)) or s is moveMaster:
+                continue
+            self._followers.append(s)
+            self._initialPositions[ShapeId(s.id)] = s.position
+        #
+        # Save the master shape position, in case he is not selected
+        #
+        self._initialPositions[ShapeId(moveMaster.id)] = moveMaster.position
+
+        self._affectedLinks: AffectedLinks = self._collectAffectedLinks()
+
+        for s in self._followers:
+            umlFrame.markShapeAsMoved(umlShape=cast('UmlShapeGenre', s))
+        umlFrame.markShapeAsMoved(umlShape=moveMaster)
+
+        self.logger.debug(f'{len(self._followers)=} {len(self._affectedLinks)=}')
+
+    @property
+    def moveMaster(self) -> 'UmlShapeGenre':
+        return self._moveMaster
+
+    @property
+    def followers(self) -> 'UmlShapes':
+        """
+        Returns:  The selected shapes that move along with the move master
+        """
+        return self._followers
+
+    @property
+    def initialPositions(self) -> InitialPositions:
+        """
+        Returns:  The positions of the moving shapes when the drag started
+        """
+        return self._initialPositions
+
+    @property
+    def affectedLinks(self) -> AffectedLinks:
+        return self._affectedLinks
+
+    def moveBy(self, deltaXY: DeltaXY):
+        """
+        Move the followers and recompute the links attached to them
+
+        Args:
+            deltaXY:  The difference between the current position and the new position
+        """
+        for s in self._followers:
+            umlShape: 'UmlShapeGenre' = cast('UmlShapeGenre', s)
+            position: UmlPosition     = umlShape.position
+            umlShape.position = UmlPosition(
+                x=position.x + deltaXY.deltaX,
+                y=position.y + deltaXY.deltaY
+            )
+
+        if len(self._affectedLinks) > 0:
+            dc: ClientDC = ClientDC(self._umlFrame)
+            self._umlFrame.PrepareDC(dc)
+            for link in self._affectedLinks:
+                link.GetEventHandler().OnMoveLink(dc)
+
+    def _collectAffectedLinks(self) -> AffectedLinks:
+        """
+        A link between two followers is in here only once
+
+        Returns:  The links attached to the followers but not to the move master
+        """
+        masterLinks: Dict[int, LineShape] = {id(line): line for line in self._moveMaster.GetLines()}
+
+        affectedLinks: Dict[int, LineShape] = {}
+        for umlShape in self._followers:
+            for line in umlShape.GetLines():
+                lineId: int = id(line)
+                if lineId not in masterLinks:
+                    affectedLinks[lineId] = line
+
+        return AffectedLinks(list(affectedLinks.values()))
@@ -0,0 +1,96 @@
+
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from wx import DC
+from wx import Rect
+
+from umlshapes.lib.ogl import ControlPoint
+
+SelectionHandles = NewType('SelectionHandles', Dict[int, ControlPoint])
+
+HandleHit = Tuple[Optional[ControlPoint], int]
+
+
+class SelectionHandleOverlay:
+    """
+    The resize and bend handles of the selected shapes.  They are drawn over the
+    diagram and hit tested before it, but are never part of the diagram shape list;
+    The diagram only holds shapes that are there whether or not they are selected.
+
+    Handles are keyed by their Python id, in the order they were added;  Later handles
+    are on top.  The frame only creates the overlay when something is first selected.
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._handles: SelectionHandles = SelectionHandles({})
+
+    @property
+    def handles(self) -> List[ControlPoint]:
+        """
+        Returns:  A copy of the handles, bottommost first
+        """
+        return list(self._handles.values())
+
+    def add(self, handle: ControlPoint):
+        self._handles[id(handle)] = handle
+
+    def remove(self, handle: ControlPoint):
+        self._handles.pop(id(handle), None)
+
+    def clear(self):
+        self._handles = SelectionHandles({})
+
+    def findHandle(self, x: float, y: float, info=None, notObject=None) -> HandleHit:
+        """
+        Same contract as the canvas FindShape, but only for the handles
+
+        Args:
+            x:          Logical x
+            y:          Logical y
+            info:       If set, only handles of this class
+            notObject:  If set, ignore the handles that belong to this shape
+
+        Returns:  The topmost handle at the position and the attachment hit;  (None, 0) for none
+        """
+        for handle in reversed(self._handles.values()):
+            if handle.IsShown() is False:
+                continue
+            if info is not None and not isinstance(handle, info):
+                continue
+            if notObject is not None and notObject.HasDescendant(handle):
+                continue
+            hit = handle.HitTest(x, y)
+            if hit:
+                attachment, _ = hit
+                return handle, attachment
+
+        return None, 0
+
+    def draw(self, dc: DC, rect: Optional[Rect] = None):
+        """
+        Draw the handles over whatever the diagram already drew
+
+        Args:
+            dc:     The device context
+            rect:   The visible or damaged area in logical coordinates;  `None` for all the handles
+        """
+        for handle in self._handles.values():
+            # A handle's own position is only updated when it draws;  Its owner's is current
+            # noinspection PyProtectedMember
+            if rect is None or handle._shape.GetDamageRectangle().Intersects(rect):
+                handle.Draw(dc)
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __str__(self) -> str:
+        return f'SelectionHandleOverlay - handles: {len(self._handles)}'
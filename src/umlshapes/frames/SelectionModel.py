@@ -0,0 +1,108 @@
+
+from typing import Callable
+from typing import Dict
+from typing import Generator
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from umlshapes.lib.ogl import Shape
+
+SelectionListener  = Callable[[], None]
+SelectionListeners = NewType('SelectionListeners', List[SelectionListener])
+
+SelectedShapes = NewType('SelectedShapes', Dict[int, Shape])
+
+
+class SelectionModel:
+    """
+    The shapes selected on a frame.  The frame updates it as shapes are selected
+    and deselected, so asking for the selection costs the size of the selection
+    and not the size of the diagram.
+
+    Shapes are keyed by their Python id because some UML shapes define __eq__ and __hash__
+    on their data model
+
+    Listeners are told that the selection changed;  Inside a `batch()` they are told
+    once, when the outermost batch ends
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._selectedShapes: SelectedShapes     = SelectedShapes({})
+        self._listeners:      SelectionListeners = SelectionListeners([])
+
+        self._batchDepth: int  = 0
+        self._changed:    bool = False
+
+    @property
+    def shapes(self) -> List[Shape]:
+        """
+        Returns:  A copy of the selected shapes in the order they were selected
+        """
+        return list(self._selectedShapes.values())
+
+    def add(self, shape: Shape):
+
+        shapeId: int = id(shape)
+        if shapeId not in self._selectedShapes:
+            self._selectedShapes[shapeId] = shape
+            self._selectionChanged()
+
+    def discard(self, shape: Shape):
+
+        if self._selectedShapes.pop(id(shape), None) is not None:
+            self._selectionChanged()
+
+    def clear(self):
+        """
+        Forgets the selection;  Does not deselect the shapes
+        """
+        if len(self._selectedShapes) > 0:
+            self._selectedShapes = SelectedShapes({})
+            self._selectionChanged()
+
+    def subscribe(self, listener: SelectionListener):
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: SelectionListener):
+        self._listeners.remove(listener)
+
+    @contextmanager
+    def batch(self) -> Generator['SelectionModel', None, None]:
+        """
+        Group many selection changes into a single notification
+        """
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+            if self._batchDepth == 0 and self._changed is True:
+                self._notify()
+
+    def _selectionChanged(self):
+
+        self._changed = True
+        if self._batchDepth == 0:
+            self._notify()
+
+    def _notify(self):
+
+        self._changed = False
+        for listener in list(self._listeners):
+            listener()
+
+    def __contains__(self, shape: Shape) -> bool:
+        return id(shape) in self._selectedShapes
+
+    def __len__(self) -> int:
+        return len(self._selectedShapes)
+
+    def __str__(self) -> str:
+        return f'SelectionModel - selected: {len(self)} listeners: {len(self._listeners)}'
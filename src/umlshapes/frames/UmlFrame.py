@@ -1,6 +1,8 @@
 
 from typing import cast
 from typing import Callable
+from typing import Generator
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from logging import Logger
@@ -10,6 +12,10 @@ from sys import maxsize
 
 from collections.abc import Iterable
 
+from contextlib import contextmanager
+
+from pathlib import Path
+
 from dataclasses import dataclass
 
 from deprecated import deprecated
@@ -23,36 +29,43 @@ from wx import WXK_DELETE
 from wx import WXK_DOWN
 
 from wx import ClientDC
+from wx import Rect
 from wx import MouseEvent
 from wx import KeyEvent
 from wx import Window
-from wx import CommandProcessor
 
+from umlshapes.lib.ogl import ControlPoint
 from umlshapes.lib.ogl import Shape
 from umlshapes.lib.ogl import ShapeCanvas
 
 from umlshapes.frames.ShapeSelector import ShapeSelector
+from umlshapes.frames.SelectionHandleOverlay import SelectionHandleOverlay
 from umlshapes.frames.DiagramFrame import DiagramFrame
 from umlshapes.frames.UmlFrameOperationsListener import UmlFrameOperationsListener
 
+from umlshapes.commands.UndoHistory import UndoHistory
+
+from umlshapes.rendering.HeadlessRenderer import HeadlessRenderer
+from umlshapes.rendering.TiledPngExporter import DEFAULT_EXPORT_TILE_SIZE
+from umlshapes.rendering.TiledPngExporter import TiledPngExporter
+
 from umlshapes.pubsubengine.IUmlPubSubEngine import IUmlPubSubEngine
 from umlshapes.pubsubengine.UmlMessageType import UmlMessageType
 
-from umlshapes.utils.CoordinateUtils import CoordinateUtils
+from umlshapes.utils.ModelSnapshot import ModelSnapshot
 
 from umlshapes.UmlDiagram import UmlDiagram
 
 from umlshapes.preferences.UmlPreferences import UmlPreferences
 
 from umlshapes.types.DeltaXY import DeltaXY
-from umlshapes.types.UmlLine import UmlLine
-from umlshapes.types.UmlPosition import UmlPoint
 from umlshapes.types.UmlPosition import UmlPosition
 from umlshapes.types.UmlDimensions import UmlDimensions
 
 if TYPE_CHECKING:
     from umlshapes.frames.ShapeMoveInfo import ShapeId
     from umlshapes.frames.ShapeMoveInfo import MovedShapes
+    from umlshapes.frames.DragSession import DragSession
 
     from umlshapes.ShapeTypes import UmlShapes
     from umlshapes.ShapeTypes import UmlShapeGenre
@@ -94,12 +107,18 @@ class UmlFrame(DiagramFrame):
         self._preferences:     UmlPreferences   = UmlPreferences()
         self._umlPubSubEngine: IUmlPubSubEngine = umlPubSubEngine
 
+        self._selectionHandles: Optional[SelectionHandleOverlay] = None
+
         super().__init__(parent=parent)
 
         # Doing this so key up/down Z Order code works
         self.DisableKeyboardScrolling()
 
-        self._commandProcessor: CommandProcessor = CommandProcessor()
+        self._commandProcessor: UndoHistory = UndoHistory(
+            maxEntries=self._preferences.undoHistoryMaxEntries,
+            maxBytes=self._preferences.undoHistoryMaxBytes,
+            coalesceMoves=self._preferences.coalesceShapeMoves
+        )
         self._setupFrameScrollbars()
 
         self.setInfinite(True)
@@ -107,6 +126,11 @@ class UmlFrame(DiagramFrame):
         self._frameModified:         bool = False
         self._shapesMoving:          bool = False
         self._movedShapes:           MovedShapes = MovedShapes({})
+        self._dragSession:           Optional['DragSession'] = None
+
+        self._batchDepth:            int  = 0
+        self._refreshPending:        bool = False
+        self._frameModifiedPending:  bool = False
 
         # TODO this needs to move to each type of frame
         self._umlFrameOperationsListener: UmlFrameOperationsListener = UmlFrameOperationsListener(
@@ -123,19 +147,153 @@ class UmlFrame(DiagramFrame):
     def shapesMoving(self) -> bool:
         return self._shapesMoving
 
+    @property
+    def dragSession(self) -> Optional['DragSession']:
+        """
+        Returns:  The drag in progress;  `None` if the user is not dragging shapes
+        """
+        return self._dragSession
+
     @property
     def frameModified(self) -> bool:
         return self._frameModified
 
     @frameModified.setter
     def frameModified(self, newValue: bool):
-        self._umlPubSubEngine.sendMessage(UmlMessageType.FRAME_MODIFIED, frameId=self.id, modifiedFrameId=self.id)
+        if self._batchDepth > 0:
+            self._frameModifiedPending = True
+        else:
+            self._umlPubSubEngine.sendMessage(UmlMessageType.FRAME_MODIFIED, frameId=self.id, modifiedFrameId=self.id)
         self._frameModified = newValue
 
     @property
-    def commandProcessor(self) -> CommandProcessor:
+    def inBatchUpdate(self) -> bool:
+        return self._batchDepth > 0
+
+    @contextmanager
+    def batchUpdate(self) -> Generator['UmlFrame', None, None]:
+        """
+        Suspend repaints, frame modified messages, control point resets and selection
+        notifications while many shapes change.  They happen once, when the outermost
+        batch ends.  Batches nest.
+
+        Usage:
+            with umlFrame.batchUpdate():
+                ...
+        """
+        self._batchDepth += 1
+        self.SuspendControlPointResets()
+        try:
+            with self._selectionModel.batch():
+                yield self
+        finally:
+            self.ResumeControlPointResets()
+            self._batchDepth -= 1
+            if self._batchDepth == 0:
+                self._endBatchUpdate()
+
+    def addShapes(self, umlShapes: Iterable):
+        """
+        Add many shapes with a single repaint.  Place the shapes and set up their event
+        handlers beforehand
+
+        Args:
+            umlShapes:  The UML shapes to add
+        """
+        diagram: UmlDiagram = self.umlDiagram
+        with self.batchUpdate():
+            for umlShape in umlShapes:
+                diagram.AddShape(umlShape)
+                umlShape.Show(True)
+            self.frameModified = True
+            self.refresh()
+
+    def refresh(self):
+        """
+        Inside a batch update the repaint waits for the end of the batch
+        """
+        if self._batchDepth > 0:
+            self._refreshPending = True
+        else:
+            super().refresh()
+
+    @property
+    def selectionHandles(self) -> SelectionHandleOverlay:
+        """
+        Created the first time a shape shows its handles
+
+        Returns:  The handles of the selected shapes
+        """
+        if self._selectionHandles is None:
+            self._selectionHandles = SelectionHandleOverlay()
+        return self._selectionHandles
+
+    def AddShape(self, shape: Shape, addAfter: Optional[Shape] = None):
+        """
+        Override the parent method so that handles go to the overlay and not to the diagram
+        """
+        if isinstance(shape, ControlPoint):
+            self.selectionHandles.add(shape)
+        else:
+            super().AddShape(shape, addAfter)
+
+    def InsertShape(self, shape: Shape):
+        """
+        Override the parent method so that handles go to the overlay and not to the diagram
+        """
+        if isinstance(shape, ControlPoint):
+            self.selectionHandles.add(shape)
+        else:
+            super().InsertShape(shape)
+
+    def RemoveShape(self, shape: Shape):
+        """
+        Override the parent method;  Handles are removed from the overlay
+        """
+        if isinstance(shape, ControlPoint):
+            if self._selectionHandles is not None:
+                self._selectionHandles.remove(shape)
+        else:
+            super().RemoveShape(shape)
+
+    def Redraw(self, dc: DC, rect: Optional[Rect] = None):
+        """
+        Override the parent method to draw the selection handles over the diagram
+
+        Args:
+            dc:     The device context
+            rect:   The visible or damaged area in logical coordinates
+        """
+        super().Redraw(dc, rect)
+        if self._selectionHandles is not None and dc is not None:
+            self._selectionHandles.draw(dc=dc, rect=rect)
+
+    def FindShape(self, x, y, info=None, notObject=None):
+        """
+        Override the parent method;  Handles are on top of every shape, so they are looked at first
+        """
+        if self._selectionHandles is not None:
+            handle, attachment = self._selectionHandles.findHandle(x, y, info=info, notObject=notObject)
+            if handle is not None:
+                return handle, attachment
+
+        return super().FindShape(x, y, info, notObject)
+
+    @property
+    def commandProcessor(self) -> UndoHistory:
         return self._commandProcessor
 
+    @property
+    def clipboard(self) -> ModelSnapshot:
+        """
+        Returns:  What paste puts on this frame;  Assign another frame's clipboard to paste across frames
+        """
+        return self._umlFrameOperationsListener.clipboard
+
+    @clipboard.setter
+    def clipboard(self, snapshot: ModelSnapshot):
+        self._umlFrameOperationsListener.clipboard = snapshot
+
     @property
     def umlPubSubEngine(self) -> IUmlPubSubEngine:
         return self._umlPubSubEngine
@@ -149,13 +307,11 @@ class UmlFrame(DiagramFrame):
     @property
     def selectedShapes(self) -> 'UmlShapes':
         from umlshapes.ShapeTypes import UmlShapes
+        from umlshapes.ShapeTypes import UmlShapeGenre
+        from umlshapes.ShapeTypes import UmlLinkGenre
 
-        selectedShapes: UmlShapes = UmlShapes([])
-        umlshapes:      UmlShapes = self.umlShapes
-
-        for shape in umlshapes:
-            if shape.Selected() is True:
-                selectedShapes.append(shape)
+        selectedShapes: UmlShapes = UmlShapes([cast(UmlShapeGenre | UmlLinkGenre, shape) for shape in self._selectionModel.shapes])
+        self.umlDiagram.sortByZOrder(selectedShapes)     # type: ignore
 
         return selectedShapes
 
@@ -211,16 +367,12 @@ class UmlFrame(DiagramFrame):
             y:
             keys:
         """
-        diagram: UmlDiagram = self.umlDiagram
-        shapes:  Iterable = diagram.GetShapeList()
-
-        for shape in shapes:
-            umlShape: Shape     = cast(Shape, shape)
-            canvas: ShapeCanvas = umlShape.GetCanvas()
-            dc:     ClientDC    = ClientDC(canvas)
-            canvas.PrepareDC(dc)
+        dc: ClientDC = ClientDC(self)
+        self.PrepareDC(dc)
 
-            umlShape.Select(select=False, dc=dc)
+        with self._selectionModel.batch():
+            for shape in self._selectionModel.shapes:
+                shape.Select(select=False, dc=dc)
 
         self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.FRAME_LEFT_CLICK,
                                           frameId=self.id,
@@ -239,11 +391,11 @@ class UmlFrame(DiagramFrame):
         """
         super().OnMouseEvent(mouseEvent)
 
-        if self._preferences.trackMouse is True:
+        if self._preferences.snapshot.trackMouse is True:
             if self._currentReportInterval == 0:
                 x, y = self.CalcUnscrolledPosition(mouseEvent.GetPosition())
                 self.ufLogger.info(f'({x},{y})')
-                self._currentReportInterval = self._preferences.trackMouseInterval
+                self._currentReportInterval = self._preferences.snapshot.trackMouseInterval
             else:
                 self._currentReportInterval -= 1
 
@@ -255,31 +407,26 @@ class UmlFrame(DiagramFrame):
 
     def OnEndDragLeft(self, x, y, keys=0):
 
-        from umlshapes.links.UmlLink import UmlLink
-        from umlshapes.sd.UmlSDMessage import UmlSDMessage
-
         self.Unbind(EVT_MOTION, handler=self._onSelectorMove)
         self.umlDiagram.RemoveShape(self._selector)
 
-        for s in self.umlDiagram.shapes:
-            if self._ignoreShape(shapeToCheck=s) is False:      # noqa
-                if isinstance(s, UmlLink) or isinstance(s, UmlSDMessage):
-                    umlLink: UmlLink | UmlSDMessage = s
-                    x1, y1, x2, y2 = umlLink.GetEnds()
-                    umlLine: UmlLine = UmlLine(start=UmlPoint(x=x1, y=y1), end=UmlPoint(x=x2, y=y2))
-                    if CoordinateUtils.isLineWhollyContainedByRectangle(boundingRectangle=self._selector.rectangle, umlLine=umlLine):   # type: ignore
-                        umlLink.selected = True
-                else:
-                    from umlshapes.ShapeTypes import UmlShapeGenre
-                    shape: UmlShapeGenre = cast(UmlShapeGenre, s)
-                    if CoordinateUtils.isShapeInRectangle(boundingRectangle=self._selector.rectangle, shapeRectangle=shape.rectangle):  # type: ignore
-                        shape.selected = True
+        with self._selectionModel.batch():
+            self._selectShapesInSelector()
 
         self.refresh()
         self._selector = cast(ShapeSelector, None)  # noqa
 
         return True
 
+    def _selectShapesInSelector(self):
+
+        if self._selector is None:
+            return
+
+        for s in self.umlDiagram.shapesInRectangle(self._selector.rectangle):
+            if self._ignoreShape(shapeToCheck=s) is False:      # noqa
+                s.selected = True       # type: ignore
+
     def markFrameSaved(self):
         """
         Clears the commands an ensures that CommandProcess.isDirty() is rationale
@@ -287,6 +434,31 @@ class UmlFrame(DiagramFrame):
         self.commandProcessor.MarkAsSaved()
         self.commandProcessor.ClearCommands()
 
+    def exportAsPng(self, path: Path, scale: float = 1.0, tileSize: int = DEFAULT_EXPORT_TILE_SIZE, workers: int = 0):
+        """
+        Export the area inside the shape boundaries as one PNG.  The image is rendered
+        in tiles and streamed to the file band by band, so the size of the diagram does
+        not change how much memory the export needs
+
+        Args:
+            path:       The file to write
+            scale:      1.0 draws at the diagram size
+            tileSize:   The tile size in pixels
+            workers:    The number of bands compressed at the same time;  0 for one per processor
+        """
+        ltrb: Ltrb        = self.shapeBoundaries
+        area: Rect | None = None       # No UML shapes;  Export whatever is there
+        if ltrb.right >= ltrb.left:
+            area = Rect(ltrb.left, ltrb.top, ltrb.right - ltrb.left + 1, ltrb.bottom - ltrb.top + 1)
+
+        exporter: TiledPngExporter = TiledPngExporter(
+            renderer=HeadlessRenderer.fromDiagram(umlDiagram=self.umlDiagram, backgroundColour=self.GetBackgroundColour()),
+            area=area,
+            tileSize=tileSize,
+            workers=workers
+        )
+        exporter.exportToFile(path=path, scale=scale)
+
     def createDC(self) -> DC:
         w, h = self.GetSize()
         dc   = self._createDC(w=w, h=h)
@@ -304,11 +476,12 @@ class UmlFrame(DiagramFrame):
 
         """
         dc = self.createDC()
-        self.umlDiagram.Redraw(dc=dc)
+        self.Redraw(dc=dc, rect=self.visibleRectangle)
 
     def moveSelectedShapes(self, deltaXY: DeltaXY):
         """
-        The move master is sending the message;  We don't need to move it
+        The move master is sending the message;  We don't need to move it.
+        When a drag session is active it does the move in a single pass
 
         Args:
             deltaXY:  The difference between the current position and the new position
@@ -318,12 +491,13 @@ class UmlFrame(DiagramFrame):
         from umlshapes.links.UmlLinkLabel import UmlLinkLabel
 
         self.ufLogger.debug(f'{deltaXY=}')
+        if self._dragSession is not None:
+            self._dragSession.moveBy(deltaXY=deltaXY)
+            return
+
         shapes = self.selectedShapes
 
         if self._shapesMoving is False:         # noqa
-            from umlshapes.links.UmlLink import UmlLink
-            from umlshapes.links.UmlLinkLabel import UmlLinkLabel
-
             for s in shapes:
                 if not isinstance(s, (UmlLink, UmlLinkLabel)):
                     self.markShapeAsMoved(umlShape=s)
@@ -346,6 +520,30 @@ class UmlFrame(DiagramFrame):
                 umlShape.umlFrame.PrepareDC(dc)
                 umlShape.MoveLinks(dc)
 
+    def beginDragSession(self, moveMaster: 'UmlShapeGenre') -> 'DragSession':
+        """
+        Capture the selection once, so that each drag tick moves the selected
+        shapes directly instead of by a message per tick
+
+        Args:
+            moveMaster:  The shape the user is dragging
+
+        Returns:  The new drag session
+        """
+        from umlshapes.frames.DragSession import DragSession
+
+        self._dragSession  = DragSession(umlFrame=self, moveMaster=moveMaster)
+        self._shapesMoving = True
+
+        return self._dragSession
+
+    def endDragSession(self):
+        """
+        The drag is over;  Forget the session and the moved shapes
+        """
+        self._dragSession = None
+        self.clearMovedShapes()
+
     def markShapeAsMoved(self, umlShape: 'UmlShapeGenre'):
         """
 
@@ -374,6 +572,16 @@ class UmlFrame(DiagramFrame):
         self._movedShapes  = MovedShapes({})
         self._shapesMoving = False
 
+    def _endBatchUpdate(self):
+
+        if self._refreshPending is True:
+            self._refreshPending = False
+            self.refresh()
+
+        if self._frameModifiedPending is True:
+            self._frameModifiedPending = False
+            self._umlPubSubEngine.sendMessage(UmlMessageType.FRAME_MODIFIED, frameId=self.id, modifiedFrameId=self.id)
+
     def _onProcessKeystrokes(self, event: KeyEvent):
         """
 
@@ -1,14 +1,10 @@
 
-from typing import List
 from typing import cast
-from typing import NewType
 from typing import TYPE_CHECKING
 
 from logging import Logger
 from logging import getLogger
 
-from copy import deepcopy
-
 from functools import singledispatch
 
 from wx import ID_OK
@@ -19,20 +15,20 @@ from wx import MessageDialog
 
 from umlmodel.Actor import Actor
 from umlmodel.Class import Class
-from umlmodel.Link import Links
 from umlmodel.Note import Note
 from umlmodel.Text import Text
 from umlmodel.UseCase import UseCase
 from umlmodel.UmlModelBase import UmlModelBase
-from umlmodel.LinkedObject import LinkedObject
 
-from umlshapes.utils.IDUtil import IDUtil
+from umlshapes.utils.ModelSnapshot import ModelObjects
+from umlshapes.utils.ModelSnapshot import ModelSnapshot
 
 from umlshapes.commands.ActorCutCommand import ActorCutCommand
 from umlshapes.commands.ActorPasteCommand import ActorPasteCommand
 from umlshapes.commands.BaseCutCommand import BaseCutCommand
 from umlshapes.commands.ClassCutCommand import ClassCutCommand
 from umlshapes.commands.ClassPasteCommand import ClassPasteCommand
+from umlshapes.commands.CompositeCommand import CompositeCommand
 from umlshapes.commands.DeleteLinkCommand import DeleteLinkCommand
 from umlshapes.commands.NoteCutCommand import NoteCutCommand
 from umlshapes.commands.NotePasteCommand import NotePasteCommand
@@ -54,8 +50,6 @@ if TYPE_CHECKING:
     from umlshapes.ShapeTypes import UmlShapes
     from umlshapes.ShapeTypes import UmlShapeGenre
 
-ModelObjects = NewType('ModelObjects', List[UmlModelBase])
-
 @singledispatch
 def createCutCommand(_umlShape: 'UmlShapeGenre') -> BaseCutCommand:
     raise NotImplementedError("Unsupported type")
@@ -74,10 +68,24 @@ class UmlFrameOperationsListener:
 
         self._preferences:     UmlPreferences   = UmlPreferences()
 
-        self._clipboard: ModelObjects = ModelObjects([])            # will be re-created at every copy
+        self._clipboard: ModelSnapshot = ModelSnapshot()            # will be re-created at every copy
 
         self._setupListeners(umlFrame=umlFrame)
 
+    @property
+    def clipboard(self) -> ModelSnapshot:
+        return self._clipboard
+
+    @clipboard.setter
+    def clipboard(self, snapshot: ModelSnapshot):
+        """
+        Lets another frame hand us its clipboard to paste
+
+        Args:
+            snapshot:  What to paste next
+        """
+        self._clipboard = snapshot
+
     def _setupListeners(self, umlFrame: 'UmlFrame'):
         """
 
@@ -146,7 +154,7 @@ class UmlFrameOperationsListener:
         """
         We don't do links
 
-        Assumes that the model objects are deep copies and that the ID has been made unique
+        Each paste materializes new model objects with unique IDs from the clipboard snapshot
 
         """
         self.logger.info(f'Pasting {len(self._clipboard)} shapes')
@@ -157,7 +165,9 @@ class UmlFrameOperationsListener:
         x: int = pasteStart.x
         y: int = pasteStart.y
         numbObjectsPasted: int = 0
-        for clipboardObject in self._clipboard:
+        pasteCommand: CompositeCommand = CompositeCommand(partialName='Paste', umlFrame=self._umlFrame)
+        modelObjects: ModelObjects = self._clipboard.materialize()
+        for clipboardObject in modelObjects:
 
             umlModelBase: UmlModelBase = clipboardObject
 
@@ -167,37 +177,35 @@ class UmlFrameOperationsListener:
                                                                          umlFrame=self._umlFrame,
                                                                          umlPubSubEngine=self._umlPubSubEngine
                                                                          )
-                self._umlFrame.commandProcessor.Submit(classPasteCommand)
-
-                self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.FRAME_MODIFIED, frameId=self._umlFrame.id, modifiedFrameId=self._umlFrame.id)
+                pasteCommand.addCommand(classPasteCommand)
             elif isinstance(umlModelBase, Actor):
                 actorPasteCommand: ActorPasteCommand = ActorPasteCommand(umlModelBase=umlModelBase,
                                                                          umlPosition=UmlPosition(x=x, y=y),
                                                                          umlFrame=self._umlFrame,
                                                                          umlPubSubEngine=self._umlPubSubEngine
                                                                          )
-                self._umlFrame.commandProcessor.Submit(actorPasteCommand)
+                pasteCommand.addCommand(actorPasteCommand)
             elif isinstance(umlModelBase, Note):
                 notePasteCommand: NotePasteCommand = NotePasteCommand(umlModelBase=umlModelBase,
                                                                       umlPosition=UmlPosition(x=x, y=y),
                                                                       umlFrame=self._umlFrame,
                                                                       umlPubSubEngine=self._umlPubSubEngine
                                                                       )
-                self._umlFrame.commandProcessor.Submit(notePasteCommand)
+                pasteCommand.addCommand(notePasteCommand)
             elif isinstance(umlModelBase, Text):
                 textPasteCommand: TextPasteCommand = TextPasteCommand(umlModelBase=umlModelBase,
                                                                       umlPosition=UmlPosition(x=x, y=y),
                                                                       umlFrame=self._umlFrame,
                                                                       umlPubSubEngine=self._umlPubSubEngine
                                                                       )
-                self._umlFrame.commandProcessor.Submit(textPasteCommand)
+                pasteCommand.addCommand(textPasteCommand)
             elif isinstance(umlModelBase, UseCase):
                 useCasePasteCommand: UseCasePasteCommand = UseCasePasteCommand(umlModelBase=umlModelBase,
                                                                                umlPosition=UmlPosition(x=x, y=y),
                                                                                umlFrame=self._umlFrame,
                                                                                umlPubSubEngine=self._umlPubSubEngine
                                                                                )
-                self._umlFrame.commandProcessor.Submit(useCasePasteCommand)
+                pasteCommand.addCommand(useCasePasteCommand)
 
             else:
                 continue
@@ -206,7 +214,10 @@ class UmlFrameOperationsListener:
             x += pasteDeltaXY.deltaX
             y += pasteDeltaXY.deltaY
 
-        self.frameModified = True
+        if len(pasteCommand) > 0:
+            self._umlFrame.commandProcessor.Submit(pasteCommand)
+
+        self._umlFrame.frameModified = True
         self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.UPDATE_APPLICATION_STATUS,
                                           frameId=self._umlFrame.id,
                                           message=f'Pasted {len(self._clipboard)} shape')
@@ -216,9 +227,10 @@ class UmlFrameOperationsListener:
         from umlshapes.ShapeTypes import UmlShapeGenre
         from umlshapes.ShapeTypes import UmlLinkGenre
 
-        for shape in self._umlFrame.umlDiagram.shapes:
-            if isinstance(shape, UmlShapeGenre) is True or isinstance(shape, UmlLinkGenre) is True:
-                shape.selected = True
+        with self._umlFrame.selectionModel.batch():
+            for shape in self._umlFrame.umlDiagram.shapes:
+                if isinstance(shape, UmlShapeGenre) is True or isinstance(shape, UmlLinkGenre) is True:
+                    shape.selected = True
 
         self._umlFrame.refresh()
 
@@ -365,14 +377,16 @@ class UmlFrameOperationsListener:
 
         self._copyToInternalClipboard(selectedShapes=selectedShapes)  # In case we want to paste them back
 
+        cutCommand: CompositeCommand = CompositeCommand(partialName='Cut', umlFrame=self._umlFrame)
         for shape in selectedShapes:
             if isinstance(shape, UmlShapeGenre):
-                self._umlFrame.commandProcessor.Submit(createCutCommand(shape))
+                cutCommand.addCommand(createCutCommand(shape))
             elif isinstance(shape, UmlLinkGenre):
                 deleteLinkCommand: DeleteLinkCommand = DeleteLinkCommand(partialName='Delete-', umlLink=shape, umlPubSubEngine=self._umlPubSubEngine)
-                self._umlFrame.commandProcessor.Submit(deleteLinkCommand)
+                cutCommand.addCommand(deleteLinkCommand)
             else:
                 assert False, f'Now do I delete this: {shape=}'
+        self._umlFrame.commandProcessor.Submit(cutCommand)
         self._umlFrame.frameModified = True
 
         self._umlPubSubEngine.sendMessage(messageType=UmlMessageType.UPDATE_APPLICATION_STATUS,
@@ -396,28 +410,19 @@ class UmlFrameOperationsListener:
         from umlshapes.shapes.UmlUseCase import UmlUseCase
         from umlshapes.shapes.UmlText import UmlText
 
-        self._clipboard = ModelObjects([])
-
-        # put a copy of the model instances in the clipboard
+        modelObjects: ModelObjects = ModelObjects([])
         for umlShape in selectedShapes:
-            linkedObject: LinkedObject = cast(LinkedObject, None)   # noqa
-
             if isinstance(umlShape, UmlClass):
-                linkedObject = deepcopy(umlShape.modelClass)
+                modelObjects.append(umlShape.modelClass)
             elif isinstance(umlShape, UmlNote):
-                linkedObject = deepcopy(umlShape.modelNote)
+                modelObjects.append(umlShape.modelNote)
             elif isinstance(umlShape, UmlActor):
-                linkedObject = deepcopy(umlShape.modelActor)
+                modelObjects.append(umlShape.modelActor)
             elif isinstance(umlShape, UmlUseCase):
-                linkedObject = deepcopy(umlShape.modelUseCase)
+                modelObjects.append(umlShape.modelUseCase)
             elif isinstance(umlShape, UmlText):
-                umlText: UmlText = umlShape
-                text:    Text    = deepcopy(umlText.modelText)
-                self._clipboard.append(text)
+                modelObjects.append(umlShape.modelText)
             else:
                 self.logger.warning(f'Unhandled copy of shape {type(umlShape)}')
 
-            if linkedObject is not None:
-                linkedObject.id = IDUtil.getID()
-                linkedObject.links = Links([])  # we don't want to copy the links
-                self._clipboard.append(linkedObject)
+        self._clipboard = ModelSnapshot.capture(modelObjects)
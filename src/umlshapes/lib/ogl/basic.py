@@ -18,6 +18,7 @@ import wx
 import math
 
 from .oglmisc import *
+from .pointarray import PointArray
 
 DragOffsetX = 0.0
 DragOffsetY = 0.0
@@ -326,6 +327,7 @@ class Shape(ShapeEvtHandler):
         self._canvas = canvas
         self._xpos = 0
         self._ypos = 0
+        self._geometryVersion = 0
         self._pen = BlackForegroundPen
         self._brush = wx.WHITE_BRUSH
         self._font = NormalFont
@@ -333,6 +335,7 @@ class Shape(ShapeEvtHandler):
         self._textColourName = wx.BLACK
         self._visible = False
         self._selected = False
+        self._lastDrawnRect = None
         self._attachmentMode = ATTACHMENT_MODE_NONE
         self._spaceAttachments = True
         self._disableLabel = False
@@ -425,6 +428,54 @@ class Shape(ShapeEvtHandler):
         """Get the internal canvas."""
         return self._canvas
 
+    def GeometryChanged(self):
+        """
+        Notify the diagram that the position or the extent of this shape
+        has changed, so that any derived data (e.g. a spatial index) can
+        be refreshed.
+        """
+        self._geometryVersion += 1
+        for line in self._lines:
+            line.InvalidateEndPoints()
+
+        if self._canvas:
+            diagram = self._canvas.GetDiagram()
+            if diagram:
+                diagram.OnShapeGeometryChanged(self)
+            self.Invalidate()
+            for line in self._lines:
+                line.Invalidate()
+
+    def Invalidate(self):
+        """
+        Report to the canvas that the area this shape was last drawn on,
+        and the area it now occupies, need to be repainted.
+        """
+        if self._canvas:
+            self._canvas.InvalidateShape(self)
+
+    def GetDamageRectangle(self):
+        """
+        Return the area, in logical coordinates, that the shape may paint
+        on, including its shadow, pen width and control points.
+        """
+        width, height = self.GetBoundingBoxMax()
+        margin = CONTROL_POINT_SIZE + DAMAGE_MARGIN
+
+        left = int(math.floor(self._xpos - abs(width) / 2.0)) - margin
+        top = int(math.floor(self._ypos - abs(height) / 2.0)) - margin
+        right = int(math.ceil(self._xpos + abs(width) / 2.0)) + margin
+        bottom = int(math.ceil(self._ypos + abs(height) / 2.0)) + margin
+
+        return wx.Rect(left, top, right - left, bottom - top)
+
+    def GetLastDrawnRectangle(self):
+        """
+        Return the damage rectangle recorded the last time the shape was
+        drawn, or None if it has not been drawn yet.
+        """
+        return self._lastDrawnRect
+
     def GetBranchStyle(self):
         """Get the branch style."""
         return self._branchStyle
@@ -528,6 +579,7 @@ class Shape(ShapeEvtHandler):
             self.Draw(dc)
         else:
             self._shadowMode = mode
+        self.GeometryChanged()
 
     def GetShadowMode(self):
         """Get the current shadow mode setting."""
@@ -605,6 +657,7 @@ class Shape(ShapeEvtHandler):
             self._text = ""
         if regionId < len(self._regions):
             self._regions[regionId].ClearText()
+        self.Invalidate()
 
     def ClearRegions(self):
         """Clear the ShapeRegions from the shape."""
@@ -1348,6 +1401,7 @@ class Shape(ShapeEvtHandler):
         self.Erase(dc)
 
         self.Move(dc, xx, yy)
+        self.RecomputeParent()
         if self._canvas and not self._canvas.GetQuickEditMode():
             self._canvas.Redraw(dc)
 
@@ -1411,8 +1465,9 @@ class Shape(ShapeEvtHandler):
             return
 
         self._xpos, self._ypos = x, y
+        self.GeometryChanged()
 
-        self.ResetControlPoints()
+        self.RequestControlPointReset()
 
         if display:
             self.Draw(dc)
@@ -1433,6 +1488,7 @@ class Shape(ShapeEvtHandler):
         by this function.
         """
         if self._visible:
+            self._lastDrawnRect = self.GetDamageRectangle()
             self.GetEventHandler().OnDraw(dc)
             self.GetEventHandler().OnDrawContents(dc)
             self.GetEventHandler().OnDrawControlPoints(dc)
@@ -1452,6 +1508,7 @@ class Shape(ShapeEvtHandler):
     def Show(self, show):
         """Set a flag indicating whether the shape should be drawn."""
         self._visible = show
+        self.Invalidate()
         for child in self._children:
             child.Show(show)
 
@@ -1484,6 +1541,7 @@ class Shape(ShapeEvtHandler):
         text.append(new_line)
 
         self._formatted = False
+        self.Invalidate()
 
     def SetSize(self, x, y, recursive = True):
         """Set the shape's size.
@@ -1518,6 +1576,8 @@ class Shape(ShapeEvtHandler):
             point._x = point._x * scaleX
             point._y = point._y * scaleY
 
+        self.GeometryChanged()
+
     # Add line FROM this object
     def AddLine(self, line, other, attachFrom = 0, attachTo = 0, positionFrom = -1, positionTo = -1):
         """
@@ -1648,6 +1708,15 @@ class Shape(ShapeEvtHandler):
         for child in self._children:
             child.MakeMandatoryControlPoints()
 
+    def RequestControlPointReset(self):
+        """
+        Reset the control points now, or once the canvas resumes control
+        point resets.
+        """
+        if self._canvas and self._canvas.DeferControlPointReset(self):
+            return
+        self.ResetControlPoints()
+
     def ResetMandatoryControlPoints(self):
         """Reset the mandatory control points."""
         for child in self._children:
@@ -1757,6 +1826,9 @@ class Shape(ShapeEvtHandler):
 
         """
         self._selected = select
+        self.Invalidate()
+        if self._canvas:
+            self._canvas.OnShapeSelectionChanged(self)
         if select:
             self.MakeControlPoints()
             # Children of divisions are contained objects,
@@ -2295,6 +2367,7 @@ class Shape(ShapeEvtHandler):
         :param `x`: the x position
         """
         self._xpos = x
+        self.GeometryChanged()
 
     def SetY(self, y):
         """
@@ -2304,6 +2377,7 @@ class Shape(ShapeEvtHandler):
 
         """
         self._ypos = y
+        self.GeometryChanged()
 
     def GetParent(self):
         """Get the parent of this shape, if it is part of a composite."""
@@ -2337,15 +2411,30 @@ class Shape(ShapeEvtHandler):
         """
         self._eventHandler = handler
 
-    def Recompute(self):
+    def Recompute(self, changed = None):
         """
         Recomputes any constraints associated with the shape.
 
         Normally applicable to CompositeShapes only, but harmless for
         other classes of Shape.
+
+        :param `changed`: the children that moved or were resized; if None,
+         every constraint is evaluated
+
         """
         return True
 
+    def RecomputeParent(self):
+        """
+        Recomputes the constraints of the parent shape after this shape moved
+        or was resized.  Only the constraints this shape takes part in are
+        evaluated first.
+        """
+        if self._parent:
+            return self._parent.Recompute([self])
+
+        return True
+
     def IsHighlighted(self):
         """
         `True` if the shape is highlighted. Shape highlighting is unimplemented.
@@ -2699,7 +2788,7 @@ class Shape(ShapeEvtHandler):
             self._canvas.ReleaseMouse()
         dc.SetLogicalFunction(wx.COPY)
         self.Recompute()
-        self.ResetControlPoints()
+        self.RequestControlPointReset()
 
         self.Erase(dc)
 
@@ -2715,6 +2804,7 @@ class Shape(ShapeEvtHandler):
             self.Move(dc, self.GetX(), self.GetY())
         else:
             self.Move(dc, pt._controlPointDragPosX, pt._controlPointDragPosY)
+        self.RecomputeParent()
 
         # Recursively redraw links if we have a composite
         if len(self.GetChildren()):
@@ -2836,6 +2926,7 @@ class RectangleShape(Shape):
 
         """
         self._width = w
+        self.GeometryChanged()
 
     def SetHeight(self, h):
         """
@@ -2845,6 +2936,7 @@ class RectangleShape(Shape):
 
         """
         self._height = h
+        self.GeometryChanged()
 
 
 class PolygonShape(Shape):
@@ -2865,6 +2957,7 @@ class PolygonShape(Shape):
 
         self._points = None
         self._originalPoints = None
+        self._originalPointArray = PointArray()
 
     def Create(self, the_points = None):
         """
@@ -2878,6 +2971,7 @@ class PolygonShape(Shape):
             self._points = []
         else:
             self._originalPoints = the_points
+            self._originalPointArray = PointArray(the_points)
 
             # Duplicate the list of points
             self._points = []
@@ -2893,6 +2987,7 @@ class PolygonShape(Shape):
         """Clear the points."""
         self._points = []
         self._originalPoints = []
+        self._originalPointArray = PointArray()
 
     # Width and height. Centre of object is centre of box
     def GetBoundingBoxMin(self):
@@ -2953,6 +3048,7 @@ class PolygonShape(Shape):
 
         self._boundWidth = right - left
         self._boundHeight = bottom - top
+        self.GeometryChanged()
 
     def CalculatePolygonCentre(self):
         """
@@ -2988,6 +3084,7 @@ class PolygonShape(Shape):
             self._points[i] = self._points[i][0] - newCentreX, self._points[i][1] - newCentreY
         self._xpos += newCentreX
         self._ypos += newCentreY
+        self.GeometryChanged()
 
     def HitTest(self, x, y):
         """Hit text
@@ -3054,8 +3151,7 @@ class PolygonShape(Shape):
         x_proportion = abs(float(new_width) / self._originalWidth)
         y_proportion = abs(float(new_height) / self._originalHeight)
 
-        for i in range(max(len(self._points), len(self._originalPoints))):
-            self._points[i] = wx.Point(self._originalPoints[i][0] * x_proportion, self._originalPoints[i][1] * y_proportion)
+        self._points = self._originalPointArray.Copy().Scale(x_proportion, y_proportion).ToIntList()
 
         self._boundWidth = abs(new_width)
         self._boundHeight = abs(new_height)
@@ -3068,11 +3164,8 @@ class PolygonShape(Shape):
         working points with this function.
 
         """
-        self._originalPoints = []
-
-        for point in self._points:
-            original_point = wx.RealPoint(point[0], point[1])
-            self._originalPoints.append(original_point)
+        self._originalPointArray = PointArray(self._points)
+        self._originalPoints = self._originalPointArray.ToList()
 
         self.CalculateBoundingBox()
         self._originalWidth = self._boundWidth
@@ -3269,25 +3362,18 @@ class PolygonShape(Shape):
             point._x = x1 * cosTheta - y1 * sinTheta + x * (1 - cosTheta) + y * sinTheta
             point._y = x1 * sinTheta + y1 * cosTheta + y * (1 - cosTheta) + x * sinTheta
 
-        for i in range(len(self._points)):
-            x1, y1 = self._points[i]
-
-            self._points[i] = x1 * cosTheta - y1 * sinTheta + x * (1 - cosTheta) + y * sinTheta, x1 * sinTheta + y1 * cosTheta + y * (1 - cosTheta) + x * sinTheta
-
-        for i in range(len(self._originalPoints)):
-            x1, y1 = self._originalPoints[i]
-
-            self._originalPoints[i] = x1 * cosTheta - y1 * sinTheta + x * (1 - cosTheta) + y * sinTheta, x1 * sinTheta + y1 * cosTheta + y * (1 - cosTheta) + x * sinTheta
+        self._points = PointArray(self._points).Rotate(x, y, sinTheta, cosTheta).ToList()
 
         # Added by Pierre Hjälm. If we don't do this the outline will be
         # the wrong size. Hopefully it won't have any ill effects.
+        # The original points are replaced by the rotated points, so they are not rotated themselves
         self.UpdateOriginalPoints()
 
         self._rotation = theta
 
         self.CalculatePolygonCentre()
         self.CalculateBoundingBox()
-        self.ResetControlPoints()
+        self.RequestControlPointReset()
 
     # Control points ('handles') redirect control to the actual shape, to
     # make it easier to override sizing behaviour.
@@ -3358,8 +3444,9 @@ class PolygonShape(Shape):
             self.SetSize(pt.GetNewSize()[0], pt.GetNewSize()[1])
 
         self.Recompute()
-        self.ResetControlPoints()
+        self.RequestControlPointReset()
         self.Move(dc, self.GetX(), self.GetY())
+        self.RecomputeParent()
         if not self._canvas.GetQuickEditMode():
             self._canvas.Redraw(dc)
 
@@ -3417,6 +3504,7 @@ class EllipseShape(Shape):
 
         """
         self._width = w
+        self.GeometryChanged()
 
     def SetHeight(self, h):
         """
@@ -3426,6 +3514,7 @@ class EllipseShape(Shape):
 
         """
         self._height = h
+        self.GeometryChanged()
 
     def OnDraw(self, dc):
         """The draw handler."""
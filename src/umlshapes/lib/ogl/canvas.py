@@ -84,21 +84,147 @@ class ShapeCanvas(wx.ScrolledWindow):
 
         self._buffer = wx.Bitmap(1, 1)
 
+        # Damage tracking;  only the damaged area is repainted by Draw
+        self._fullyDamaged = True
+        self._damagedRects = []
+        self._damagedShapes = {}
+
+        # Control point resets requested while resets are suspended
+        self._controlPointSuspensions = 0
+        self._deferredControlPoints = {}
+
         self.Bind(wx.EVT_PAINT, self.OnPaint)
         self.Bind(wx.EVT_SIZE, self.OnSize)
         self.Bind(wx.EVT_MOUSE_EVENTS, self.OnMouseEvent)
 
     def Draw(self):
         """
-        Update the buffer with the background and redraw the full diagram.
+        Update the buffer with the background and redraw the damaged part
+        of the diagram.  Does nothing if nothing was damaged since the
+        last draw.
+        """
+        if self._fullyDamaged:
+            self.ClearDamage()
+            dc = wx.MemoryDC(self._buffer)
+
+            dc.SetBackground(wx.Brush(self.GetBackgroundColour(), wx.BRUSHSTYLE_SOLID))
+            dc.Clear() # make sure you clear the bitmap!
+
+            if self.GetDiagram():
+                self.GetDiagram().Redraw(dc)
+            self.Refresh(False)
+        else:
+            rect = self.GetDamagedRect()
+            if rect is None:
+                return
+            self.ClearDamage()
+            dc = wx.MemoryDC(self._buffer)
+            dc.SetClippingRegion(rect)
+
+            dc.SetBrush(wx.Brush(self.GetBackgroundColour(), wx.BRUSHSTYLE_SOLID))
+            dc.SetPen(wx.TRANSPARENT_PEN)
+            dc.DrawRectangle(rect)
+
+            if self.GetDiagram():
+                self.GetDiagram().Redraw(dc, rect)
+            dc.DestroyClippingRegion()
+
+            x, y = self.CalcScrolledPosition(rect.x, rect.y)
+            self.RefreshRect(wx.Rect(x, y, rect.width, rect.height), False)
+
+    def Invalidate(self, rect = None):
+        """
+        Mark an area of the diagram as needing to be repainted.
+
+        :param `rect`: a :class:`wx.Rect` in logical coordinates, or None
+         to mark the whole diagram
+
+        """
+        if rect is None:
+            self._fullyDamaged = True
+        elif not self._fullyDamaged:
+            self._damagedRects.append(rect)
+
+    def InvalidateShape(self, shape):
+        """
+        Mark the area the shape was last drawn on, and the area it will be
+        drawn on next, as needing to be repainted.
+
+        :param `shape`: an instance of :class:`~lib.ogl.Shape`
+
+        """
+        if self._fullyDamaged:
+            return
+        lastDrawn = shape.GetLastDrawnRectangle()
+        if lastDrawn is not None:
+            self._damagedRects.append(lastDrawn)
+        self._damagedShapes[id(shape)] = shape
+
+    def SuspendControlPointResets(self):
+        """
+        Defer control point resets until the matching
+        :meth:`~ShapeCanvas.ResumeControlPointResets`.  Calls nest.
+        """
+        self._controlPointSuspensions += 1
+
+    def ResumeControlPointResets(self):
+        """
+        Undo one :meth:`~ShapeCanvas.SuspendControlPointResets`; the last one
+        resets the control points of every shape that asked, once.
+        """
+        self._controlPointSuspensions -= 1
+        if self._controlPointSuspensions == 0:
+            deferred = self._deferredControlPoints
+            self._deferredControlPoints = {}
+            for shape in deferred.values():
+                shape.ResetControlPoints()
+
+    def DeferControlPointReset(self, shape):
         """
-        dc = wx.MemoryDC(self._buffer)
+        Return `True` if the shape's control point reset was deferred.
 
-        dc.SetBackground(wx.Brush(self.GetBackgroundColour(), wx.BRUSHSTYLE_SOLID))
-        dc.Clear() # make sure you clear the bitmap!
+        :param `shape`: an instance of :class:`~lib.ogl.Shape`
 
-        if self.GetDiagram():
-            self.GetDiagram().Redraw(dc)
+        """
+        if self._controlPointSuspensions > 0:
+            self._deferredControlPoints[id(shape)] = shape
+            return True
+        return False
+
+    def OnShapeSelectionChanged(self, shape):
+        """
+        Called by a shape when it is selected or deselected.  The default
+        implementation does nothing; override it to maintain a selection
+        model.
+
+        :param `shape`: an instance of :class:`~lib.ogl.Shape`
+
+        """
+        pass
+
+    def IsFullyDamaged(self):
+        """`True` if the whole diagram needs to be repainted."""
+        return self._fullyDamaged
+
+    def GetDamagedRect(self):
+        """
+        Return the union of the damaged areas, in logical coordinates, or
+        None if nothing was damaged.
+        """
+        damaged = None
+        for rect in self._damagedRects:
+            damaged = wx.Rect(rect) if damaged is None else damaged.Union(rect)
+        for shape in self._damagedShapes.values():
+            rect = shape.GetDamageRectangle()
+            damaged = rect if damaged is None else damaged.Union(rect)
+
+        return damaged
+
+    def ClearDamage(self):
+        """Forget the damaged areas, e.g. after the diagram was repainted."""
+        self._fullyDamaged = False
+        self._damagedRects = []
+        self._damagedShapes = {}
 
     def OnSize(self, evt):
         """
@@ -109,6 +235,7 @@ class ShapeCanvas(wx.ScrolledWindow):
         # Make sure we don't try to create a 0 size bitmap
         size = wx.Size(max(size.x, 1), max(size.y, 1))
         self._buffer = wx.Bitmap(size.x, size.y)
+        self.Invalidate()
         self.Draw()
 
     def GetBuffer(self):
@@ -339,8 +466,7 @@ class ShapeCanvas(wx.ScrolledWindow):
         #     the other objects
         # (b) to find the control points FIRST if they exist
 
-        rl = self.GetDiagram().GetShapeList()[:]
-        rl.reverse()
+        rl = self.GetDiagram().GetCandidateShapes(x, y)
         for object in rl:
             # First pass for lines, which might be inside a container, so we
             # want lines to take priority over containers. This first loop
@@ -421,9 +547,16 @@ class ShapeCanvas(wx.ScrolledWindow):
         """Get quick edit mode."""
         return self.GetDiagram().GetQuickEditMode()
 
-    def Redraw(self, dc):
-        """Redraw the diagram."""
-        self.GetDiagram().Redraw(dc)
+    def Redraw(self, dc, rect = None):
+        """
+        Redraw the diagram.
+
+        :param `dc`: the device context
+        :param `rect`: an optional :class:`wx.Rect` in logical coordinates;
+         only the shapes that may paint on it are drawn
+
+        """
+        self.GetDiagram().Redraw(dc, rect)
 
     def Snap(self, x, y):
         """Snap ???
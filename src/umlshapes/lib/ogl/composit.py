@@ -43,6 +43,8 @@ CONSTRAINT_MIDALIGNED_BOTTOM    = 13
 CONSTRAINT_MIDALIGNED_LEFT      = 14
 CONSTRAINT_MIDALIGNED_RIGHT     = 15
 
+MAX_CONSTRAINT_ITERATIONS = 500
+
 
 class ConstraintType(object):
     """The :class:`ConstraintType` class."""
@@ -183,16 +185,23 @@ class Constraint(object):
 
         return b <= a + marg and b >= a - marg
 
-    def Evaluate(self):
-        """Evaluate this constraint and return `True` if anything changed."""
+    def Evaluate(self, dc = None):
+        """
+        Evaluate this constraint and return `True` if anything changed.
+
+        :param `dc`: the device context to move the constrained objects with;
+         if None, one is made for this evaluation
+
+        """
         maxWidth, maxHeight = self._constrainingObject.GetBoundingBoxMax()
         minWidth, minHeight = self._constrainingObject.GetBoundingBoxMin()
         x = self._constrainingObject.GetX()
         y = self._constrainingObject.GetY()
 
-        dc = wx.MemoryDC()
-        dc.SelectObject(self._constrainingObject.GetCanvas().GetBuffer())
-        self._constrainingObject.GetCanvas().PrepareDC(dc)
+        if dc is None:
+            dc = wx.MemoryDC()
+            dc.SelectObject(self._constrainingObject.GetCanvas().GetBuffer())
+            self._constrainingObject.GetCanvas().PrepareDC(dc)
 
         if self._constraintType == CONSTRAINT_CENTRED_VERTICALLY:
             n = len(self._constrainedObjects)
@@ -401,6 +410,122 @@ OGLConstraint = wx.deprecated(Constraint,
                      "The OGLConstraint name is deprecated, use `ogl.Constraint` instead.")
 
 
+class ConstraintSolver(object):
+    """
+    The :class:`ConstraintSolver` lays out the children of a :class:`CompositeShape`
+    by evaluating its constraints until none of them moves anything.
+
+    The first pass evaluates every constraint, or only those involving the
+    children said to have changed.  Later passes only evaluate the constraints
+    that involve a shape moved by the previous pass.  One device context is used
+    for the whole solve, nested composites included.
+    """
+    def __init__(self, composite):
+        """
+        Default class constructor.
+
+        :param `composite`: the :class:`CompositeShape` whose constraints are solved
+
+        """
+        self._composite = composite
+
+        self._iterations = 0
+        self._evaluations = 0
+
+    def GetIterations(self):
+        """Get the number of passes the last solve made."""
+        return self._iterations
+
+    def GetEvaluations(self):
+        """Get the number of constraint evaluations the last solve made."""
+        return self._evaluations
+
+    def Solve(self, changed = None, dc = None):
+        """
+        Evaluate the constraints until they are satisfied.
+
+        :param `changed`: the children that moved or were resized; if None,
+         every constraint is evaluated on the first pass
+        :param `dc`: the device context to move the children with; if None,
+         one is made for this solve
+
+        :returns: `True` if the constraints are satisfied, `False` if shapes still
+         moved after the maximum number of passes (the constraints are inconsistent)
+
+        """
+        if dc is None:
+            dc = wx.MemoryDC()
+            dc.SelectObject(self._composite.GetCanvas().GetBuffer())
+            self._composite.GetCanvas().PrepareDC(dc)
+
+        self._iterations = 0
+        self._evaluations = 0
+
+        changedIds = None if changed is None else set(id(shape) for shape in changed)
+        while self._iterations < MAX_CONSTRAINT_ITERATIONS:
+            self._iterations += 1
+            changedIds = self._SolvePass(dc, changedIds)
+            if not changedIds:
+                return True
+
+        return False
+
+    def _SolvePass(self, dc, changedIds):
+        """
+        Make one pass over the constraints.
+
+        :param `dc`: the device context to move the children with
+        :param `changedIds`: the ids of the shapes that changed; None for all of them
+
+        :returns: the ids of the shapes this pass moved or resized
+
+        """
+        composite = self._composite
+        movedIds = set()
+
+        geometry = self._Geometry(composite)
+        composite.CalculateSize()
+        if self._Geometry(composite) != geometry:
+            movedIds.add(id(composite))
+
+        for child in composite.GetChildren():
+            if isinstance(child, CompositeShape) and (changedIds is None or id(child) in changedIds):
+                geometry = self._Geometry(child)
+                child.GetConstraintSolver().Solve(dc = dc)
+                self._evaluations += child.GetConstraintSolver().GetEvaluations()
+                if self._Geometry(child) != geometry:
+                    movedIds.add(id(child))
+
+        for constraint in composite.GetConstraints():
+            if changedIds is not None and not self._Involves(constraint, changedIds):
+                continue
+
+            positions = [(constrainedObject.GetX(), constrainedObject.GetY()) for constrainedObject in constraint._constrainedObjects]
+            self._evaluations += 1
+            if constraint.Evaluate(dc):
+                for constrainedObject, position in zip(constraint._constrainedObjects, positions):
+                    if (constrainedObject.GetX(), constrainedObject.GetY()) != position:
+                        movedIds.add(id(constrainedObject))
+
+        return movedIds
+
+    def _Involves(self, constraint, shapeIds):
+        """Return `True` if any of the shapes constrains or is constrained by the constraint."""
+        if id(constraint._constrainingObject) in shapeIds:
+            return True
+
+        return any(id(constrainedObject) in shapeIds for constrainedObject in constraint._constrainedObjects)
+
+    def _Geometry(self, shape):
+        """Return what a constraint reads from a shape: its centre and its size."""
+        width, height = shape.GetBoundingBoxMax()
+
+        return shape.GetX(), shape.GetY(), width, height
+
+    def __repr__(self):
+        return "<%s.%s iterations: %d evaluations: %d>" % (self.__class__.__module__, self.__class__.__name__, self._iterations, self._evaluations)
+
+
 class CompositeShape(RectangleShape):
     """
     The :class:`CompositeShape` is a shape with a list of child objects, and a
@@ -420,6 +545,7 @@ class CompositeShape(RectangleShape):
 
         self._constraints = []
         self._divisions = [] # In case it's a container
+        self._constraintSolver = ConstraintSolver(self)
 
         self._preferences: UmlPreferences = UmlPreferences()
 
@@ -480,7 +606,7 @@ class CompositeShape(RectangleShape):
         dc.SetPen(dottedPen)
         dc.SetBrush(wx.TRANSPARENT_BRUSH)
 
-        if self._preferences.enableCompositeShapeLiveDragging is True:
+        if self._preferences.snapshot.enableCompositeShapeLiveDragging is True:
             self.GetEventHandler().OnDrawOutline(dc, _shapeStartX + offsetX, _shapeStartY + offsetY, self.GetWidth(), self.GetHeight())
         else:
             self.GetEventHandler().OnDrawOutline(dc, self.GetX() + offsetX, self.GetY() + offsetY, self.GetWidth(), self.GetHeight())
@@ -492,7 +618,7 @@ class CompositeShape(RectangleShape):
         _objectStartX = x
         _objectStartY = y
 
-        if self._preferences.enableCompositeShapeLiveDragging is True:
+        if self._preferences.snapshot.enableCompositeShapeLiveDragging is True:
             _shapeStartX = self.GetX()
             _shapeStartY = self.GetY()
 
@@ -532,6 +658,7 @@ class CompositeShape(RectangleShape):
         offsetY = yy - _objectStartY
 
         self.Move(dc, self.GetX() + offsetX, self.GetY() + offsetY)
+        self.RecomputeParent()
 
         if self._canvas and not self._canvas.GetQuickEditMode():
             self._canvas.Redraw(dc)
@@ -758,21 +885,23 @@ class CompositeShape(RectangleShape):
         self._height = maxY - minY
         self._xpos = self._width / 2.0 + minX
         self._ypos = self._height / 2.0 + minY
+        self.GeometryChanged()
 
-    def Recompute(self):
+    def Recompute(self, changed = None):
         """
         Recomputes any constraints associated with the object. If `False` is
         returned, the constraints could not be satisfied (there was an
         inconsistency).
 
+        :param `changed`: the children that moved or were resized; if None,
+         every constraint is evaluated
+
         """
-        noIterations = 0
-        changed = True
-        while changed and noIterations < 500:
-            changed = self.Constrain()
-            noIterations += 1
+        return self._constraintSolver.Solve(changed)
 
-        return not changed
+    def GetConstraintSolver(self):
+        """Get the :class:`ConstraintSolver`; it knows how much work the last recompute did."""
+        return self._constraintSolver
 
     def Constrain(self):
         """
@@ -788,8 +917,12 @@ class CompositeShape(RectangleShape):
             if isinstance(child, CompositeShape) and child.Constrain():
                 changed = True
 
+        dc = wx.MemoryDC()
+        dc.SelectObject(self.GetCanvas().GetBuffer())
+        self.GetCanvas().PrepareDC(dc)
+
         for constraint in self._constraints:
-            if constraint.Evaluate():
+            if constraint.Evaluate(dc):
                 changed = True
 
         return changed
@@ -1208,9 +1341,10 @@ class DivisionShape(CompositeShape):
         dc.SetLogicalFunction(wx.COPY)
 
         self._xpos, self._ypos = self._canvas.Snap(self._xpos, self._ypos)
+        self.GeometryChanged()
         self.GetEventHandler().OnMovePre(dc, x, y, self._oldX, self._oldY)
 
-        self.ResetControlPoints()
+        self.RequestControlPointReset()
         self.Draw(dc)
         self.MoveLinks(dc)
         self.GetEventHandler().OnDrawControlPoints(dc)
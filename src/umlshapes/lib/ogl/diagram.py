@@ -18,6 +18,130 @@ import wx
 DEFAULT_MOUSE_TOLERANCE = 3
 
 
+class ShapeOrder(object):
+    """
+    The shapes of a diagram, bottommost first, keyed by identity.
+
+    The order is a doubly linked list over the shape identities, so adding a
+    shape at either end or after a given shape, and removing a shape, neither
+    search nor copy the other shapes.
+    """
+    def __init__(self, shapes = ()):
+        """
+        Default class constructor.
+
+        :param `shapes`: a sequence of :class:`~lib.ogl.Shape`, bottommost first
+
+        """
+        self._shapes = {}           # id(shape) -> shape
+        self._above = {}            # id(shape) -> id of the shape above it, or None
+        self._below = {}            # id(shape) -> id of the shape below it, or None
+        self._bottomId = None
+        self._topId = None
+
+        for shape in shapes:
+            self.Append(shape)
+
+    def Append(self, shape):
+        """Add the shape on top;  A shape already in the order moves."""
+        self.Remove(shape)
+        self._Link(shape, self._topId, None)
+
+    def Prepend(self, shape):
+        """Add the shape at the bottom;  A shape already in the order moves."""
+        self.Remove(shape)
+        self._Link(shape, None, self._bottomId)
+
+    def InsertAfter(self, shape, after):
+        """
+        Add the shape just above another one.
+
+        :param `shape`: an instance of :class:`~lib.ogl.Shape`
+        :param `after`: a shape in the order
+
+        """
+        afterId = id(after)
+        if afterId not in self._shapes or after is shape:
+            raise ValueError('addAfter is not in the diagram')
+        self.Remove(shape)
+        self._Link(shape, afterId, self._above[afterId])
+
+    def Remove(self, shape):
+        """
+        Remove the shape;  Return `False` if it was not in the order.
+
+        :param `shape`: an instance of :class:`~lib.ogl.Shape`
+
+        """
+        shapeId = id(shape)
+        if self._shapes.pop(shapeId, None) is None:
+            return False
+
+        belowId = self._below.pop(shapeId)
+        aboveId = self._above.pop(shapeId)
+        if belowId is None:
+            self._bottomId = aboveId
+        else:
+            self._above[belowId] = aboveId
+        if aboveId is None:
+            self._topId = belowId
+        else:
+            self._below[aboveId] = belowId
+
+        return True
+
+    def _Link(self, shape, belowId, aboveId):
+        shapeId = id(shape)
+
+        self._shapes[shapeId] = shape
+        self._below[shapeId] = belowId
+        self._above[shapeId] = aboveId
+        if belowId is None:
+            self._bottomId = shapeId
+        else:
+            self._above[belowId] = shapeId
+        if aboveId is None:
+            self._topId = shapeId
+        else:
+            self._below[aboveId] = shapeId
+
+    def __contains__(self, shape):
+        return id(shape) in self._shapes
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def __iter__(self):
+        """Iterate bottommost first."""
+        shapeId = self._bottomId
+        while shapeId is not None:
+            yield self._shapes[shapeId]
+            shapeId = self._above[shapeId]
+
+    def __reversed__(self):
+        """Iterate topmost first."""
+        shapeId = self._topId
+        while shapeId is not None:
+            yield self._shapes[shapeId]
+            shapeId = self._below[shapeId]
+
+
+class ShapeList(list):
+    """
+    A read only copy of the diagram shapes.
+
+    The diagram does not keep a list any more, so changing this copy could not
+    change the diagram.  Rather than being silently lost, changes raise a
+    `TypeError`;  Use :meth:`Diagram.AddShape`, :meth:`Diagram.InsertShape`,
+    :meth:`Diagram.RemoveShape` or :meth:`Diagram.SetShapeList`.
+    """
+    def _ReadOnly(self, *args, **kwargs):
+        raise TypeError('The diagram shape list is a read only copy;  Use the Diagram methods to change the shapes')
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _ReadOnly
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _ReadOnly
+
+
 class Diagram(object):
     """
     The :class:`Diagram` encapsulates an entire diagram, with methods for
@@ -32,14 +156,50 @@ class Diagram(object):
         self._quickEditMode = False
         self._snapToGrid = True
         self._gridSpacing = 5
-        self._shapeList = []
+        self._shapes = ShapeOrder()
         self._mouseTolerance = DEFAULT_MOUSE_TOLERANCE
+        self._drawnCount = 0
+        self._skippedCount = 0
+
+    def Redraw(self, dc, rect = None):
+        """
+        Redraw the shapes in the diagram on the specified device context.
+
+        :param `dc`: the device context
+        :param `rect`: an optional :class:`wx.Rect` in logical coordinates;
+         if given, shapes that cannot paint on it are skipped
+
+        """
+        drawn = 0
+        skipped = 0
+        if self._shapes:
+            for object in self._shapes:
+                if rect is None or object.GetDamageRectangle().Intersects(rect):
+                    object.Draw(dc)
+                    drawn += 1
+                else:
+                    skipped += 1
+
+        self.SetRedrawCounts(drawn, skipped)
+
+    def SetRedrawCounts(self, drawn, skipped):
+        """
+        Record how many shapes the last redraw drew and skipped.
+
+        :param `drawn`: the number of shapes drawn
+        :param `skipped`: the number of shapes culled
+
+        """
+        self._drawnCount = drawn
+        self._skippedCount = skipped
 
-    def Redraw(self, dc):
-        """Redraw the shapes in the diagram on the specified device context."""
-        if self._shapeList:
-            for object in self._shapeList:
-                object.Draw(dc)
+    def GetDrawnCount(self):
+        """Return the number of shapes drawn by the last redraw."""
+        return self._drawnCount
+
+    def GetSkippedCount(self):
+        """Return the number of shapes skipped by the last redraw."""
+        return self._skippedCount
 
     def Clear(self, dc):
         """Clear the specified device context."""
@@ -54,13 +214,14 @@ class Diagram(object):
         :param `addAfter`: an instance of :class:`~lib.ogl.Shape`
 
         """
-        if not object in self._shapeList:
+        if not self.ContainsShape(object):
             if addAfter:
-                self._shapeList.insert(self._shapeList.index(addAfter) + 1, object)
+                self._shapes.InsertAfter(object, addAfter)
             else:
-                self._shapeList.append(object)
+                self._shapes.Append(object)
 
             object.SetCanvas(self.GetCanvas())
+            self.InvalidateShape(object)
 
     def InsertShape(self, object):
         """
@@ -69,7 +230,9 @@ class Diagram(object):
         :param `object`: an instance of :class:`~lib.ogl.Shape`
 
         """
-        self._shapeList.insert(0, object)
+        self._shapes.Remove(object)
+        self._shapes.Prepend(object)
+        self.InvalidateShape(object)
 
     def RemoveShape(self, object):
         """
@@ -79,16 +242,28 @@ class Diagram(object):
         :param `object`: an instance of :class:`~lib.ogl.Shape`
 
         """
-        if object in self._shapeList:
-            self._shapeList.remove(object)
+        # Keyed by identity; shapes may define __eq__ on their data
+        if self._shapes.Remove(object):
+            self.InvalidateShape(object)
+
+    def ContainsShape(self, object):
+        """
+        `True` if the shape is in the diagram.
+
+        :param `object`: an instance of :class:`~lib.ogl.Shape`
+
+        """
+        return object in self._shapes
 
     def RemoveAllShapes(self):
         """Remove all shapes from the diagram but do not delete the shapes."""
-        self._shapeList = []
+        self._shapes = ShapeOrder()
+        if self._diagramCanvas:
+            self._diagramCanvas.Invalidate()
 
     def DeleteAllShapes(self):
         """Remove and delete all shapes in the diagram."""
-        for shape in self._shapeList[:]:
+        for shape in list(self._shapes):
             if not shape.GetParent():
                 self.RemoveShape(shape)
                 shape.Delete()
@@ -99,7 +274,7 @@ class Diagram(object):
         :param `show`: True or False
 
         """
-        for shape in self._shapeList:
+        for shape in self._shapes:
             shape.Show(show)
 
     def DrawOutline(self, dc, x1, y1, x2, y2):
@@ -124,7 +299,7 @@ class Diagram(object):
         :param `dc`: the :class:`wx.MemoryDC` device context
 
         """
-        for shape in self._shapeList:
+        for shape in self._shapes:
             shape.Recentre(dc)
 
     def SetCanvas(self, canvas):
@@ -147,7 +322,7 @@ class Diagram(object):
         :param `id`: the shape id to find
 
         """
-        for shape in self._shapeList:
+        for shape in self._shapes:
             if shape.GetId() == id:
                 return shape
         return None
@@ -222,9 +397,58 @@ class Diagram(object):
         return self._mouseTolerance
 
     def GetShapeList(self):
-        """Return the internal shape list."""
-        return self._shapeList
+        """
+        Return the shapes, bottommost first.
+
+        :note: Unlike wx.lib.ogl, this is not the internal shape list;  The
+         shapes are kept in a :class:`ShapeOrder` so that membership, insertion
+         and removal do not search a list.  The returned :class:`ShapeList` is a
+         copy that raises `TypeError` when changed;  Use :meth:`AddShape`,
+         :meth:`InsertShape`, :meth:`RemoveShape` or :meth:`SetShapeList`.
+        """
+        return ShapeList(self._shapes)
+
+    def SetShapeList(self, shapes):
+        """
+        Replace the shapes and their order.
+
+        :param `shapes`: a sequence of :class:`~lib.ogl.Shape`, bottommost first
+
+        """
+        self._shapes = ShapeOrder(shapes)
 
     def GetCount(self):
         """Return the number of shapes in the diagram."""
-        return len(self._shapeList)
+        return len(self._shapes)
+
+    def OnShapeGeometryChanged(self, shape):
+        """
+        Called by a shape when its position or extent changes.  The default
+        implementation does nothing; override it to maintain derived data
+        such as a spatial index.
+
+        :param `shape`: an instance of :class:`~lib.ogl.Shape`
+
+        """
+        pass
+
+    def InvalidateShape(self, shape):
+        """
+        Report the area covered by the shape as damaged on the canvas.
+
+        :param `shape`: an instance of :class:`~lib.ogl.Shape`
+
+        """
+        if self._diagramCanvas:
+            self._diagramCanvas.InvalidateShape(shape)
+
+    def GetCandidateShapes(self, x, y):
+        """
+        Return the shapes that may be hit at the given point, topmost first.
+        The default implementation returns every shape in the diagram.
+
+        :param `x`: the x position
+        :param `y`: the y position
+
+        """
+        return list(reversed(self._shapes))
@@ -20,6 +20,7 @@ import os.path
 
 from .basic import RectangleShape
 from .oglmisc import *
+from .pointarray import PointArray
 
 METAFLAGS_OUTLINE         = 1
 METAFLAGS_ATTACHMENTS     = 2
@@ -264,6 +265,7 @@ class OpPolyDraw(DrawOp):
 
         self._noPoints = len(thePoints)
         self._points = thePoints
+        self._pointArray = PointArray(thePoints)
 
     def Do(self, dc, xoffset, yoffset):
         if self._op == DRAWOP_DRAW_POLYLINE:
@@ -273,21 +275,16 @@ class OpPolyDraw(DrawOp):
         elif self._op == DRAWOP_DRAW_SPLINE:
             dc.DrawSpline(self._points) # no offsets in DrawSpline
 
+    # The point array keeps the float geometry;  The point list is what the
+    # dc draws, and the dc only takes integers
     def Scale(self, scaleX, scaleY):
-        for i in range(self._noPoints):
-            self._points[i] = wx.Point(self._points[i][0] * scaleX, self._points[i][1] * scaleY)
+        self._points = self._pointArray.Scale(scaleX, scaleY).ToIntList()
 
     def Translate(self, x, y):
-        for i in range(self._noPoints):
-            self._points[i][0] += x
-            self._points[i][1] += y
+        self._points = self._pointArray.Translate(x, y).ToIntList()
 
     def Rotate(self, x, y, theta, sinTheta, cosTheta):
-        for i in range(self._noPoints):
-            x1 = self._points[i][0]
-            y1 = self._points[i][1]
-
-            self._points[i] = x1 * cosTheta - y1 * sinTheta + x * (1 - cosTheta) + y * sinTheta, x1 * sinTheta + y1 * cosTheta + y * (1 - cosTheta) + x * sinTheta
+        self._points = self._pointArray.Rotate(x, y, sinTheta, cosTheta).ToIntList()
 
     def OnDrawOutline(self, dc, x, y, w, h, oldW, oldH):
         dc.SetBrush(wx.TRANSPARENT_BRUSH)
@@ -334,6 +334,12 @@ class LineShape(Shape):
         self._lineControlPoints = []
         self._arcArrows = []
 
+        # Memoized end points;  See FindLineEndPoints and OnMoveLink
+        self._endPointsKey = None
+        self._endPoints = None
+        self._movedLinkKey = None
+        self._movedLinkEnds = None
+
     def GetFrom(self):
         """Get the 'from' object."""
         return self._from
@@ -444,6 +450,7 @@ class LineShape(Shape):
 
         point = wx.Point(line_x, line_y)
         self._lineControlPoints.insert(len(self._lineControlPoints)-1, point)
+        self.Invalidate()
 
     def DeleteLineControlPoint(self):
         """Delete an arbitrary point on the line."""
@@ -451,6 +458,7 @@ class LineShape(Shape):
             return False
 
         del self._lineControlPoints[-2]
+        self.Invalidate()
         return True
 
     def Initialise(self):
@@ -643,6 +651,8 @@ class LineShape(Shape):
         for i in range(len(self._lineControlPoints) - 2):
             GraphicsStraightenLine(self._lineControlPoints[i], self._lineControlPoints[i + 1])
 
+        self.Invalidate()
+
         if dc:
             self.Draw(dc)
 
@@ -683,6 +693,8 @@ class LineShape(Shape):
         self._xpos = (x1 + x2) // 2
         self._ypos = (y1 + y2) // 2
 
+        self.Invalidate()
+
     # Get absolute positions of ends
     def GetEnds(self):
         """Get the visible endpoints of the lines for drawing between two objects."""
@@ -1011,6 +1023,28 @@ class LineShape(Shape):
 
         return x2 - x1, y2 - y1
 
+    def GetDamageRectangle(self):
+        """
+        Return the area, in logical coordinates, that the line may paint
+        on, including arrowheads and control points.
+        """
+        if not self._lineControlPoints:
+            return wx.Rect(int(self._xpos), int(self._ypos), 0, 0)
+
+        xs = [point[0] for point in self._lineControlPoints]
+        ys = [point[1] for point in self._lineControlPoints]
+
+        margin = CONTROL_POINT_SIZE + DAMAGE_MARGIN
+        for arrow in self._arcArrows:
+            margin = max(margin, int(math.ceil(arrow.GetSize())) + DAMAGE_MARGIN)
+
+        left = int(math.floor(min(xs))) - margin
+        top = int(math.floor(min(ys))) - margin
+        right = int(math.ceil(max(xs))) + margin
+        bottom = int(math.ceil(max(ys))) + margin
+
+        return wx.Rect(left, top, right - left, bottom - top)
+
     # For a node image of interest, finds the position of this arc
     # amongst all the arcs which are attached to THIS SIDE of the node image,
     # and the number of same.
@@ -1106,6 +1140,11 @@ class LineShape(Shape):
         if not self._from or not self._to:
             return
 
+        # Nothing this link depends on has changed since it was last moved
+        movedLinkKey = self._EndPointsKey()
+        if movedLinkKey is not None and movedLinkKey == self._movedLinkKey and self.GetEnds() == self._movedLinkEnds:
+            return
+
         # Do each end - nothing in the middle. User has to move other points
         # manually if necessary
         end_x, end_y, other_end_x, other_end_y = self.FindLineEndPoints()
@@ -1129,6 +1168,9 @@ class LineShape(Shape):
         end_x, end_y, other_end_x, other_end_y = self.FindLineEndPoints()
         self.SetEnds(end_x, end_y, other_end_x, other_end_y)
 
+        self._movedLinkKey = self._EndPointsKey()
+        self._movedLinkEnds = self.GetEnds()
+
         # Try to move control points with the arc
         x_offset = self._xpos - oldX
         y_offset = self._ypos - oldY
@@ -1149,10 +1191,59 @@ class LineShape(Shape):
         This function can be used by e.g. line-routing routines to
         get the actual points on the two node images where the lines will be
         drawn to / from.
+
+        The result is memoized on the geometry of the end shapes and on the
+        control points next to each end.
         """
         if not self._from or not self._to:
             return
 
+        endPointsKey = self._EndPointsKey()
+        if endPointsKey is not None and endPointsKey == self._endPointsKey:
+            return self._endPoints
+
+        self._endPoints = self._ComputeLineEndPoints()
+        self._endPointsKey = endPointsKey
+
+        return self._endPoints
+
+    def InvalidateEndPoints(self):
+        """
+        Forget the memoized end points;  An end shape calls this when its
+        position or size changes.
+        """
+        self._endPointsKey = None
+        self._endPoints = None
+        self._movedLinkKey = None
+        self._movedLinkEnds = None
+
+    def _EndPointsKey(self):
+        """
+        The inputs of :meth:`FindLineEndPoints`.
+
+        :returns: a hashable key, or `None` when the result is not memoized.
+         When an end shape uses attachment points the end points also depend
+         on the other lines attached to it, so that result is not memoized.
+        """
+        if self._from.GetAttachmentMode() != ATTACHMENT_MODE_NONE or self._to.GetAttachmentMode() != ATTACHMENT_MODE_NONE:
+            return None
+
+        if len(self._lineControlPoints) > 2 and self._initialised:
+            second_point = self._lineControlPoints[1]
+            second_last_point = self._lineControlPoints[-2]
+            route = (second_point[0], second_point[1], second_last_point[0], second_last_point[1])
+        else:
+            route = None
+
+        return self._EndShapeKey(self._from), self._EndShapeKey(self._to), route
+
+    @staticmethod
+    def _EndShapeKey(shape):
+        """The geometry of an end shape that its perimeter points depend on."""
+        return id(shape), shape._geometryVersion, shape.GetX(), shape.GetY(), shape.GetBoundingBoxMin(), shape.GetRotation()
+
+    def _ComputeLineEndPoints(self):
+        """Computes what :meth:`FindLineEndPoints` returns."""
         # Do each end - nothing in the middle. User has to move other points
         # manually if necessary.
         second_point = self._lineControlPoints[1]
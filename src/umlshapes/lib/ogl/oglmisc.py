@@ -19,6 +19,8 @@ import math
 
 import wx
 
+from umlshapes.utils.TextExtentCache import TextExtentCache
+
 # Control point types
 # Rectangle and most other shapes
 CONTROL_POINT_VERTICAL = 1
@@ -54,6 +56,9 @@ OGLRBLF = wx.INVERT
 
 CONTROL_POINT_SIZE = 6
 
+# allowance for pen width and anti-aliasing when computing damaged areas
+DAMAGE_MARGIN = 4
+
 # Types of arrowhead
 # (i) Built-in
 ARROW_HOLLOW_CIRCLE   = 1
@@ -144,29 +149,41 @@ def FormatText(dc, text, width, height, formatMode):
             word_list.append(None)
             new_line = False
 
-    # Now, make a list of strings which can fit in the box
+    # Now, make a list of strings which can fit in the box.  Measure each
+    # word and the space once and add the widths up;  Measuring the growing
+    # buffer would only fill the cache with strings never seen again
+    extents = TextExtentCache()
+    space_width = extents.textWidth(dc, " ")
     string_list = []
     buffer = ""
+    buffer_width = 0
     for s in word_list:
-        oldBuffer = buffer
         if s is None:
             # FORCE NEW LINE
             if len(buffer) > 0:
                 string_list.append(buffer)
             buffer = ""
+            buffer_width = 0
         else:
+            word_width = extents.textWidth(dc, s)
             if len(buffer):
-                buffer += " "
-            buffer += s
-            x, y = dc.GetTextExtent(buffer)
+                x = buffer_width + space_width + word_width
+            else:
+                x = word_width
 
             # Don't fit within the bounding box if we're fitting
             # shape to contents
             if (x > width) and not (formatMode & FORMAT_SIZE_TO_CONTENTS):
                 # Deal with first word being wider than box
-                if len(oldBuffer):
-                    string_list.append(oldBuffer)
+                if len(buffer):
+                    string_list.append(buffer)
                 buffer = s
+                buffer_width = word_width
+            else:
+                if len(buffer):
+                    buffer += " "
+                buffer += s
+                buffer_width = x
     if len(buffer):
         string_list.append(buffer)
 
@@ -190,9 +207,10 @@ def GetCentredTextExtent(dc, text_list, xpos=0, ypos=0, width=0, height=0):
     if not text_list:
         return 0, 0
 
+    extents = TextExtentCache()
     max_width = 0
     for line in text_list:
-        current_width, char_height = dc.GetTextExtent(line.GetText())
+        current_width, char_height = extents.textExtent(dc, line.GetText())
         if current_width > max_width:
             max_width = current_width
 
@@ -230,9 +248,10 @@ def CentreText(dc, text_list, xpos, ypos, width, height, formatMode):
     current_width = 0
 
     # Store text extents for speed
+    extents = TextExtentCache()
     widths = []
     for line in text_list:
-        current_width, char_height = dc.GetTextExtent(line.GetText())
+        current_width, char_height = extents.textExtent(dc, line.GetText())
         widths.append(current_width)
         if current_width > max_width:
             max_width = current_width
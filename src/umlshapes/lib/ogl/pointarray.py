@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+The :class:`~lib.ogl.pointarray.PointArray` class.
+
+NumPy is optional.  When it is installed the points of polygons and drawn
+shapes are scaled, translated and rotated with one vectorized operation;
+otherwise the same operations loop in Python and give the same results.
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def HasNumPy():
+    """Return `True` if the point arrays are backed by NumPy."""
+    return numpy is not None
+
+
+class PointArray(object):
+    """
+    The :class:`PointArray` class keeps a list of (x, y) points as one block
+    of floats, so that a whole shape is transformed at once.
+    """
+    def __init__(self, points = ()):
+        """
+        Default class constructor
+
+        :param `points`: a sequence of :class:`wx.Point`, :class:`wx.RealPoint` or tuples
+
+        """
+        if numpy is not None:
+            self._array = numpy.array([(point[0], point[1]) for point in points], dtype = float).reshape(-1, 2)
+        else:
+            self._xs = [float(point[0]) for point in points]
+            self._ys = [float(point[1]) for point in points]
+
+    def __len__(self):
+        if numpy is not None:
+            return len(self._array)
+        return len(self._xs)
+
+    def Copy(self):
+        """Return an independent copy of the points."""
+        copy = PointArray()
+        if numpy is not None:
+            copy._array = self._array.copy()
+        else:
+            copy._xs = self._xs[:]
+            copy._ys = self._ys[:]
+        return copy
+
+    def Scale(self, scaleX, scaleY):
+        """
+        Scale the points about the origin.
+
+        :param `scaleX`: the x scale
+        :param `scaleY`: the y scale
+
+        :returns: this point array
+
+        """
+        if numpy is not None:
+            self._array *= (scaleX, scaleY)
+        else:
+            self._xs = [x * scaleX for x in self._xs]
+            self._ys = [y * scaleY for y in self._ys]
+        return self
+
+    def Translate(self, x, y):
+        """
+        Move the points.
+
+        :param `x`: added to each x
+        :param `y`: added to each y
+
+        :returns: this point array
+
+        """
+        if numpy is not None:
+            self._array += (x, y)
+        else:
+            self._xs = [x1 + x for x1 in self._xs]
+            self._ys = [y1 + y for y1 in self._ys]
+        return self
+
+    def Rotate(self, x, y, sinTheta, cosTheta):
+        """
+        Rotate the points about (x, y) with the formula the polygon and drawn
+        shapes have always used.
+
+        :param `x`: the x position of the axis
+        :param `y`: the y position of the axis
+        :param `sinTheta`: the sine of the angle, computed once by the caller
+        :param `cosTheta`: the cosine of the angle, computed once by the caller
+
+        :returns: this point array
+
+        """
+        offsetX = x * (1 - cosTheta) + y * sinTheta
+        offsetY = y * (1 - cosTheta) + x * sinTheta
+
+        if numpy is not None:
+            xs = self._array[:, 0].copy()
+            ys = self._array[:, 1]
+            self._array[:, 0] = xs * cosTheta - ys * sinTheta + offsetX
+            self._array[:, 1] = xs * sinTheta + ys * cosTheta + offsetY
+        else:
+            xs = self._xs
+            ys = self._ys
+            self._xs = [x1 * cosTheta - y1 * sinTheta + offsetX for x1, y1 in zip(xs, ys)]
+            self._ys = [x1 * sinTheta + y1 * cosTheta + offsetY for x1, y1 in zip(xs, ys)]
+        return self
+
+    def ToList(self):
+        """Return the points as a list of (x, y) float tuples."""
+        if numpy is not None:
+            return list(map(tuple, self._array.tolist()))
+        return list(zip(self._xs, self._ys))
+
+    def ToIntList(self):
+        """Return the points as a list of (x, y) tuples truncated to integers, as `int()` does."""
+        if numpy is not None:
+            return list(map(tuple, self._array.astype(int).tolist()))
+        return [(int(x), int(y)) for x, y in zip(self._xs, self._ys)]
+
+    def __repr__(self):
+        return "<%s.%s points: %d>" % (self.__class__.__module__, self.__class__.__name__, len(self))
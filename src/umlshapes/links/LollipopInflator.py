@@ -36,8 +36,8 @@ class LollipopInflator:
 
         startCoordinates:     UmlPosition = lollipopCoordinates.startCoordinates
         endCoordinates:       UmlPosition = lollipopCoordinates.endCoordinates
-        hitAreaInflationRate: int         = LollipopInflator.clsPreferences.hitAreaInflationRate
-        lollipopCircleRadius: int         = LollipopInflator.clsPreferences.lollipopCircleRadius
+        hitAreaInflationRate: int         = LollipopInflator.clsPreferences.snapshot.hitAreaInflationRate
+        lollipopCircleRadius: int         = LollipopInflator.clsPreferences.snapshot.lollipopCircleRadius
 
         if attachmentSide == AttachmentSide.BOTTOM:
 
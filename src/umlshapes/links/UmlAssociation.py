@@ -143,7 +143,7 @@ class UmlAssociation(UmlLink):
 
         super().OnDraw(dc=dc)
 
-        if self._preferences.drawLabelMarker is True:
+        if self._preferences.snapshot.drawLabelMarker is True:
             labelX, labelY = self.GetLabelPosition(NAME_IDX)
 
             savePen: Pen = dc.GetPen()
@@ -160,7 +160,7 @@ class UmlAssociation(UmlLink):
         """
 
         oldSourcePosition:         UmlPosition = umlLinkLabel.position
-        associationLabelOffsetFix: int         = self._preferences.associationLabelOffsetFix
+        associationLabelOffsetFix: int         = self._preferences.snapshot.associationLabelOffsetFix
         newSourceCardinalityPosition: UmlPosition = UmlPosition(x=oldSourcePosition.x, y=oldSourcePosition.y - associationLabelOffsetFix)
         umlLinkLabel.position = newSourceCardinalityPosition
 
@@ -102,6 +102,7 @@ class UmlLink(IdentifierMixin, LineShape, PubSubMixin):
     @modelLink.setter
     def modelLink(self, link: Link):
         self._link = link
+        self._modelChanged()
 
     @property
     def linkName(self) -> UmlLinkLabel:
@@ -271,7 +272,7 @@ class UmlLink(IdentifierMixin, LineShape, PubSubMixin):
 
         """
 
-        umlControlPointSize: int = self._preferences.controlPointSize
+        umlControlPointSize: int = self._preferences.snapshot.controlPointSize
 
         control = UmlLineControlPoint(
             umlFrame=self._canvas,
@@ -292,7 +293,8 @@ class UmlLink(IdentifierMixin, LineShape, PubSubMixin):
             umlLineControlPoint: The victim
 
         """
-        self._canvas.AddShape(umlLineControlPoint)
+        # The handle is drawn and hit tested by the frame overlay, not the diagram
+        self._canvas.selectionHandles.add(umlLineControlPoint)
         self._controlPoints.append(umlLineControlPoint)
         self._addEventHandler(umlLineControlPoint=umlLineControlPoint)
 
@@ -13,11 +13,14 @@ from wx import RED_PEN
 from wx import WHITE_BRUSH
 from wx import Font
 from wx import MemoryDC
+from wx import Rect
 from wx import Size
 
 from umlmodel.Interface import Interface
 
 from umlshapes.utils.ResourceUtils import ResourceUtils
+from umlshapes.utils.TextExtentCache import TextExtent
+from umlshapes.utils.TextExtentCache import TextExtentCache
 from umlshapes.lib.ogl import Shape
 
 from umlshapes.mixins.IDMixin import IDMixin
@@ -76,7 +79,15 @@ class UmlLollipopInterface(Shape, IDMixin):
 
     @modelInterface.setter
     def modelInterface(self, interface: Interface):
+        from umlshapes.UmlDiagram import UmlDiagram
+
         self._modelInterface = interface
+        #
+        # Keep the diagram's model identifier index honest
+        #
+        canvas = self.GetCanvas()
+        if canvas is not None and isinstance(canvas.GetDiagram(), UmlDiagram):
+            canvas.GetDiagram().shapeModelChanged(shape=self)
 
     @property
     def attachedTo(self) -> 'UmlClass':
@@ -84,7 +95,15 @@ class UmlLollipopInterface(Shape, IDMixin):
 
     @attachedTo.setter
     def attachedTo(self, umlClass: 'UmlClass'):
+        from umlshapes.UmlDiagram import UmlDiagram
+
         self._attachedTo = umlClass
+        #
+        # Keep the diagram's lollipop attachment index honest
+        #
+        canvas = self.GetCanvas()
+        if canvas is not None and isinstance(canvas.GetDiagram(), UmlDiagram):
+            canvas.GetDiagram().lollipopAttachmentChanged(shape=self)
 
     @property
     def lineCentum(self) -> float:
@@ -135,9 +154,9 @@ class UmlLollipopInterface(Shape, IDMixin):
         dc.DrawLine(x1=lollipopCoordinates.startCoordinates.x, y1=lollipopCoordinates.startCoordinates.y,
                     x2=lollipopCoordinates.endCoordinates.x,   y2=lollipopCoordinates.endCoordinates.y)
 
-        dc.DrawCircle(lollipopCoordinates.endCoordinates.x, lollipopCoordinates.endCoordinates.y, self._preferences.lollipopCircleRadius)
+        dc.DrawCircle(lollipopCoordinates.endCoordinates.x, lollipopCoordinates.endCoordinates.y, self._preferences.snapshot.lollipopCircleRadius)
 
-        extentSize: Size = dc.GetTextExtent(self.modelInterface.name)
+        extentSize: TextExtent = TextExtentCache().textExtent(dc=dc, text=self.modelInterface.name)
 
         interfaceNamePosition: UmlPosition = self._determineInterfaceNamePosition(
             start=lollipopCoordinates.startCoordinates,
@@ -147,6 +166,29 @@ class UmlLollipopInterface(Shape, IDMixin):
         )
         dc.DrawText(self.modelInterface.name, interfaceNamePosition.x, interfaceNamePosition.y)
 
+    def GetDamageRectangle(self) -> Rect:
+        """
+        Override base behavior;  We paint around the side of the class we are
+        attached to, not inside our own bounding box
+
+        Returns:  The area we may paint on
+        """
+        if self._attachedTo is None:
+            return super().GetDamageRectangle()
+
+        reach: int = (
+            self._preferences.snapshot.lollipopLineLength +
+            (self._preferences.snapshot.lollipopCircleRadius * 2) +
+            self._preferences.snapshot.interfaceNameIndent +
+            (self._pixelSize.height * 2)
+        )
+        nameWidth: int = max(self._pixelSize.width, self._pixelSize.height) * len(self._modelInterface.name)
+
+        rectangle: Rect = Rect(self._attachedTo.GetDamageRectangle())
+        rectangle.Inflate(reach + nameWidth, reach)
+
+        return rectangle
+
     def HitTest(self, x, y):
         """
         Override base behavior
@@ -192,7 +234,7 @@ class UmlLollipopInterface(Shape, IDMixin):
         width: int = rectangle.right - rectangle.left
         x:     int = round(width * self.lineCentum) + rectangle.left
 
-        lollipopLineLength: int = self._preferences.lollipopLineLength
+        lollipopLineLength: int = self._preferences.snapshot.lollipopLineLength
 
         if self.attachmentSide == AttachmentSide.BOTTOM:
             startCoordinates: UmlPosition = UmlPosition(x=x, y=rectangle.bottom)
@@ -214,7 +256,7 @@ class UmlLollipopInterface(Shape, IDMixin):
         height: int = rectangle.bottom - rectangle.top
         y:      int = round(height * self.lineCentum) + rectangle.top
 
-        lollipopLineLength: int = self._preferences.lollipopLineLength
+        lollipopLineLength: int = self._preferences.snapshot.lollipopLineLength
 
         if self.attachmentSide == AttachmentSide.LEFT:
             startCoordinates: UmlPosition = UmlPosition(x=rectangle.left, y=y)
@@ -225,7 +267,7 @@ class UmlLollipopInterface(Shape, IDMixin):
 
         return LollipopCoordinates(startCoordinates=startCoordinates, endCoordinates=endCoordinates)
 
-    def _determineInterfaceNamePosition(self, start: UmlPosition, side: AttachmentSide, pixelSize: Size, textSize: Size) -> UmlPosition:
+    def _determineInterfaceNamePosition(self, start: UmlPosition, side: AttachmentSide, pixelSize: Size, textSize: TextExtent) -> UmlPosition:
 
         oglPosition:     UmlPosition    = UmlPosition()
 
@@ -235,9 +277,9 @@ class UmlLollipopInterface(Shape, IDMixin):
         fHeight: int = pixelSize.height
         tWidth:  int = textSize.width
 
-        lollipopLineLength:   int = self._preferences.lollipopLineLength
-        lollipopCircleRadius: int = self._preferences.lollipopCircleRadius
-        interfaceNameIndent:  int = self._preferences.interfaceNameIndent
+        lollipopLineLength:   int = self._preferences.snapshot.lollipopLineLength
+        lollipopCircleRadius: int = self._preferences.snapshot.lollipopCircleRadius
+        interfaceNameIndent:  int = self._preferences.snapshot.interfaceNameIndent
 
         if side == AttachmentSide.TOP:
             y -= (lollipopLineLength + (lollipopCircleRadius * 2) + interfaceNameIndent)
@@ -254,7 +296,7 @@ class UmlLollipopInterface(Shape, IDMixin):
         elif side == AttachmentSide.LEFT:
             y = y - (fHeight * 2)
             originalX: int = x
-            x = x - lollipopLineLength - round((tWidth * self._preferences.horizontalOffset))
+            x = x - lollipopLineLength - round((tWidth * self._preferences.snapshot.horizontalOffset))
             while x + tWidth > originalX:
                 x -= interfaceNameIndent
             oglPosition.x = x
@@ -262,7 +304,7 @@ class UmlLollipopInterface(Shape, IDMixin):
 
         elif side == AttachmentSide.RIGHT:
             y = y - (fHeight * 2)
-            x = x + round(lollipopLineLength * self._preferences.horizontalOffset)
+            x = x + round(lollipopLineLength * self._preferences.snapshot.horizontalOffset)
             oglPosition.x = x
             oglPosition.y = y
         else:
@@ -12,7 +12,6 @@ from umlshapes.lib.ogl import Shape
 from umlshapes.preferences.UmlPreferences import UmlPreferences
 
 from umlshapes.shapes.UmlControlPoint import UmlControlPoint
-from umlshapes.shapes.eventhandlers.UmlControlPointEventHandler import UmlControlPointEventHandler
 
 if TYPE_CHECKING:
     from umlshapes.frames.UmlFrame import UmlFrame
@@ -52,7 +51,7 @@ class ControlPointMixin:
         canvas: 'UmlFrame' = self._shape.GetCanvas()
         assert isinstance(canvas, UmlFrame), 'I only support this'
 
-        umlControlPointSize: int = self._preferences.controlPointSize
+        umlControlPointSize: int = self._preferences.snapshot.controlPointSize
 
         if isinstance(self._shape, CircleShape) is True or isinstance(self._shape, EllipseShape):
             self._makeOrthogonalControlPoints(canvas=canvas, top=top, right=right, bottom=bottom, left=left)
@@ -88,7 +87,7 @@ class ControlPointMixin:
 
     def _makeOrthogonalControlPoints(self, canvas: 'UmlFrame', top: int, right: int, bottom: int, left: int):
 
-        umlControlPointSize: int = self._preferences.controlPointSize
+        umlControlPointSize: int = self._preferences.snapshot.controlPointSize
 
         control = UmlControlPoint(canvas, self._shape, umlControlPointSize, 0, top, CONTROL_POINT_VERTICAL)
         self._setupControlPoint(umlControlPoint=control)
@@ -104,7 +103,7 @@ class ControlPointMixin:
 
     def _makeDiagonalControlPoints(self, canvas: 'UmlFrame', top: int, right: int, bottom: int, left: int):
 
-        umlControlPointSize: int = self._preferences.controlPointSize
+        umlControlPointSize: int = self._preferences.snapshot.controlPointSize
 
         control: UmlControlPoint = UmlControlPoint(canvas, self._shape, umlControlPointSize, left, top, CONTROL_POINT_DIAGONAL)
         self._setupControlPoint(umlControlPoint=control)
@@ -124,16 +123,8 @@ class ControlPointMixin:
 
         # This is dangerous if the returned type changes
         self._shape.GetChildren().append(umlControlPoint)
-        self._shape.GetCanvas().AddShape(umlControlPoint)
+        # The handle is drawn and hit tested by the frame overlay, not the diagram
+        self._shape.GetCanvas().selectionHandles.add(umlControlPoint)
         # This is dangerous, accessing internal stuff
         # noinspection PyProtectedMember
         self._shape._controlPoints.append(umlControlPoint)
-        self._addEventHandler(umlControlPoint=umlControlPoint)
-
-    def _addEventHandler(self, umlControlPoint: UmlControlPoint):
-
-        eventHandler: UmlControlPointEventHandler = UmlControlPointEventHandler()
-        eventHandler.SetShape(umlControlPoint)
-        eventHandler.SetPreviousHandler(umlControlPoint.GetEventHandler())
-
-        umlControlPoint.SetEventHandler(eventHandler)
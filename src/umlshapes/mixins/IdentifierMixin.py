@@ -32,7 +32,36 @@ class IdentifierMixin:
 
     @id.setter
     def id(self, newValue: str):
+
+        oldValue: str = self._identifier
         self._identifier = newValue
+        #
+        # Keep the diagram's identifier index honest
+        #
+        umlDiagram = self._umlDiagram()
+        if umlDiagram is not None:
+            umlDiagram.shapeIdentifierChanged(shape=self, oldId=oldValue)
+
+    def _modelChanged(self):
+        """
+        Shapes call this after they are given a different data model;  Keeps the
+        diagram's model identifier index honest
+        """
+        umlDiagram = self._umlDiagram()
+        if umlDiagram is not None:
+            umlDiagram.shapeModelChanged(shape=self)
+
+    def _umlDiagram(self):
+        """
+        Returns:  The UmlDiagram the shape's canvas displays;  `None` if the shape is not on one
+        """
+        from umlshapes.UmlDiagram import UmlDiagram
+
+        canvas = getattr(self, '_canvas', None)
+        if canvas is not None and isinstance(canvas.GetDiagram(), UmlDiagram):
+            return canvas.GetDiagram()
+
+        return None
 
     def __eq__(self, other):
 
@@ -63,6 +63,28 @@ class TopLeftMixin:
 
         return rect
 
+    def isInsideRectangle(self, rectangle: Rectangle) -> bool:
+        """
+        Same answer as checking every vertex of `rectangle` property against the bounding
+        rectangle, but does the arithmetic in place;  Rubber band selection asks every
+        shape in the selector
+
+        Args:
+            rectangle:  The bounding rectangle
+
+        Returns:  `True` if the bounding rectangle fully contains the shape
+        """
+        width:  int = self._size.GetWidth()
+        height: int = self._size.GetHeight()
+
+        left: int = round(self._shape.GetX() - (width // 2))
+        top:  int = round(self._shape.GetY() - (height // 2))
+
+        return (
+            rectangle.left <= left and left + width  <= rectangle.right and
+            rectangle.top  <= top  and top  + height <= rectangle.bottom
+        )
+
     @property
     def topLeft(self) -> UmlPosition:
         """
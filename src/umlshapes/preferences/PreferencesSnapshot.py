@@ -0,0 +1,36 @@
+
+from typing import Any
+from typing import Dict
+
+
+class ImmutablePreferencesError(Exception):
+    pass
+
+
+class PreferencesSnapshot:
+    """
+    The value of every preference at one point in time, already deserialized.
+
+    Reading a preference from `UmlPreferences` looks up its section and runs its
+    deserializer on every access;  Reading it from a snapshot is a plain attribute
+    access.  Snapshots never change;  `UmlPreferences.snapshot` hands out a new one
+    after a preference is written.  The attribute types are in the stub file.
+    """
+    def __init__(self, values: Dict[str, Any], generation: int):
+        """
+
+        Args:
+            values:      The deserialized preference values by preference name
+            generation:  Increases each time a preference changes
+        """
+        self.__dict__.update(values)
+        self.__dict__['generation'] = generation
+
+    def __setattr__(self, key: str, value: Any):
+        raise ImmutablePreferencesError(f'Write `{key}` via UmlPreferences;  Snapshots are read only')
+
+    def __delattr__(self, key: str):
+        raise ImmutablePreferencesError(f'Cannot delete `{key}`;  Snapshots are read only')
+
+    def __str__(self) -> str:
+        return f'PreferencesSnapshot - generation: {self.__dict__["generation"]}'
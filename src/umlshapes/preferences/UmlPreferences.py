@@ -1,7 +1,19 @@
 
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import NewType
+from typing import Optional
+
 from logging import Logger
 from logging import getLogger
 
+from inspect import ismethod
+
+from weakref import WeakMethod
+
 from codeallybasic.Position import Position
 from codeallybasic.Dimensions import Dimensions
 from codeallybasic.SingletonV3 import SingletonV3
@@ -18,10 +30,13 @@ from umlshapes.types.UmlPenStyle import UmlPenStyle
 from umlshapes.types.UmlPosition import UmlPosition
 from umlshapes.types.WiggleFactor import WiggleFactor
 from umlshapes.types.UmlDimensions import UmlDimensions
+from umlshapes.types.IDStrategy import IDStrategy
 from umlshapes.types.UmlFontFamily import UmlFontFamily
 
 from umlshapes.links.UmlAssociationLabelFormat import UmlAssociationLabelFormat
 
+from umlshapes.preferences.PreferencesSnapshot import PreferencesSnapshot
+
 from codeallybasic.DynamicConfiguration import DynamicConfiguration
 from codeallybasic.DynamicConfiguration import KeyName
 from codeallybasic.DynamicConfiguration import SectionName
@@ -33,6 +48,10 @@ from codeallybasic.DynamicConfiguration import ValueDescriptions
 MODULE_NAME:           str = 'umlshapes'
 PREFERENCES_FILE_NAME: str = f'{MODULE_NAME}.ini'
 
+PreferenceListener  = Callable[[str], None]
+ListenerReference   = Callable[[], Optional[PreferenceListener]]
+PreferenceListeners = NewType('PreferenceListeners', List[ListenerReference])
+
 DEFAULT_BACKGROUND_COLOR:           str = UmlColor.WHITE.value
 DEFAULT_DARK_MODE_BACKGROUND_COLOR: str = UmlColor.DIM_GREY.value
 
@@ -78,6 +97,7 @@ UML_SHAPE_PREFERENCES: ValueDescriptions = ValueDescriptions(
         KeyName('classBackGroundColor'): ValueDescription(defaultValue=DEFAULT_CLASS_BACKGROUND_COLOR, enumUseValue=True, deserializer=UmlColor),
         KeyName('classTextColor'):       ValueDescription(defaultValue=DEFAULT_CLASS_TEXT_COLOR,       enumUseValue=True, deserializer=UmlColor),
         KeyName('classTextMargin'):      ValueDescription(defaultValue='10',                        deserializer=SecureConversions.secureInteger),
+        KeyName('classRenderCache'):     ValueDescription(defaultValue='False',                     deserializer=SecureConversions.secureBoolean),
         KeyName('actorSize'):            ValueDescription(defaultValue=DEFAULT_ACTOR_SIZE,          deserializer=UmlDimensions.deSerialize),
 
         KeyName('autoSizeHeightAdjustment'): ValueDescription(defaultValue='0.20', deserializer=SecureConversions.secureFloat),
@@ -104,6 +124,12 @@ DIAGRAM_PREFERENCES: ValueDescriptions = ValueDescriptions(
         KeyName('darkModeBackGroundColor'): ValueDescription(defaultValue=DEFAULT_DARK_MODE_BACKGROUND_COLOR, enumUseValue=True, deserializer=UmlColor),
         KeyName('gridLineColor'):           ValueDescription(defaultValue=DEFAULT_GRID_LINE_COLOR, enumUseValue=True, deserializer=UmlColor),
         KeyName('darkModeGridLineColor'):   ValueDescription(defaultValue=DEFAULT_DARK_MODE_GRID_LINE_COLOR, enumUseValue=True, deserializer=UmlColor),
+
+        KeyName('undoHistoryMaxEntries'):   ValueDescription(defaultValue='200',      deserializer=SecureConversions.secureInteger),
+        KeyName('undoHistoryMaxBytes'):     ValueDescription(defaultValue='16777216', deserializer=SecureConversions.secureInteger),
+        KeyName('coalesceShapeMoves'):      ValueDescription(defaultValue='True',     deserializer=SecureConversions.secureBoolean),
+
+        KeyName('idStrategy'):              ValueDescription(defaultValue=IDStrategy.HUMAN_READABLE.value, enumUseValue=True, deserializer=IDStrategy),
     }
 )
 
@@ -179,10 +205,85 @@ sections: Sections = Sections(
     }
 )
 
+#
+# The preference names;  Writing any other attribute does not change a preference
+#
+PREFERENCE_NAMES: FrozenSet[str] = frozenset(
+    keyName for valueDescriptions in sections.values() for keyName in valueDescriptions.keys()
+)
 
-class UmlPreferences(DynamicConfiguration, metaclass=SingletonV3):
 
+class UmlPreferences(DynamicConfiguration, metaclass=SingletonV3):
+    """
+    Hot paths should read preferences from the `snapshot`;  It is rebuilt only after a
+    preference is written.  Code that caches something derived from a preference
+    subscribes to hear about the change.  Bound methods are held weakly, so
+    subscribing does not keep a shape alive.
+    """
     def __init__(self):
         self._logger: Logger = getLogger(__name__)
 
+        self._snapshot:   Optional[PreferencesSnapshot] = None
+        self._generation: int                           = 0
+        self._listeners:  PreferenceListeners           = PreferenceListeners([])
+
         super().__init__(baseFileName=f'{PREFERENCES_FILE_NAME}', moduleName=MODULE_NAME, sections=sections)
+
+    @property
+    def snapshot(self) -> PreferencesSnapshot:
+        """
+        Returns:  The current value of every preference
+        """
+        if self._snapshot is None:
+            self._snapshot = self._createSnapshot()
+
+        return self._snapshot
+
+    def subscribe(self, listener: PreferenceListener):
+        """
+        Args:
+            listener:  Called with the preference name after a preference is written
+        """
+        if ismethod(listener) is True:
+            self._listeners.append(WeakMethod(listener))        # type: ignore
+        else:
+            self._listeners.append(lambda: listener)
+
+    def unsubscribe(self, listener: PreferenceListener):
+
+        self._listeners = PreferenceListeners([reference for reference in self._listeners if reference() != listener])
+
+    def __setattr__(self, key: str, value: Any):
+        """
+        Write through, then retire the current snapshot and tell the subscribers
+
+        Args:
+            key:    The preference name
+            value:  Its new value
+        """
+        super().__setattr__(key, value)
+
+        if key in PREFERENCE_NAMES:
+            self._snapshot    = None
+            self._generation += 1
+            self._notify(preferenceName=key)
+
+    def _createSnapshot(self) -> PreferencesSnapshot:
+
+        values: Dict[str, Any] = {}
+        for valueDescriptions in sections.values():
+            for keyName in valueDescriptions.keys():
+                values[keyName] = getattr(self, keyName)
+
+        return PreferencesSnapshot(values=values, generation=self._generation)
+
+    def _notify(self, preferenceName: str):
+
+        liveListeners: PreferenceListeners = PreferenceListeners([])
+        for reference in self._listeners:
+            listener: Optional[PreferenceListener] = reference()
+            if listener is not None:
+                liveListeners.append(reference)
+                listener(preferenceName)
+
+        self._listeners = liveListeners
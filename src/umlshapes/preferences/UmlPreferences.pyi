@@ -1,8 +1,13 @@
 
+from typing import Callable
+
 from codeallybasic.Dimensions import Dimensions
 from codeallybasic.Position import Position
 
+from umlshapes.preferences.PreferencesSnapshot import PreferencesSnapshot
+
 from umlshapes.types.DeltaXY import DeltaXY
+from umlshapes.types.IDStrategy import IDStrategy
 from umlshapes.types.UmlColor import UmlColor
 from umlshapes.types.UmlDimensions import UmlDimensions
 from umlshapes.types.UmlFontFamily import UmlFontFamily
@@ -10,8 +15,15 @@ from umlshapes.types.UmlPenStyle import UmlPenStyle
 from umlshapes.types.UmlPosition import UmlPosition
 from umlshapes.types.WiggleFactor import WiggleFactor
 
+PreferenceListener = Callable[[str], None]
+
 
 class UmlPreferences:
+    @property
+    def snapshot(self) -> PreferencesSnapshot: ...
+    def subscribe(self, listener: PreferenceListener) -> None: ...
+    def unsubscribe(self, listener: PreferenceListener) -> None: ...
+
     textValue: str
     noteText: str
     noteDimensions: UmlDimensions
@@ -28,6 +40,7 @@ class UmlPreferences:
     classBackGroundColor: UmlColor
     classTextColor: UmlColor
     classTextMargin: int
+    classRenderCache: bool
     actorSize: UmlDimensions
     autoSizeHeightAdjustment: float
     autoSizeWidthAdjustment: float
@@ -48,6 +61,10 @@ class UmlPreferences:
     darkModeBackGroundColor: UmlColor
     gridLineColor: UmlColor
     darkModeGridLineColor: UmlColor
+    undoHistoryMaxEntries: int
+    undoHistoryMaxBytes: int
+    coalesceShapeMoves: bool
+    idStrategy: IDStrategy
     defaultClassName: str
     defaultNameInterface: str
     defaultNameUsecase: str
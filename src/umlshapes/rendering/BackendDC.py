@@ -0,0 +1,271 @@
+
+from typing import Iterable
+from typing import Sequence
+
+from logging import Logger
+from logging import getLogger
+
+from math import atan2
+from math import degrees
+from math import hypot
+
+from wx import BLACK
+from wx import BLACK_PEN
+from wx import NORMAL_FONT
+from wx import WHITE_BRUSH
+
+from wx import Bitmap
+from wx import Brush
+from wx import Colour
+from wx import Font
+from wx import Pen
+from wx import Rect
+
+from umlshapes.rendering.IDrawingBackend import BackendPoints
+from umlshapes.rendering.IDrawingBackend import IDrawingBackend
+from umlshapes.rendering.IDrawingBackend import TextExtent
+
+
+class BackendDC:
+    """
+    Looks enough like a wx device context for the shapes to draw on a drawing backend.
+
+    The shapes, the links and the ogl library draw with the wx DC methods, positionally,
+    by keyword, or with wx.Point and wx.Rect arguments.  This adapter takes the calls
+    they make and forwards them to the backend, so a new output format only implements
+    `IDrawingBackend`.
+
+    Raster operations have no vector equivalent;  Logical functions, background modes
+    and blits are ignored.
+    """
+    def __init__(self, backend: IDrawingBackend):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._backend: IDrawingBackend = backend
+
+        self._pen:            Pen    = BLACK_PEN
+        self._brush:          Brush  = WHITE_BRUSH
+        self._font:           Font   = NORMAL_FONT
+        self._textForeground: Colour = BLACK
+        self._textBackground: Colour = BLACK
+        self._background:     Brush  = WHITE_BRUSH
+
+        self._backend.setPen(self._pen)
+        self._backend.setBrush(self._brush)
+        self._backend.setFont(self._font)
+        self._backend.setTextForeground(self._textForeground)
+
+    @property
+    def backend(self) -> IDrawingBackend:
+        return self._backend
+
+    # noinspection PyPep8Naming
+    def SetPen(self, pen: Pen):
+        self._pen = pen
+        self._backend.setPen(pen)
+
+    # noinspection PyPep8Naming
+    def GetPen(self) -> Pen:
+        return self._pen
+
+    # noinspection PyPep8Naming
+    def SetBrush(self, brush: Brush):
+        self._brush = brush
+        self._backend.setBrush(brush)
+
+    # noinspection PyPep8Naming
+    def GetBrush(self) -> Brush:
+        return self._brush
+
+    # noinspection PyPep8Naming
+    def SetFont(self, font: Font):
+        self._font = font
+        self._backend.setFont(font)
+
+    # noinspection PyPep8Naming
+    def GetFont(self) -> Font:
+        return self._font
+
+    # noinspection PyPep8Naming
+    def SetTextForeground(self, colour: Colour):
+        self._textForeground = colour
+        self._backend.setTextForeground(colour)
+
+    # noinspection PyPep8Naming
+    def GetTextForeground(self) -> Colour:
+        return self._textForeground
+
+    # noinspection PyPep8Naming
+    def SetTextBackground(self, colour: Colour):
+        self._textBackground = colour
+
+    # noinspection PyPep8Naming
+    def SetBackground(self, brush: Brush):
+        self._background = brush
+
+    # noinspection PyPep8Naming
+    def SetBackgroundMode(self, mode: int):
+        pass
+
+    # noinspection PyPep8Naming
+    def SetLogicalFunction(self, function: int):
+        pass
+
+    # noinspection PyPep8Naming
+    def Clear(self):
+        pass
+
+    # noinspection PyPep8Naming
+    def Blit(self, *args, **kwargs) -> bool:
+        self.logger.debug('Blit ignored')
+        return False
+
+    # noinspection PyPep8Naming
+    def LogicalToDeviceX(self, x: int) -> int:
+        return x
+
+    # noinspection PyPep8Naming
+    def LogicalToDeviceY(self, y: int) -> int:
+        return y
+
+    # noinspection PyPep8Naming
+    def GetTextExtent(self, text: str) -> TextExtent:
+        return self._backend.textExtent(text)
+
+    # noinspection PyPep8Naming
+    def GetCharHeight(self) -> int:
+        return self._backend.textExtent('X')[1]
+
+    # noinspection PyPep8Naming
+    def DrawLine(self, x1=None, y1=None, x2=None, y2=None, pt1=None, pt2=None):
+        """
+        DrawLine(x1, y1, x2, y2) or DrawLine(pt1, pt2)
+        """
+        if x2 is None and y2 is None:
+            pt1 = x1 if pt1 is None else pt1
+            pt2 = y1 if pt2 is None else pt2
+            x1, y1 = pt1[0], pt1[1]
+            x2, y2 = pt2[0], pt2[1]
+
+        self._backend.drawLine(x1, y1, x2, y2)
+
+    # noinspection PyPep8Naming
+    def DrawLines(self, points: Iterable[Sequence[float]], xoffset: float = 0, yoffset: float = 0):
+        self._backend.drawLines(self._toPoints(points, xoffset, yoffset))
+
+    # noinspection PyPep8Naming
+    def DrawPolygon(self, points: Iterable[Sequence[float]], xoffset: float = 0, yoffset: float = 0, fill_style: int = 0):
+        self._backend.drawPolygon(self._toPoints(points, xoffset, yoffset))
+
+    # noinspection PyPep8Naming
+    def DrawSpline(self, points: Iterable[Sequence[float]]):
+        self._backend.drawSpline(self._toPoints(points))
+
+    # noinspection PyPep8Naming
+    def DrawPoint(self, x=None, y=None, pt=None):
+
+        if y is None:
+            pt = x if pt is None else pt
+            x, y = pt[0], pt[1]
+
+        self._backend.drawLine(x, y, x, y)
+
+    # noinspection PyPep8Naming
+    def DrawRectangle(self, x=None, y=None, width=None, height=None, rect=None, pt=None, sz=None):
+        """
+        DrawRectangle(x, y, width, height), DrawRectangle(rect) or DrawRectangle(pt, sz)
+        """
+        x, y, width, height = self._toBox(x, y, width, height, rect, pt, sz)
+        self._backend.drawRectangle(x, y, width, height)
+
+    # noinspection PyPep8Naming
+    def DrawRoundedRectangle(self, x=None, y=None, width=None, height=None, radius=None, rect=None, pt=None, sz=None):
+        """
+        DrawRoundedRectangle(x, y, width, height, radius) or DrawRoundedRectangle(rect, radius)
+        """
+        if isinstance(x, Rect) and width is None:
+            rect, radius = x, y
+            x = y = None
+
+        x, y, width, height = self._toBox(x, y, width, height, rect, pt, sz)
+        self._backend.drawRectangle(x, y, width, height, radius=radius)
+
+    # noinspection PyPep8Naming
+    def DrawEllipse(self, x=None, y=None, width=None, height=None, rect=None, pt=None, sz=None):
+        x, y, width, height = self._toBox(x, y, width, height, rect, pt, sz)
+        self._backend.drawEllipse(x, y, width, height)
+
+    # noinspection PyPep8Naming
+    def DrawCircle(self, x=None, y=None, radius=None, pt=None):
+
+        if radius is None:
+            pt, radius = x, y
+            x, y = pt[0], pt[1]
+        elif pt is not None:
+            x, y = pt[0], pt[1]
+
+        self._backend.drawEllipse(x - radius, y - radius, radius * 2, radius * 2)
+
+    # noinspection PyPep8Naming
+    def DrawEllipticArc(self, x, y, w, h, start, end):
+        self._backend.drawEllipticArc(x, y, w, h, start, end)
+
+    # noinspection PyPep8Naming
+    def DrawArc(self, xStart, yStart, xEnd, yEnd, xc, yc):
+        """
+        A circular arc, counterclockwise from the start to the end, around (xc, yc)
+        """
+        radius:     float = hypot(xStart - xc, yStart - yc)
+        startAngle: float = degrees(atan2(yc - yStart, xStart - xc))
+        endAngle:   float = degrees(atan2(yc - yEnd, xEnd - xc))
+
+        self._backend.drawEllipticArc(xc - radius, yc - radius, radius * 2, radius * 2, startAngle, endAngle)
+
+    # noinspection PyPep8Naming
+    def DrawText(self, text: str, x=None, y=None, pt=None):
+        """
+        DrawText(text, x, y) or DrawText(text, pt)
+        """
+        if y is None:
+            pt = x if pt is None else pt
+            x, y = pt[0], pt[1]
+
+        self._backend.drawText(text, x, y)
+
+    # noinspection PyPep8Naming
+    def DrawBitmap(self, bitmap: Bitmap, x=None, y=None, useMask: bool = False, pt=None):
+
+        if y is None:
+            pt = x if pt is None else pt
+            x, y = pt[0], pt[1]
+
+        self._backend.drawBitmap(bitmap, x, y, useMask)
+
+    # noinspection PyPep8Naming
+    def SetClippingRegion(self, x=None, y=None, width=None, height=None, rect=None, pt=None, sz=None):
+        x, y, width, height = self._toBox(x, y, width, height, rect, pt, sz)
+        self._backend.setClippingRegion(x, y, width, height)
+
+    # noinspection PyPep8Naming
+    def DestroyClippingRegion(self):
+        self._backend.destroyClippingRegion()
+
+    def _toPoints(self, points: Iterable[Sequence[float]], xOffset: float = 0, yOffset: float = 0) -> BackendPoints:
+        return BackendPoints([(point[0] + xOffset, point[1] + yOffset) for point in points])
+
+    def _toBox(self, x, y, width, height, rect, pt, sz):
+        """
+        Returns:  (x, y, width, height) from whichever of the wx overloads was used
+        """
+        if isinstance(x, Rect):
+            rect = x
+        elif width is None and x is not None and y is not None:
+            pt, sz = x, y
+
+        if rect is not None:
+            return rect.x, rect.y, rect.width, rect.height
+        if pt is not None:
+            return pt[0], pt[1], sz[0], sz[1]
+
+        return x, y, width, height
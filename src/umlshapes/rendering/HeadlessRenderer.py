@@ -0,0 +1,289 @@
+
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NewType
+from typing import TYPE_CHECKING
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from math import ceil
+
+from pathlib import Path
+
+from wx import BITMAP_TYPE_PNG
+from wx import TRANSPARENT_PEN
+from wx import WHITE
+
+from wx import Bitmap
+from wx import Brush
+from wx import Colour
+from wx import DC
+from wx import MemoryDC
+from wx import NullBitmap
+from wx import Rect
+
+from umlshapes.lib.ogl import Shape
+from umlshapes.lib.ogl import ControlPoint
+
+from umlshapes.rendering.BackendDC import BackendDC
+from umlshapes.rendering.IDrawingBackend import IDrawingBackend
+from umlshapes.rendering.SvgBackend import SvgBackend
+from umlshapes.rendering.WxDCBackend import WxDCBackend
+
+from umlshapes.spatialindex.SpatialIndex import SpatialIndex
+
+from umlshapes.types.Common import Rectangle
+
+if TYPE_CHECKING:
+    from umlshapes.UmlDiagram import UmlDiagram
+
+DEFAULT_TILE_SIZE: int = 2048
+DEFAULT_MARGIN:    int = 10
+
+Shapes = NewType('Shapes', List[Shape])
+
+
+@dataclass
+class RenderedTile:
+    row:    int
+    column: int
+    area:   Rect        # in diagram coordinates
+    bitmap: Bitmap
+
+
+class HeadlessRenderer:
+    """
+    Draws shapes into offscreen bitmaps without a frame or a window.
+
+    The renderer takes the shapes at construction, bottommost first, and indexes where
+    they paint;  Each render only draws the shapes that reach the requested area.  Very
+    large diagrams render as tiles of bounded size.
+
+    wx still needs an App to make bitmaps;  Batch jobs create one, but no frames.
+    Selection handles and control points are not drawn.
+    """
+    def __init__(self, shapes: Iterable[Shape], backgroundColour: Colour = WHITE, margin: int = DEFAULT_MARGIN):
+        """
+
+        Args:
+            shapes:             The shapes to draw, bottommost first;  Control points are ignored
+            backgroundColour:   What is behind the shapes
+            margin:             The space around the shapes in the full diagram render
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._shapes:           Shapes       = Shapes([shape for shape in shapes if not isinstance(shape, ControlPoint)])
+        self._backgroundColour: Colour       = backgroundColour
+        self._margin:           int          = margin
+        self._spatialIndex:     SpatialIndex = SpatialIndex()
+        self._boundaries:       Rect         = Rect(0, 0, 0, 0)
+
+        for zOrder, shape in enumerate(self._shapes):
+            damageRectangle: Rect = shape.GetDamageRectangle()
+
+            self._spatialIndex.insert(zOrder, self._toRectangle(damageRectangle))
+            if zOrder == 0:
+                self._boundaries = Rect(damageRectangle)
+            else:
+                self._boundaries = self._boundaries.Union(damageRectangle)
+
+        self._boundaries = Rect(self._boundaries).Inflate(margin, margin)
+
+    @classmethod
+    def fromDiagram(cls, umlDiagram: 'UmlDiagram', backgroundColour: Colour = WHITE, margin: int = DEFAULT_MARGIN) -> 'HeadlessRenderer':
+        """
+        Args:
+            umlDiagram:         The diagram to draw;  The renderer uses its shapes as they are now
+            backgroundColour:   What is behind the shapes
+            margin:             The space around the shapes in the full diagram render
+
+        Returns:  A renderer for the diagram
+        """
+        return cls(shapes=umlDiagram.shapes, backgroundColour=backgroundColour, margin=margin)
+
+    @property
+    def boundaries(self) -> Rect:
+        """
+        Returns:  The area all the shapes paint on, plus the margin, in diagram coordinates
+        """
+        return Rect(self._boundaries)
+
+    @property
+    def backgroundColour(self) -> Colour:
+        return self._backgroundColour
+
+    @property
+    def shapeCount(self) -> int:
+        return len(self._shapes)
+
+    def shapesIn(self, area: Rect) -> Shapes:
+        """
+        Args:
+            area:  In diagram coordinates
+
+        Returns:  The shapes that paint on the area, bottommost first
+        """
+        zOrders: List[int] = sorted(self._spatialIndex.rectangleQuery(self._toRectangle(area)))
+
+        return Shapes([self._shapes[zOrder] for zOrder in zOrders])
+
+    def render(self, scale: float = 1.0) -> Bitmap:
+        """
+        Args:
+            scale:  1.0 draws at the diagram size
+
+        Returns:  The whole diagram
+        """
+        return self.renderArea(area=self._boundaries, scale=scale)
+
+    def renderArea(self, area: Rect, scale: float = 1.0, asVector: bool = False) -> Bitmap:
+        """
+        Args:
+            area:       What to draw in diagram coordinates
+            scale:      1.0 draws at the diagram size
+            asVector:   Draw through the drawing backend the vector export uses;  The
+                        bitmap then previews what an export contains
+
+        Returns:  A bitmap of the area
+        """
+        bitmap: Bitmap   = Bitmap(max(ceil(area.width * scale), 1), max(ceil(area.height * scale), 1))
+        dc:     MemoryDC = MemoryDC(bitmap)
+
+        dc.SetBackground(Brush(self._backgroundColour))
+        dc.Clear()
+        dc.SetUserScale(scale, scale)
+        dc.SetDeviceOrigin(round(-area.x * scale), round(-area.y * scale))
+
+        # noinspection PySimplifyBooleanCheck
+        if asVector is True:
+            self.drawOnBackend(backend=WxDCBackend(dc=dc), area=area)
+        else:
+            self.drawShapes(dc=dc, area=area)
+
+        dc.SelectObject(NullBitmap)
+
+        return bitmap
+
+    def drawShapes(self, dc: DC, area: Rect):
+        """
+        Draw the shapes that reach the area;  The caller prepares the device context
+
+        Args:
+            dc:     Draw here
+            area:   In diagram coordinates
+        """
+        shapes: Shapes = self.shapesIn(area)
+        for shape in shapes:
+            self._drawShape(dc=dc, shape=shape)
+
+        self.logger.debug(f'Drew {len(shapes)} of {len(self._shapes)} shapes in {area}')
+
+    def drawOnBackend(self, backend: IDrawingBackend, area: Rect):
+        """
+        Draw the shapes that reach the area on a drawing backend;  The shapes only see
+        a `BackendDC`, so they draw the way they do in a vector export
+
+        Args:
+            backend:    Draw here
+            area:       In diagram coordinates
+        """
+        dc: BackendDC = BackendDC(backend=backend)
+        for shape in self.shapesIn(area):
+            self._drawShape(dc=dc, shape=shape)
+
+    def tiles(self, tileSize: int = DEFAULT_TILE_SIZE, scale: float = 1.0) -> Iterator[RenderedTile]:
+        """
+        Render the diagram one tile at a time, left to right, top to bottom;  Only one
+        tile is in memory at a time unless the caller keeps them
+
+        Args:
+            tileSize:   The tile width and height in pixels
+            scale:      1.0 draws at the diagram size
+
+        Returns:  The tiles
+        """
+        areaSize:   int = max(int(tileSize / scale), 1)
+        boundaries: Rect = self._boundaries
+
+        rows:    int = ceil(boundaries.height / areaSize)
+        columns: int = ceil(boundaries.width / areaSize)
+        for row in range(rows):
+            for column in range(columns):
+                x: int = boundaries.x + column * areaSize
+                y: int = boundaries.y + row * areaSize
+                area: Rect = Rect(x, y, min(areaSize, boundaries.GetRight() + 1 - x), min(areaSize, boundaries.GetBottom() + 1 - y))
+
+                yield RenderedTile(row=row, column=column, area=area, bitmap=self.renderArea(area=area, scale=scale))
+
+    def saveAsPng(self, path: Path, scale: float = 1.0) -> bool:
+        """
+        Args:
+            path:   The file to write
+            scale:  1.0 draws at the diagram size
+
+        Returns:  `True` if the file was written
+        """
+        return self.render(scale=scale).SaveFile(str(path), BITMAP_TYPE_PNG)
+
+    def saveAsSvg(self, path: Path) -> int:
+        """
+        Export the whole diagram as vectors in one pass;  Each shape is written as it
+        is drawn, so nothing but the file grows with the diagram
+
+        Args:
+            path:   The file to write
+
+        Returns:  The number of SVG elements written
+        """
+        with path.open('w', encoding='utf-8') as stream:
+            with SvgBackend(stream=stream, area=self._boundaries) as svgBackend:
+                svgBackend.setPen(TRANSPARENT_PEN)
+                svgBackend.setBrush(Brush(self._backgroundColour))
+                svgBackend.drawRectangle(self._boundaries.x, self._boundaries.y, self._boundaries.width, self._boundaries.height)
+
+                self.drawOnBackend(backend=svgBackend, area=self._boundaries)
+
+        return svgBackend.elementCount
+
+    def saveTilesAsPng(self, directory: Path, baseName: str, tileSize: int = DEFAULT_TILE_SIZE, scale: float = 1.0) -> List[Path]:
+        """
+        Args:
+            directory:  Where to write the tiles
+            baseName:   Tiles are named <baseName>-<row>-<column>.png
+            tileSize:   The tile width and height in pixels
+            scale:      1.0 draws at the diagram size
+
+        Returns:  The files written
+        """
+        paths: List[Path] = []
+        for tile in self.tiles(tileSize=tileSize, scale=scale):
+            path: Path = directory / f'{baseName}-{tile.row}-{tile.column}.png'
+            if tile.bitmap.SaveFile(str(path), BITMAP_TYPE_PNG) is True:
+                paths.append(path)
+            else:
+                self.logger.error(f'Could not write {path}')
+
+        return paths
+
+    def _drawShape(self, dc: DC | BackendDC, shape: Shape):
+        """
+        Shape.Draw() without the control points;  It also leaves the record of where
+        the shape was drawn on the canvas alone
+        """
+        if shape.IsShown() is False:
+            return
+
+        eventHandler = shape.GetEventHandler()
+        eventHandler.OnDraw(dc)
+        eventHandler.OnDrawContents(dc)
+        eventHandler.OnDrawBranches(dc)
+
+    def _toRectangle(self, rect: Rect) -> Rectangle:
+        return Rectangle(left=rect.GetLeft(), top=rect.GetTop(), right=rect.GetRight(), bottom=rect.GetBottom())
+
+    def __str__(self) -> str:
+        return f'HeadlessRenderer - shapes: {len(self._shapes)} boundaries: {self._boundaries}'
@@ -0,0 +1,100 @@
+
+from typing import List
+from typing import NewType
+from typing import Tuple
+
+from abc import ABC
+from abc import abstractmethod
+
+from wx import Bitmap
+from wx import Brush
+from wx import Colour
+from wx import Font
+from wx import Pen
+
+BackendPoint  = Tuple[float, float]
+BackendPoints = NewType('BackendPoints', List[BackendPoint])
+
+TextExtent = Tuple[int, int]
+
+
+class IDrawingBackend(ABC):
+    """
+    The drawing primitives the shapes use.  Coordinates are in diagram units.
+
+    A backend keeps the current pen, brush, font and text colour the way a wx DC does;
+    The primitives use whatever is current.  The `BackendDC` adapter lets the existing
+    shape drawing code, which talks to a wx DC, draw on any backend.
+    """
+    @abstractmethod
+    def setPen(self, pen: Pen):
+        pass
+
+    @abstractmethod
+    def setBrush(self, brush: Brush):
+        pass
+
+    @abstractmethod
+    def setFont(self, font: Font):
+        pass
+
+    @abstractmethod
+    def setTextForeground(self, colour: Colour):
+        pass
+
+    @abstractmethod
+    def drawLine(self, x1: float, y1: float, x2: float, y2: float):
+        pass
+
+    @abstractmethod
+    def drawLines(self, points: BackendPoints):
+        pass
+
+    @abstractmethod
+    def drawRectangle(self, x: float, y: float, width: float, height: float, radius: float = 0):
+        pass
+
+    @abstractmethod
+    def drawEllipse(self, x: float, y: float, width: float, height: float):
+        pass
+
+    @abstractmethod
+    def drawEllipticArc(self, x: float, y: float, width: float, height: float, startAngle: float, endAngle: float):
+        """
+        Angles are in degrees, counterclockwise from three o'clock, as in wx
+        """
+        pass
+
+    @abstractmethod
+    def drawPolygon(self, points: BackendPoints):
+        pass
+
+    @abstractmethod
+    def drawSpline(self, points: BackendPoints):
+        pass
+
+    @abstractmethod
+    def drawText(self, text: str, x: float, y: float):
+        """
+        (x, y) is the top left of the text, as in wx
+        """
+        pass
+
+    @abstractmethod
+    def drawBitmap(self, bitmap: Bitmap, x: float, y: float, useMask: bool = False):
+        pass
+
+    @abstractmethod
+    def textExtent(self, text: str) -> TextExtent:
+        """
+        Returns:  The width and height of the text in the current font
+        """
+        pass
+
+    @abstractmethod
+    def setClippingRegion(self, x: float, y: float, width: float, height: float):
+        pass
+
+    @abstractmethod
+    def destroyClippingRegion(self):
+        pass
@@ -0,0 +1,191 @@
+
+from typing import BinaryIO
+from typing import Deque
+from typing import NamedTuple
+
+from logging import Logger
+from logging import getLogger
+
+from collections import deque
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from struct import Struct
+
+from zlib import Z_FINISH
+from zlib import Z_SYNC_FLUSH
+from zlib import adler32
+from zlib import compressobj
+from zlib import crc32
+
+PNG_SIGNATURE: bytes = b'\x89PNG\r\n\x1a\n'
+
+PNG_IHDR_DATA:    Struct = Struct('>IIBBBBB')     # width, height, bit depth, colour type, compression, filter, interlace
+PNG_CHUNK_LENGTH: Struct = Struct('>I')
+
+BIT_DEPTH:       int   = 8
+COLOUR_TYPE_RGB: int   = 2
+BYTES_PER_PIXEL: int   = 3
+FILTER_NONE:     bytes = b'\x00'
+
+ZLIB_HEADER:   bytes = b'\x78\x9c'         # deflate, 32K window, default compression
+ADLER_BASE:    int   = 65521
+DEFAULT_LEVEL: int   = 6
+
+MAX_PENDING_BANDS_PER_WORKER: int = 2
+
+
+class CompressedBand(NamedTuple):
+    data:       bytes       # raw deflate
+    checksum:   int         # adler32 of the filtered rows
+    length:     int         # number of filtered bytes
+
+
+class PngStreamError(Exception):
+    pass
+
+
+def compressBand(pixels: bytes, rowBytes: int, level: int, lastBand: bool) -> CompressedBand:
+    """
+    Filter and deflate one band of rows.  Each band is an independent piece of a single
+    deflate stream, so bands compress in any order and concatenate in image order.
+
+    Args:
+        pixels:     The RGB bytes of whole rows, top to bottom
+        rowBytes:   Bytes per row
+        level:      zlib compression level
+        lastBand:   The bottom band ends the deflate stream
+
+    Returns:  The compressed band
+    """
+    rows:     int   = len(pixels) // rowBytes
+    filtered: bytes = b''.join(FILTER_NONE + pixels[row * rowBytes:(row + 1) * rowBytes] for row in range(rows))
+
+    compressor = compressobj(level, wbits=-15)
+    data: bytes = compressor.compress(filtered) + compressor.flush(Z_FINISH if lastBand is True else Z_SYNC_FLUSH)
+
+    return CompressedBand(data=data, checksum=adler32(filtered), length=len(filtered))
+
+
+def combineAdler32(first: int, second: int, secondLength: int) -> int:
+    """
+    Returns:  The adler32 of two byte strings joined, from the checksum of each
+    """
+    sum1: int = ((first & 0xffff) + (second & 0xffff) - 1) % ADLER_BASE
+    sum2: int = ((first >> 16) + (second >> 16) + secondLength * ((first & 0xffff) - 1)) % ADLER_BASE
+
+    return (sum2 << 16) | sum1
+
+
+class PngStreamWriter:
+    """
+    Writes an RGB PNG to a binary stream one band of rows at a time.
+
+    Only the bands waiting to be compressed are in memory;  Image size does not matter.
+    Bands compress in a thread pool (zlib releases the GIL) and are written in order.
+    Write the bands top to bottom, then `close()`;  Or use it as a context manager.
+    """
+    def __init__(self, stream: BinaryIO, width: int, height: int, workers: int = 1, level: int = DEFAULT_LEVEL):
+        """
+
+        Args:
+            stream:     Where to write the image
+            width:      In pixels
+            height:     In pixels
+            workers:    The number of bands compressed at the same time
+            level:      zlib compression level
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if width <= 0 or height <= 0:
+            raise PngStreamError(f'Invalid image size: {width} x {height}')
+
+        self._stream:   BinaryIO = stream
+        self._width:    int      = width
+        self._height:   int      = height
+        self._level:    int      = level
+        self._rowBytes: int      = width * BYTES_PER_PIXEL
+
+        self._executor:   ThreadPoolExecutor            = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix='PngBand')
+        self._pending:    Deque[Future[CompressedBand]] = deque()
+        self._maxPending: int                           = max(workers, 1) * MAX_PENDING_BANDS_PER_WORKER
+
+        self._rowsWritten: int  = 0
+        self._checksum:    int  = adler32(b'')
+        self._closed:      bool = False
+
+        self._stream.write(PNG_SIGNATURE)
+        self._writeChunk(b'IHDR', PNG_IHDR_DATA.pack(width, height, BIT_DEPTH, COLOUR_TYPE_RGB, 0, 0, 0))
+        self._writeChunk(b'IDAT', ZLIB_HEADER)
+
+    @property
+    def rowsWritten(self) -> int:
+        return self._rowsWritten
+
+    def writeBand(self, pixels: bytes):
+        """
+        Args:
+            pixels:  RGB bytes for one or more whole rows, the next ones down the image
+        """
+        if self._closed is True:
+            raise PngStreamError('The image is already closed')
+        if len(pixels) % self._rowBytes != 0:
+            raise PngStreamError(f'A band must be whole rows of {self._rowBytes} bytes')
+
+        rows: int = len(pixels) // self._rowBytes
+        if self._rowsWritten + rows > self._height:
+            raise PngStreamError(f'Too many rows: {self._rowsWritten + rows} > {self._height}')
+
+        self._rowsWritten += rows
+        lastBand: bool = self._rowsWritten == self._height
+
+        self._pending.append(self._executor.submit(compressBand, pixels, self._rowBytes, self._level, lastBand))
+        while len(self._pending) >= self._maxPending:
+            self._writeNextBand()
+
+    def close(self):
+        """
+        Write the remaining bands and the end of the image;  The stream stays open
+        """
+        if self._closed is True:
+            return
+        try:
+            while len(self._pending) > 0:
+                self._writeNextBand()
+        finally:
+            self._executor.shutdown(wait=True)
+            self._closed = True
+
+        if self._rowsWritten != self._height:
+            raise PngStreamError(f'Incomplete image: {self._rowsWritten} of {self._height} rows')
+
+        self._writeChunk(b'IDAT', PNG_CHUNK_LENGTH.pack(self._checksum))
+        self._writeChunk(b'IEND', b'')
+
+    def __enter__(self) -> 'PngStreamWriter':
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        if exceptionType is None:
+            self.close()
+        else:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._closed = True
+
+    def _writeNextBand(self):
+
+        compressedBand: CompressedBand = self._pending.popleft().result()
+
+        self._checksum = combineAdler32(self._checksum, compressedBand.checksum, compressedBand.length)
+        self._writeChunk(b'IDAT', compressedBand.data)
+
+    def _writeChunk(self, chunkType: bytes, data: bytes):
+
+        self._stream.write(PNG_CHUNK_LENGTH.pack(len(data)))
+        self._stream.write(chunkType)
+        self._stream.write(data)
+        self._stream.write(PNG_CHUNK_LENGTH.pack(crc32(data, crc32(chunkType))))
+
+    def __str__(self) -> str:
+        return f'PngStreamWriter - {self._width} x {self._height} rows written: {self._rowsWritten}'
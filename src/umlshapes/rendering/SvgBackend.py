@@ -0,0 +1,322 @@
+
+from typing import Dict
+from typing import List
+from typing import TextIO
+
+from logging import Logger
+from logging import getLogger
+
+from base64 import b64encode
+
+from io import BytesIO
+
+from math import cos
+from math import radians
+from math import sin
+
+from xml.sax.saxutils import escape
+from xml.sax.saxutils import quoteattr
+
+from wx import BITMAP_TYPE_PNG
+from wx import BLACK
+from wx import BLACK_PEN
+from wx import BRUSHSTYLE_TRANSPARENT
+from wx import FONTSTYLE_ITALIC
+from wx import FONTWEIGHT_BOLD
+from wx import NORMAL_FONT
+from wx import PENSTYLE_DOT
+from wx import PENSTYLE_DOT_DASH
+from wx import PENSTYLE_LONG_DASH
+from wx import PENSTYLE_SHORT_DASH
+from wx import PENSTYLE_TRANSPARENT
+from wx import WHITE_BRUSH
+
+from wx import Bitmap
+from wx import Brush
+from wx import Colour
+from wx import Font
+from wx import MemoryDC
+from wx import Pen
+from wx import Rect
+
+from umlshapes.rendering.IDrawingBackend import BackendPoints
+from umlshapes.rendering.IDrawingBackend import IDrawingBackend
+from umlshapes.rendering.IDrawingBackend import TextExtent
+
+SVG_NAMESPACE: str = 'http://www.w3.org/2000/svg'
+
+#
+# Dash lengths are multiples of the pen width, like wx
+#
+DASH_PATTERNS: Dict[int, List[int]] = {
+    PENSTYLE_DOT:        [1, 2],
+    PENSTYLE_SHORT_DASH: [3, 3],
+    PENSTYLE_LONG_DASH:  [6, 3],
+    PENSTYLE_DOT_DASH:   [6, 3, 1, 3],
+}
+
+
+class SvgBackend(IDrawingBackend):
+    """
+    Writes SVG elements to a text stream as they are drawn.  Nothing is kept but the
+    current drawing state, so a diagram of any size exports in one pass with constant
+    memory.
+
+    Use it as a context manager, or call `close()` to finish the document.  Text is
+    measured with the same fonts the screen uses, so the layout matches the canvas.
+    """
+    def __init__(self, stream: TextIO, area: Rect):
+        """
+
+        Args:
+            stream: Where to write the document
+            area:   The part of the diagram to export, in diagram coordinates
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._stream: TextIO = stream
+        self._area:   Rect   = Rect(area)
+
+        self._pen:            Pen    = BLACK_PEN
+        self._brush:          Brush  = WHITE_BRUSH
+        self._font:           Font   = NORMAL_FONT
+        self._textForeground: Colour = BLACK
+
+        self._clipCount:    int  = 0
+        self._clipping:     bool = False
+        self._closed:       bool = False
+        self._elementCount: int  = 0
+
+        self._measuringDC: MemoryDC = MemoryDC(Bitmap(1, 1))
+        self._measuringDC.SetFont(self._font)
+
+        self._writeHeader()
+
+    @property
+    def elementCount(self) -> int:
+        """
+        Returns:  The number of shapes written so far
+        """
+        return self._elementCount
+
+    def close(self):
+        """
+        Finish the document;  The stream stays open
+        """
+        if self._closed is True:
+            return
+
+        self.destroyClippingRegion()
+        self._stream.write('</g>\n</svg>\n')
+        self._closed = True
+
+        self.logger.debug(f'Wrote {self._elementCount} SVG elements')
+
+    def __enter__(self) -> 'SvgBackend':
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        self.close()
+
+    def setPen(self, pen: Pen):
+        self._pen = pen
+
+    def setBrush(self, brush: Brush):
+        self._brush = brush
+
+    def setFont(self, font: Font):
+        self._font = font
+        self._measuringDC.SetFont(font)
+
+    def setTextForeground(self, colour: Colour):
+        self._textForeground = colour
+
+    def drawLine(self, x1: float, y1: float, x2: float, y2: float):
+        self._writeElement(f'<line x1="{x1:g}" y1="{y1:g}" x2="{x2:g}" y2="{y2:g}" {self._stroke()}/>')
+
+    def drawLines(self, points: BackendPoints):
+        self._writeElement(f'<polyline points="{self._points(points)}" fill="none" {self._stroke()}/>')
+
+    def drawRectangle(self, x: float, y: float, width: float, height: float, radius: float = 0):
+
+        corner: str = ''
+        if radius != 0:
+            corner = f' rx="{radius:g}" ry="{radius:g}"'
+
+        self._writeElement(f'<rect x="{x:g}" y="{y:g}" width="{width:g}" height="{height:g}"{corner} {self._fill()} {self._stroke()}/>')
+
+    def drawEllipse(self, x: float, y: float, width: float, height: float):
+
+        rx: float = width / 2
+        ry: float = height / 2
+        self._writeElement(f'<ellipse cx="{x + rx:g}" cy="{y + ry:g}" rx="{rx:g}" ry="{ry:g}" {self._fill()} {self._stroke()}/>')
+
+    def drawEllipticArc(self, x: float, y: float, width: float, height: float, startAngle: float, endAngle: float):
+        """
+        Like wx, the arc is filled as a pie slice and stroked along the curve only
+        """
+        rx: float = width / 2
+        ry: float = height / 2
+        cx: float = x + rx
+        cy: float = y + ry
+
+        sweep: float = (endAngle - startAngle) % 360
+        if sweep == 0:
+            self.drawEllipse(x=x, y=y, width=width, height=height)
+            return
+        #
+        # wx angles go counterclockwise with y up;  SVG y goes down
+        #
+        startX: float = cx + rx * cos(radians(startAngle))
+        startY: float = cy - ry * sin(radians(startAngle))
+        endX:   float = cx + rx * cos(radians(endAngle))
+        endY:   float = cy - ry * sin(radians(endAngle))
+
+        largeArc: int = 1 if sweep > 180 else 0
+        arc:      str = f'M {startX:g} {startY:g} A {rx:g} {ry:g} 0 {largeArc} 0 {endX:g} {endY:g}'
+
+        if self._brush.GetStyle() != BRUSHSTYLE_TRANSPARENT:
+            self._writeElement(f'<path d="{arc} L {cx:g} {cy:g} Z" {self._fill()} stroke="none"/>')
+        self._writeElement(f'<path d="{arc}" fill="none" {self._stroke()}/>')
+
+    def drawPolygon(self, points: BackendPoints):
+        self._writeElement(f'<polygon points="{self._points(points)}" {self._fill()} {self._stroke()}/>')
+
+    def drawSpline(self, points: BackendPoints):
+        """
+        A quadratic B-spline through the midpoints of the control polygon, which is what
+        wx draws
+        """
+        if len(points) < 3:
+            self.drawLines(points)
+            return
+
+        (x0, y0), (x1, y1) = points[0], points[1]
+        path: List[str] = [f'M {x0:g} {y0:g}', f'L {(x0 + x1) / 2:g} {(y0 + y1) / 2:g}']
+        for (cx, cy), (nx, ny) in zip(points[1:-1], points[2:]):
+            path.append(f'Q {cx:g} {cy:g} {(cx + nx) / 2:g} {(cy + ny) / 2:g}')
+
+        lastX, lastY = points[-1]
+        path.append(f'L {lastX:g} {lastY:g}')
+
+        self._writeElement(f'<path d="{" ".join(path)}" fill="none" {self._stroke()}/>')
+
+    def drawText(self, text: str, x: float, y: float):
+
+        if text == '':
+            return
+
+        width, height, descent, externalLeading = self._measuringDC.GetFullTextExtent(text)
+        baseline: float = y + height - descent
+
+        self._writeElement(
+            f'<text x="{x:g}" y="{baseline:g}" {self._fontAttributes()} fill="{self._colour(self._textForeground)}"'
+            f' xml:space="preserve">{escape(text)}</text>'
+        )
+
+    def drawBitmap(self, bitmap: Bitmap, x: float, y: float, useMask: bool = False):
+
+        stream: BytesIO = BytesIO()
+        if bitmap.ConvertToImage().SaveFile(stream, BITMAP_TYPE_PNG) is False:
+            self.logger.warning(f'Could not embed bitmap at ({x}, {y})')
+            return
+
+        data: str = b64encode(stream.getvalue()).decode('ascii')
+        self._writeElement(
+            f'<image x="{x:g}" y="{y:g}" width="{bitmap.GetWidth()}" height="{bitmap.GetHeight()}"'
+            f' href="data:image/png;base64,{data}"/>'
+        )
+
+    def textExtent(self, text: str) -> TextExtent:
+        return self._measuringDC.GetTextExtent(text)
+
+    def setClippingRegion(self, x: float, y: float, width: float, height: float):
+
+        self.destroyClippingRegion()
+
+        self._clipCount += 1
+        clipId: str = f'clip{self._clipCount}'
+        self._stream.write(
+            f'<clipPath id="{clipId}"><rect x="{x:g}" y="{y:g}" width="{width:g}" height="{height:g}"/></clipPath>\n'
+            f'<g clip-path="url(#{clipId})">\n'
+        )
+        self._clipping = True
+
+    def destroyClippingRegion(self):
+
+        if self._clipping is True:
+            self._stream.write('</g>\n')
+            self._clipping = False
+
+    def _writeHeader(self):
+
+        area: Rect = self._area
+        self._stream.write(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="{SVG_NAMESPACE}" version="1.1" width="{area.width}" height="{area.height}"'
+            f' viewBox="0 0 {area.width} {area.height}">\n'
+            f'<g transform="translate({-area.x},{-area.y})">\n'
+        )
+
+    def _writeElement(self, element: str):
+
+        self._stream.write(element)
+        self._stream.write('\n')
+        self._elementCount += 1
+
+    def _stroke(self) -> str:
+
+        pen: Pen = self._pen
+        if pen.GetStyle() == PENSTYLE_TRANSPARENT:
+            return 'stroke="none"'
+
+        width:      int = max(pen.GetWidth(), 1)
+        attributes: str = f'stroke="{self._colour(pen.GetColour())}" stroke-width="{width}"'
+
+        dashPattern: List[int] | None = DASH_PATTERNS.get(pen.GetStyle())
+        if dashPattern is not None:
+            attributes = f'{attributes} stroke-dasharray="{",".join(str(dash * width) for dash in dashPattern)}"'
+
+        return attributes
+
+    def _fill(self) -> str:
+
+        brush: Brush = self._brush
+        if brush.GetStyle() == BRUSHSTYLE_TRANSPARENT:
+            return 'fill="none"'
+
+        return f'fill="{self._colour(brush.GetColour())}"'
+
+    def _fontAttributes(self) -> str:
+
+        font:       Font = self._font
+        attributes: str  = f'font-family={quoteattr(font.GetFaceName())} font-size="{self._fontPixelSize()}"'
+
+        if font.GetWeight() >= FONTWEIGHT_BOLD:
+            attributes = f'{attributes} font-weight="bold"'
+        if font.GetStyle() == FONTSTYLE_ITALIC:
+            attributes = f'{attributes} font-style="italic"'
+
+        return attributes
+
+    def _fontPixelSize(self) -> int:
+        """
+        The layout is measured in pixels, so the size is in user units too;  A point size
+        only matches the measurements on a display with the dpi wx assumed
+
+        Returns:  The font height in pixels
+        """
+        pixelHeight: int = self._font.GetPixelSize().GetHeight()
+        if pixelHeight <= 0:
+            pixelHeight = self._measuringDC.GetCharHeight()
+
+        return pixelHeight
+
+    def _colour(self, colour: Colour) -> str:
+        return f'#{colour.Red():02x}{colour.Green():02x}{colour.Blue():02x}'
+
+    def _points(self, points: BackendPoints) -> str:
+        return ' '.join(f'{x:g},{y:g}' for x, y in points)
+
+    def __str__(self) -> str:
+        return f'SvgBackend - area: {self._area} elements: {self._elementCount}'
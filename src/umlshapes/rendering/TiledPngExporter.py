@@ -0,0 +1,136 @@
+
+from typing import BinaryIO
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from math import ceil
+from math import floor
+
+from os import cpu_count
+
+from pathlib import Path
+
+from wx import Bitmap
+from wx import Brush
+from wx import MemoryDC
+from wx import NullBitmap
+from wx import Rect
+
+from umlshapes.rendering.HeadlessRenderer import HeadlessRenderer
+from umlshapes.rendering.PngStreamWriter import BYTES_PER_PIXEL
+from umlshapes.rendering.PngStreamWriter import PngStreamWriter
+
+DEFAULT_EXPORT_TILE_SIZE: int = 512
+
+
+class TiledPngExporter:
+    """
+    Exports a diagram of any size as one PNG without ever making the whole bitmap.
+
+    The image is cut into bands of rows and each band into tiles.  Each tile only
+    draws the shapes that reach it.  A band is stitched from its tiles and handed to a
+    `PngStreamWriter`, which compresses bands in a worker pool while the next band
+    renders.  Peak memory is a few bands, whatever the height of the diagram.
+
+    wx only draws on the GUI thread, so tiles render there;  The workers do the
+    filtering and the deflate, which is most of the time.
+    """
+    def __init__(self, renderer: HeadlessRenderer, area: Rect | None = None, tileSize: int = DEFAULT_EXPORT_TILE_SIZE, workers: int = 0):
+        """
+
+        Args:
+            renderer:   Draws the shapes
+            area:       The part of the diagram to export in diagram coordinates;  `None` for everything
+            tileSize:   The tile width and height, and the band height, in pixels
+            workers:    The number of bands compressed at the same time;  0 for one per processor
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        assert tileSize > 0, 'Tiles must have some size'
+
+        self._renderer: HeadlessRenderer = renderer
+        self._area:     Rect             = renderer.boundaries if area is None else Rect(area)
+        self._tileSize: int              = tileSize
+        self._workers:  int              = workers if workers > 0 else (cpu_count() or 1)
+
+    def export(self, stream: BinaryIO, scale: float = 1.0):
+        """
+        Args:
+            stream: Where to write the PNG
+            scale:  1.0 draws at the diagram size
+        """
+        width:  int = max(ceil(self._area.width * scale), 1)
+        height: int = max(ceil(self._area.height * scale), 1)
+
+        with PngStreamWriter(stream=stream, width=width, height=height, workers=self._workers) as pngWriter:
+            for bandY in range(0, height, self._tileSize):
+                bandHeight: int = min(self._tileSize, height - bandY)
+                pngWriter.writeBand(self._renderBand(bandY=bandY, bandWidth=width, bandHeight=bandHeight, scale=scale))
+
+        self.logger.info(f'Exported {width} x {height} pixels in bands of {self._tileSize} rows')
+
+    def exportToFile(self, path: Path, scale: float = 1.0):
+        """
+        Args:
+            path:   The file to write
+            scale:  1.0 draws at the diagram size
+        """
+        with path.open('wb') as stream:
+            self.export(stream=stream, scale=scale)
+
+    def _renderBand(self, bandY: int, bandWidth: int, bandHeight: int, scale: float) -> bytes:
+        """
+        Returns:  The RGB bytes of the band's rows, top to bottom
+        """
+        tiles:  List[bytes] = []
+        widths: List[int]   = []
+        for tileX in range(0, bandWidth, self._tileSize):
+            tileWidth: int = min(self._tileSize, bandWidth - tileX)
+            tiles.append(self._renderTile(pixelX=tileX, pixelY=bandY, width=tileWidth, height=bandHeight, scale=scale))
+            widths.append(tileWidth * BYTES_PER_PIXEL)
+
+        if len(tiles) == 1:
+            return tiles[0]
+
+        rows: List[bytes] = []
+        for row in range(bandHeight):
+            for tile, rowBytes in zip(tiles, widths):
+                rows.append(tile[row * rowBytes:(row + 1) * rowBytes])
+
+        return b''.join(rows)
+
+    def _renderTile(self, pixelX: int, pixelY: int, width: int, height: int, scale: float) -> bytes:
+        """
+        Args:
+            pixelX: The tile's left in image pixels
+            pixelY: The tile's top in image pixels
+            width:  In pixels
+            height: In pixels
+            scale:  Image pixels per diagram unit
+
+        Returns:  The RGB bytes of the tile
+        """
+        area: Rect = Rect(
+            floor(self._area.x + pixelX / scale),
+            floor(self._area.y + pixelY / scale),
+            ceil(width / scale) + 1,
+            ceil(height / scale) + 1
+        )
+        bitmap: Bitmap   = Bitmap(width, height)
+        dc:     MemoryDC = MemoryDC(bitmap)
+
+        dc.SetBackground(Brush(self._renderer.backgroundColour))
+        dc.Clear()
+        dc.SetUserScale(scale, scale)
+        dc.SetDeviceOrigin(round(-self._area.x * scale) - pixelX, round(-self._area.y * scale) - pixelY)
+
+        self._renderer.drawShapes(dc=dc, area=area)
+
+        dc.SelectObject(NullBitmap)
+
+        return bytes(bitmap.ConvertToImage().GetData())
+
+    def __str__(self) -> str:
+        return f'TiledPngExporter - area: {self._area} tile size: {self._tileSize} workers: {self._workers}'
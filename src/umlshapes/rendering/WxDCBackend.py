@@ -0,0 +1,75 @@
+
+from wx import Bitmap
+from wx import Brush
+from wx import Colour
+from wx import DC
+from wx import Font
+from wx import Pen
+
+from umlshapes.rendering.IDrawingBackend import BackendPoints
+from umlshapes.rendering.IDrawingBackend import IDrawingBackend
+from umlshapes.rendering.IDrawingBackend import TextExtent
+
+
+class WxDCBackend(IDrawingBackend):
+    """
+    Draws on a wx device context
+    """
+    def __init__(self, dc: DC):
+        self._dc: DC = dc
+
+    @property
+    def dc(self) -> DC:
+        return self._dc
+
+    def setPen(self, pen: Pen):
+        self._dc.SetPen(pen)
+
+    def setBrush(self, brush: Brush):
+        self._dc.SetBrush(brush)
+
+    def setFont(self, font: Font):
+        self._dc.SetFont(font)
+
+    def setTextForeground(self, colour: Colour):
+        self._dc.SetTextForeground(colour)
+
+    def drawLine(self, x1: float, y1: float, x2: float, y2: float):
+        self._dc.DrawLine(round(x1), round(y1), round(x2), round(y2))
+
+    def drawLines(self, points: BackendPoints):
+        self._dc.DrawLines([(round(x), round(y)) for x, y in points])
+
+    def drawRectangle(self, x: float, y: float, width: float, height: float, radius: float = 0):
+
+        if radius == 0:
+            self._dc.DrawRectangle(round(x), round(y), round(width), round(height))
+        else:
+            self._dc.DrawRoundedRectangle(round(x), round(y), round(width), round(height), radius)
+
+    def drawEllipse(self, x: float, y: float, width: float, height: float):
+        self._dc.DrawEllipse(round(x), round(y), round(width), round(height))
+
+    def drawEllipticArc(self, x: float, y: float, width: float, height: float, startAngle: float, endAngle: float):
+        self._dc.DrawEllipticArc(round(x), round(y), round(width), round(height), startAngle, endAngle)
+
+    def drawPolygon(self, points: BackendPoints):
+        self._dc.DrawPolygon([(round(x), round(y)) for x, y in points])
+
+    def drawSpline(self, points: BackendPoints):
+        self._dc.DrawSpline([(round(x), round(y)) for x, y in points])
+
+    def drawText(self, text: str, x: float, y: float):
+        self._dc.DrawText(text, round(x), round(y))
+
+    def drawBitmap(self, bitmap: Bitmap, x: float, y: float, useMask: bool = False):
+        self._dc.DrawBitmap(bitmap, round(x), round(y), useMask)
+
+    def textExtent(self, text: str) -> TextExtent:
+        return self._dc.GetTextExtent(text)
+
+    def setClippingRegion(self, x: float, y: float, width: float, height: float):
+        self._dc.SetClippingRegion(round(x), round(y), round(width), round(height))
+
+    def destroyClippingRegion(self):
+        self._dc.DestroyClippingRegion()
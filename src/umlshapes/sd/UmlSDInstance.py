@@ -71,7 +71,7 @@ class UmlSDInstance(ControlPointMixin, IdentifierMixin, CompositeShape, TopLeftM
 
         constraint: Constraint = Constraint(CONSTRAINT_ALIGNED_TOP, constrainingShape, [instanceName, sdLifeLine])
         self.AddConstraint(constraint)
-        self.Recompute()
+        self.Recompute(changed=[constrainingShape])
 
         # If we don't do this, the shapes will be able to move on their
         # own, instead of moving the composite
@@ -17,6 +17,7 @@ from umlshapes.lib.ogl import RectangleShape
 
 from umlshapes.utils.DrawingUtils import DrawingUtils
 from umlshapes.utils.ResourceUtils import ResourceUtils
+from umlshapes.utils.TextExtentCache import TextExtentCache
 
 from umlshapes.preferences.UmlPreferences import UmlPreferences
 
@@ -94,6 +95,7 @@ class UmlActor(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
     @modelActor.setter
     def modelActor(self, value: Actor):
         self._actor = value
+        self._modelChanged()
 
     @property
     def selected(self) -> bool:
@@ -304,7 +306,7 @@ class UmlActor(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
             x:
         """
 
-        textWidth, textHeight = dc.GetTextExtent(self.modelActor.name)
+        textWidth, textHeight = TextExtentCache().textExtent(dc=dc, text=self.modelActor.name)
 
         y = round(centerY + NAME_Y_ADJUSTMENT * height - MARGIN - 0.1 * actorHeight)
 
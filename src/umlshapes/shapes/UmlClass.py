@@ -1,17 +1,21 @@
 
+from typing import Tuple
 from typing import cast
 from typing import TYPE_CHECKING
 
 from logging import Logger
 from logging import getLogger
 
+from wx import Bitmap
 from wx import Brush
 from wx import ClientDC
 from wx import Colour
 from wx import DC
 from wx import Font
+from wx import Mask
 from wx import MemoryDC
-from wx import Size
+
+from wx import NullBitmap
 
 from umlmodel.Class import Class
 from umlmodel.Field import Fields
@@ -28,12 +32,16 @@ from umlshapes.links.UmlLink import UmlLink
 
 from umlshapes.mixins.IdentifierMixin import IdentifierMixin
 
+from umlshapes.rendering.BackendDC import BackendDC
+
 from umlshapes.types.Common import LeftCoordinate
 from umlshapes.types.UmlPosition import UmlPosition
 from umlshapes.types.UmlColor import UmlColor
 from umlshapes.types.UmlDimensions import UmlDimensions
 
 from umlshapes.utils.ResourceUtils import ResourceUtils
+from umlshapes.utils.TextExtentCache import TextExtent
+from umlshapes.utils.TextExtentCache import TextExtentCache
 
 from umlshapes.preferences.UmlPreferences import UmlPreferences
 
@@ -47,6 +55,14 @@ if TYPE_CHECKING:
 DUNDER_METHOD_INDICATOR: str = '__'
 CONSTRUCTOR_NAME:        str = '__init__'
 
+#
+# The render cache bitmap extends past the class box to include the pen
+#
+RENDER_CACHE_PADDING:     int    = 2
+RENDER_CACHE_MASK_COLOUR: Colour = Colour(255, 0, 255)
+
+RenderCacheKey = Tuple
+
 
 class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin):
     """
@@ -90,6 +106,11 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
         self._textHeight:   int      = cast(int, None)                      # noqa
         self._margin:       int      = self._preferences.classTextMargin
 
+        self._renderCache:    Bitmap | None         = None
+        self._renderCacheKey: RenderCacheKey | None = None
+
+        self._preferences.subscribe(self._preferenceChanged)
+
         self.SetDraggable(drag=True)
         self.SetCentreResize(False)
 
@@ -104,6 +125,8 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
     @modelClass.setter
     def modelClass(self, modelClass: Class):
         self._modelClass = modelClass
+        self._modelChanged()
+        self.invalidateRenderCache()
 
     @property
     def umlFrame(self) -> 'ClassDiagramFrame':
@@ -139,6 +162,130 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
             umlLink.smartPlaceLabels()
 
     def OnDraw(self, dc: MemoryDC):
+        """
+        When the render cache preference is on, the class box is rasterized once and
+        blitted until the model content, the size, the selection, the colours, the font
+        or the relevant preferences change.  Vector exports always draw the class so that it stays a vector
+
+        Args:
+            dc:
+        """
+        # noinspection PySimplifyBooleanCheck
+        if self._preferences.snapshot.classRenderCache is True and not isinstance(dc, BackendDC):
+            self._drawFromRenderCache(dc=dc)
+        else:
+            self._drawClass(dc=dc)
+
+    def invalidateRenderCache(self):
+        """
+        Force the next draw to rasterize the class again
+        """
+        self._renderCache    = None
+        self._renderCacheKey = None
+
+    def _preferenceChanged(self, preferenceName: str):
+        """
+        The text height and the rasterized class may depend on the preference that changed
+
+        Args:
+            preferenceName:
+        """
+        self._textHeight = cast(int, None)
+        self.invalidateRenderCache()
+
+    def _drawFromRenderCache(self, dc: DC):
+
+        leftCoordinate: LeftCoordinate = self._computeTopLeft()
+        renderCacheKey: RenderCacheKey = self._computeRenderCacheKey(leftCoordinate=leftCoordinate)
+
+        if self._renderCache is None or renderCacheKey != self._renderCacheKey:
+            self._renderCache    = self._rasterize(leftCoordinate=leftCoordinate)
+            self._renderCacheKey = renderCacheKey
+
+        dc.DrawBitmap(self._renderCache, leftCoordinate.x - RENDER_CACHE_PADDING, leftCoordinate.y - RENDER_CACHE_PADDING, useMask=True)
+
+    def _rasterize(self, leftCoordinate: LeftCoordinate) -> Bitmap:
+        """
+        Draw the class on an offscreen bitmap;  The area around the box is masked out
+
+        Args:
+            leftCoordinate: Where the class is currently drawn
+
+        Returns:  The rasterized class
+        """
+        width, height = self.GetBoundingBoxMax()
+
+        bitmap: Bitmap   = Bitmap(round(width) + (RENDER_CACHE_PADDING * 2), round(height) + (RENDER_CACHE_PADDING * 2))
+        memDC:  MemoryDC = MemoryDC(bitmap)
+
+        memDC.SetBackground(Brush(RENDER_CACHE_MASK_COLOUR))
+        memDC.Clear()
+        # So that we can draw using diagram coordinates
+        memDC.SetDeviceOrigin(RENDER_CACHE_PADDING - leftCoordinate.x, RENDER_CACHE_PADDING - leftCoordinate.y)
+
+        self._drawClass(dc=memDC)
+
+        memDC.SelectObject(NullBitmap)
+        bitmap.SetMask(Mask(bitmap, RENDER_CACHE_MASK_COLOUR))
+
+        return bitmap
+
+    def _computeRenderCacheKey(self, leftCoordinate: LeftCoordinate) -> RenderCacheKey:
+        """
+        Everything that changes what the class looks like;  Checked on every paint, so
+        the model is only fingerprinted.  The key depends on where the class is only via
+        the rounding of its top left corner
+
+        Args:
+            leftCoordinate: Where the class is currently drawn
+
+        Returns:  The key for the current appearance
+        """
+        x1: float = self._xpos - self._width / 2.0
+        y1: float = self._ypos - self._height / 2.0
+
+        return (
+            self.GetBoundingBoxMax(),
+            (int(x1) - leftCoordinate.x, int(y1) - leftCoordinate.y),
+            self.selected,
+            self.GetBrush().GetColour().GetRGB(),
+            self._textColor.GetRGB(),
+            TextExtentCache.fontDescriptor(self._defaultFont),
+            self._modelFingerprint(),
+        )
+
+    def _modelFingerprint(self) -> int:
+        """
+        A hash of the model content the class displays.  It reads the attributes but
+        does not format them, so in place model edits are caught without paying for the
+        field and method representations on every paint
+
+        Returns:  The model class fingerprint
+        """
+        modelClass: Class = self._modelClass
+
+        return hash((
+            modelClass.name,
+            modelClass.stereotype,
+            modelClass.displayStereoType,
+            modelClass.showFields,
+            modelClass.showMethods,
+            modelClass.displayParameters,
+            modelClass.displayConstructor,
+            modelClass.displayDunderMethods,
+            tuple((field.name, field.type, field.defaultValue, field.visibility) for field in modelClass.fields),
+            tuple(
+                (
+                    method.name,
+                    method.visibility,
+                    method.returnType,
+                    tuple((parameter.name, parameter.type, parameter.defaultValue) for parameter in method.parameters)
+                )
+                for method in modelClass.methods
+            ),
+        ))
+
+    def _drawClass(self, dc: DC):
 
         if self.selected:
             self.SetPen(ResourceUtils.redDashedPen())
@@ -158,7 +305,7 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
         # Define the margin between draw separator lines and individual text lines
         #
         if self._textHeight is None:
-            self._textHeight = self._determineTextHeight(dc)  + self._preferences.lineHeightAdjustment
+            self._textHeight = self._determineTextHeight(dc)  + self._preferences.snapshot.lineHeightAdjustment
 
         # drawing is restricted in the specified region of the device
         self._startClipping(dc=dc, leftX=x, leftY=y)
@@ -237,6 +384,8 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
         """
         from umlshapes.frames.UmlFrame import UmlFrame
 
+        self.invalidateRenderCache()
+
         savePosition: UmlPosition = self.position
 
         umlFrame:    UmlFrame = self.GetCanvas()
@@ -266,9 +415,7 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
         Returns:
         """
 
-        size: Size = dc.GetTextExtent(text)
-
-        return size.width
+        return TextExtentCache().textWidth(dc=dc, text=text)
 
     def _drawClassHeader(self, dc: MemoryDC | ClientDC, xLeft: int, yLeft: int, shapeWidth: int) -> int:
         """
@@ -465,7 +612,7 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
         Returns: Always `True` unless the specific class says `False` or class does not care then returns
         `False` if the global value says so
         """
-        ans: bool = self._allowDraw(classProperty=modelClass.displayConstructor, globalValue=self._preferences.displayConstructor)
+        ans: bool = self._allowDraw(classProperty=modelClass.displayConstructor, globalValue=self._preferences.snapshot.displayConstructor)
 
         return ans
 
@@ -479,7 +626,7 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
         Returns: Always `True` unless the specific class says `False` or class does not care then returns
         `False` if the global value says so
         """
-        ans: bool = self._allowDraw(classProperty=modelClass.displayDunderMethods, globalValue=self._preferences.displayDunderMethods)
+        ans: bool = self._allowDraw(classProperty=modelClass.displayDunderMethods, globalValue=self._preferences.snapshot.displayDunderMethods)
 
         return ans
 
@@ -533,7 +680,7 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
         Returns:
         """
 
-        size: Size = dc.GetTextExtent('*')
+        size: TextExtent = TextExtentCache().textExtent(dc=dc, text='*')
         return round(size.height)
 
     def _getStereoTypeValue(self):
@@ -676,11 +823,9 @@ class UmlClass(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin)
         Returns:  The appropriate string version of a method
         """
 
-        self.logger.debug(f'{displayParameters=} - {self._preferences.showParameters=}')
-
         if displayParameters == DisplayParameters.UNSPECIFIED:
 
-            if self._preferences.showParameters is True:
+            if self._preferences.snapshot.showParameters is True:
                 methodStr: str = method.methodWithParameters()
             else:
                 methodStr = method.methodWithoutParameters()
@@ -44,3 +44,11 @@ class UmlControlPoint(ControlPoint):
         # Override parent class
         self.SetPen(ResourceUtils.redSolidPen())
         self.SetBrush(WHITE_BRUSH)
+
+    def OnDragLeft(self, draw: bool, x: int, y: int, keys: int = 0, attachment: int = 0):
+        """
+        Override the parent method, which resizes the parent shape, to show the new size.
+        This appears to be the only drag handler invoked regardless of which direction you are dragging
+        """
+        super().OnDragLeft(draw, x, y, keys, attachment)
+        self._canvas.refresh()
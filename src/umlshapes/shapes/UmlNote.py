@@ -16,6 +16,8 @@ from umlmodel.Note import Note
 
 from umlshapes.utils.DrawingUtils import DrawingUtils
 from umlshapes.utils.ResourceUtils import ResourceUtils
+from umlshapes.utils.TextLayout import LayoutLine
+from umlshapes.utils.TextLayout import TextLayout
 
 from umlshapes.links.UmlNoteLink import UmlNoteLink
 
@@ -47,7 +49,8 @@ class UmlNote(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin):
 
     """
 
-    MARGIN: int = 10
+    MARGIN:       int = 10
+    LINE_SPACING: int = 5
 
     def __init__(self, note: Note | None = None, size: UmlDimensions = None):
         """
@@ -76,6 +79,8 @@ class UmlNote(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin):
         TopLeftMixin.__init__(self, umlShape=self, width=noteSize.width, height=noteSize.height)
 
         self.logger: Logger = getLogger(__name__)
+        self._textLayout: TextLayout = TextLayout()
+
         self.SetBrush(Brush(Colour(255, 255, 230)))
 
         self.SetDraggable(drag=True)
@@ -99,6 +104,7 @@ class UmlNote(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin):
     @modelNote.setter
     def modelNote(self, newNote: Note):
         self._modelNote = newNote
+        self._modelChanged()
 
     @property
     def links(self) -> 'UmlLinks':
@@ -138,17 +144,18 @@ class UmlNote(ControlPointMixin, IdentifierMixin, RectangleShape, TopLeftMixin):
         self._drawNoteNotch(dc, w=w, baseX=baseX, baseY=baseY)
 
         try:
-            noteContent = self.modelNote.content
-            lines = DrawingUtils.lineSplitter(noteContent, dc, w - 2 * UmlNote.MARGIN)
+            self._textLayout.update(dc=dc, text=self.modelNote.content, wrapWidth=w - 2 * UmlNote.MARGIN)
         except (ValueError, Exception) as e:
             self.logger.error(f"Unable to display note - {e}")
             return
 
-        x = baseX + UmlNote.MARGIN
-        y = baseY + UmlNote.MARGIN
+        x:          int = baseX + UmlNote.MARGIN
+        y:          int = baseY + UmlNote.MARGIN
+        lineHeight: int = self._textLayout.lineHeight + UmlNote.LINE_SPACING
 
-        for line in range(len(lines)):
-            dc.DrawText(lines[line], x, y + line * (dc.GetCharHeight() + 5))
+        layoutLine: LayoutLine
+        for lineNumber, layoutLine in enumerate(self._textLayout.lines):
+            dc.DrawText(layoutLine.text, x, y + lineNumber * lineHeight)
 
     def _drawNoteNotch(self, dc: MemoryDC, w: int, baseX: int, baseY: int):
         """
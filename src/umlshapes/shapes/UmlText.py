@@ -1,4 +1,5 @@
 
+from typing import Tuple
 from typing import cast
 
 from logging import Logger
@@ -19,6 +20,8 @@ from wx import Menu
 from umlmodel.Text import Text
 
 from umlshapes.lib.ogl import Shape
+from umlshapes.lib.ogl import ShapeRegion
+from umlshapes.lib.ogl import ShapeTextLine
 from umlshapes.lib.ogl import TextShape
 
 from umlshapes.mixins.IdentifierMixin import IdentifierMixin
@@ -37,6 +40,7 @@ from umlshapes.frames.SequenceDiagramFrame import SequenceDiagramFrame
 
 from umlshapes.utils.DrawingUtils import DrawingUtils
 from umlshapes.utils.ResourceUtils import ResourceUtils
+from umlshapes.utils.TextLayout import TextLayout
 
 
 class UmlText(ControlPointMixin, IdentifierMixin, TextShape, TopLeftMixin):
@@ -91,6 +95,9 @@ class UmlText(ControlPointMixin, IdentifierMixin, TextShape, TopLeftMixin):
         self._redColor:   Colour = ColourDatabase().Find('Red')
         self._blackColor: Colour = ColourDatabase().Find('Black')
 
+        self._textLayout:  TextLayout      = TextLayout()
+        self._laidOutSize: Tuple[int, int] = (0, 0)
+
         self.AddText(self._modelText.content)
 
         self._initializeTextFont()
@@ -146,6 +153,7 @@ class UmlText(ControlPointMixin, IdentifierMixin, TextShape, TopLeftMixin):
     @modelText.setter
     def modelText(self, text: Text):
         self._modelText = text
+        self._modelChanged()
 
     @property
     def textSize(self) -> int:
@@ -189,8 +197,7 @@ class UmlText(ControlPointMixin, IdentifierMixin, TextShape, TopLeftMixin):
 
     def OnDraw(self, dc: MemoryDC):
 
-        self.ClearText()
-        self.AddText(self.modelText.content)
+        self._layoutText(dc=dc)
 
         dc.SetBrush(self._brush)
 
@@ -214,6 +221,24 @@ class UmlText(ControlPointMixin, IdentifierMixin, TextShape, TopLeftMixin):
         """
         self._children.append(shape)
 
+    def _layoutText(self, dc: MemoryDC):
+        """
+        Refill the text region only when the text, the font or the size changed.  The
+        ogl code then centres the lines once, instead of measuring them on every paint
+        """
+        dc.SetFont(self.GetFont())
+
+        boxSize: Tuple[int, int] = (self.GetWidth(), self.GetHeight())
+        if self._textLayout.update(dc=dc, text=self.modelText.content) is True or boxSize != self._laidOutSize:
+
+            region: ShapeRegion = self.GetRegions()[0]
+            region.ClearText()
+            for layoutLine in self._textLayout.lines:
+                region.GetFormattedText().append(ShapeTextLine(0, 0, layoutLine.text))
+
+            self._formatted   = False
+            self._laidOutSize = boxSize
+
     def _initializeTextFont(self):
         """
         Use the model to get other text attributes; We'll
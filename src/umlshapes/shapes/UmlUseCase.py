@@ -59,6 +59,7 @@ class UmlUseCase(ControlPointMixin,  IdentifierMixin, EllipseShape, TopLeftMixin
     @modelUseCase.setter
     def modelUseCase(self, value: UseCase):
         self._modelUseCase = value
+        self._modelChanged()
 
     @property
     def umlFrame(self) -> UseCaseDiagramFrame:
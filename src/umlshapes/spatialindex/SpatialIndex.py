@@ -0,0 +1,168 @@
+from typing import Dict
+from typing import Iterator
+from typing import NewType
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from umlshapes.types.Common import Rectangle
+
+DEFAULT_CELL_SIZE: int = 256
+
+CellKey     = Tuple[int, int]
+BoundingBox = Tuple[int, int, int, int]     # left, top, right, bottom
+
+Cells         = NewType('Cells',         Dict[CellKey, Set[int]])
+BoundingBoxes = NewType('BoundingBoxes', Dict[int, BoundingBox])
+IndexHits     = NewType('IndexHits',     Set[int])
+
+
+class SpatialIndex:
+    """
+    A uniform grid spatial index.
+
+    The plane is divided into square cells of `cellSize` pixels.  Each entry is
+    registered in every cell its bounding rectangle overlaps, so a point query only
+    has to look at the entries of a single cell.
+
+    The index does not know anything about shapes;  Callers key the entries with an
+    integer (the UmlDiagram uses the Python object id of the shape)
+    """
+    def __init__(self, cellSize: int = DEFAULT_CELL_SIZE):
+        """
+
+        Args:
+            cellSize:  The width and height of a grid cell in pixels
+        """
+        assert cellSize > 0, 'Cell size must be positive'
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._cellSize: int           = cellSize
+        self._cells:    Cells         = Cells({})
+        self._boxes:    BoundingBoxes = BoundingBoxes({})
+
+    @property
+    def cellSize(self) -> int:
+        return self._cellSize
+
+    def insert(self, key: int, rectangle: Rectangle):
+        """
+        Add an entry to the index.  If the key is already present its bounding
+        rectangle is replaced
+
+        Args:
+            key:        The entry identifier
+            rectangle:  The entry bounding rectangle
+        """
+        if key in self._boxes:
+            self.remove(key)
+
+        boundingBox: BoundingBox = (rectangle.left, rectangle.top, rectangle.right, rectangle.bottom)
+
+        self._boxes[key] = boundingBox
+        for cellKey in self._cellsCovering(boundingBox):
+            cell: Set[int] | None = self._cells.get(cellKey)
+            if cell is None:
+                cell = set()
+                self._cells[cellKey] = cell
+            cell.add(key)
+
+    def remove(self, key: int):
+        """
+        Remove an entry from the index;  Unknown keys are ignored
+
+        Args:
+            key:  The entry identifier
+        """
+        boundingBox: BoundingBox | None = self._boxes.pop(key, None)
+        if boundingBox is None:
+            return
+
+        for cellKey in self._cellsCovering(boundingBox):
+            cell: Set[int] | None = self._cells.get(cellKey)
+            if cell is not None:
+                cell.discard(key)
+                if len(cell) == 0:
+                    del self._cells[cellKey]
+
+    def clear(self):
+        self._cells = Cells({})
+        self._boxes = BoundingBoxes({})
+
+    def pointQuery(self, x: int, y: int) -> IndexHits:
+        """
+        Args:
+            x:  The abscissa
+            y:  The ordinate
+
+        Returns:  The keys of the entries whose bounding rectangle contains the point
+        """
+        hits: IndexHits = IndexHits(set())
+
+        cell: Set[int] | None = self._cells.get(self._cellKey(x, y))
+        if cell is not None:
+            boxes: BoundingBoxes = self._boxes
+            for key in cell:
+                left, top, right, bottom = boxes[key]
+                if left <= x <= right and top <= y <= bottom:
+                    hits.add(key)
+
+        return hits
+
+    def rectangleQuery(self, rectangle: Rectangle) -> IndexHits:
+        """
+        Args:
+            rectangle:  The query rectangle
+
+        Returns:  The keys of the entries whose bounding rectangle intersects the query rectangle
+        """
+        hits:  IndexHits     = IndexHits(set())
+        boxes: BoundingBoxes = self._boxes
+
+        queryBox: BoundingBox = (rectangle.left, rectangle.top, rectangle.right, rectangle.bottom)
+        for cellKey in self._cellsCovering(queryBox):
+            cell: Set[int] | None = self._cells.get(cellKey)
+            if cell is None:
+                continue
+            for key in cell:
+                if key in hits:
+                    continue
+                left, top, right, bottom = boxes[key]
+                if left <= rectangle.right and right >= rectangle.left and top <= rectangle.bottom and bottom >= rectangle.top:
+                    hits.add(key)
+
+        return hits
+
+    def boundingRectangle(self, key: int) -> Rectangle:
+        """
+        Args:
+            key:  The entry identifier
+
+        Returns:  The bounding rectangle the entry was registered with
+        """
+        left, top, right, bottom = self._boxes[key]
+
+        return Rectangle(left=left, top=top, right=right, bottom=bottom)
+
+    def _cellKey(self, x: int, y: int) -> CellKey:
+        return int(x // self._cellSize), int(y // self._cellSize)
+
+    def _cellsCovering(self, boundingBox: BoundingBox) -> Iterator[CellKey]:
+
+        left, top, right, bottom = boundingBox
+
+        firstColumn, firstRow = self._cellKey(left, top)
+        lastColumn,  lastRow  = self._cellKey(right, bottom)
+
+        for column in range(firstColumn, lastColumn + 1):
+            for row in range(firstRow, lastRow + 1):
+                yield column, row
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._boxes
@@ -0,0 +1,16 @@
+
+from enum import Enum
+
+
+class IDStrategy(Enum):
+    """
+    How IDUtil makes IDs for shapes, frames, and pasted model objects
+    """
+    HUMAN_READABLE = 'Human Readable'
+    COUNTER        = 'Counter'
+    UUID4          = 'UUID4'
+    UUID7          = 'UUID7'
+
+    @classmethod
+    def deSerialize(cls, value: str) -> 'IDStrategy':
+        return IDStrategy(value)
@@ -4,13 +4,13 @@ from logging import Logger
 from logging import getLogger
 
 from wx import DC
-from wx import Size
 from wx import MemoryDC
 
 from umlshapes.lib.ogl import EllipseShape
 from umlshapes.lib.ogl import RectangleShape
 
 from umlshapes.utils.ResourceUtils import ResourceUtils
+from umlshapes.utils.TextExtentCache import TextExtentCache
 
 
 class DrawingUtils:
@@ -71,8 +71,9 @@ class DrawingUtils:
         Returns:
             A list of strings that are no wider than the input pixel `width`
         """
-        splitLines: List[str] = text.splitlines()
-        newLines:   List[str] = []
+        splitLines: List[str]       = text.splitlines()
+        newLines:   List[str]       = []
+        extents:    TextExtentCache = TextExtentCache()
 
         for line in splitLines:
             words:     List[str] = line.split()
@@ -81,8 +82,7 @@ class DrawingUtils:
             for wordX in words:
 
                 word:       str  = f'{wordX} '
-                extentSize: Size = dc.GetTextExtent(word)
-                wordWidth:  int  = extentSize.width
+                wordWidth:  int  = extents.textWidth(dc=dc, text=word)
 
                 if lineWidth + wordWidth <= textWidth:
                     newLine = f'{newLine}{word}'
@@ -1,12 +1,131 @@
 
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from itertools import count
+
+from os import getpid
+
+from random import getrandbits
+
+from time import time_ns
+
+from uuid import UUID
+from uuid import uuid4
+
 from human_id import generate_id
 
+from umlshapes.types.IDStrategy import IDStrategy
+
+IDGenerator = Callable[[], str]
+
+
+def counterID() -> IDGenerator:
+    """
+    The fastest;  A counter behind a prefix made from the process id and a random
+    number, so IDs from different processes (or a reused process id) do not collide
+
+    Returns:  A generator of IDs
+    """
+    prefix:  str           = f'{getpid():x}{getrandbits(32):08x}'
+    counter: Iterator[int] = count(1)
+
+    def nextID() -> str:
+        return f'{prefix}-{next(counter):x}'
+
+    return nextID
+
+
+def uuid4ID() -> str:
+    return str(uuid4())
+
+
+def uuid7ID() -> str:
+    """
+    A time ordered UUID (RFC 9562);  The uuid module only has uuid7() from Python 3.14
+
+    Returns:  A version 7 UUID
+    """
+    timeStamp: int = time_ns() // 1_000_000
+    value:     int = (timeStamp & 0xFFFF_FFFF_FFFF) << 80 | getrandbits(80)
+
+    value = value & ~(0xF << 76) | (0x7 << 76)          # version
+    value = value & ~(0x3 << 62) | (0x2 << 62)          # variant
+
+    return str(UUID(int=value))
+
+
+def humanReadableID() -> str:
+    return generate_id()
+
+
+GENERATOR_FACTORIES: Dict[IDStrategy, Callable[[], IDGenerator]] = {
+    IDStrategy.HUMAN_READABLE: lambda: humanReadableID,
+    IDStrategy.COUNTER:        counterID,
+    IDStrategy.UUID4:          lambda: uuid4ID,
+    IDStrategy.UUID7:          lambda: uuid7ID,
+}
+
 
 class IDUtil:
     """
     Isolates ID generation
+
+    The `idStrategy` preference picks how;  Human readable IDs are the default and
+    easiest to debug, but are slow to make.  Use the counter for big diagrams
     """
+    clsLogger: Logger = getLogger(__name__)
+
+    _idStrategy: Optional[IDStrategy]  = None
+    _generator:  Optional[IDGenerator] = None
 
     @classmethod
     def getID(cls) -> str:
-        return generate_id()
+
+        if cls._generator is None:
+            cls._initialize()
+
+        return cls._generator()     # type: ignore
+
+    @classmethod
+    def idStrategy(cls) -> IDStrategy:
+
+        if cls._idStrategy is None:
+            cls._initialize()
+
+        return cls._idStrategy      # type: ignore
+
+    @classmethod
+    def setIDStrategy(cls, idStrategy: IDStrategy):
+        """
+        Change how IDs are made, without changing the preference
+
+        Args:
+            idStrategy:  The new strategy
+        """
+        cls._idStrategy = idStrategy
+        cls._generator  = GENERATOR_FACTORIES[idStrategy]()
+
+        cls.clsLogger.info(f'ID strategy: {idStrategy.value}')
+
+    @classmethod
+    def _initialize(cls):
+        from umlshapes.preferences.UmlPreferences import UmlPreferences
+
+        preferences: UmlPreferences = UmlPreferences()
+        preferences.subscribe(cls._preferenceChanged)
+
+        cls.setIDStrategy(preferences.idStrategy)
+
+    @classmethod
+    def _preferenceChanged(cls, preferenceName: str):
+
+        if preferenceName == 'idStrategy':
+            from umlshapes.preferences.UmlPreferences import UmlPreferences
+
+            cls.setIDStrategy(UmlPreferences().idStrategy)
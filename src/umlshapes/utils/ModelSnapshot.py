@@ -0,0 +1,179 @@
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NewType
+from typing import Tuple
+from typing import Type
+
+from logging import Logger
+from logging import getLogger
+
+from io import BytesIO
+
+from pickle import HIGHEST_PROTOCOL
+from pickle import Unpickler
+from pickle import UnpicklingError
+from pickle import dumps
+
+from struct import Struct
+
+from umlmodel.UmlModelBase import UmlModelBase
+
+from umlshapes.utils.IDUtil import IDUtil
+
+ModelObjects = NewType('ModelObjects', List[UmlModelBase])
+
+ModelState   = Tuple[Type[UmlModelBase], Dict[str, Any]]
+ModelStates  = NewType('ModelStates', List[ModelState])
+
+SNAPSHOT_MAGIC:  bytes  = b'UMLS'
+SNAPSHOT_HEADER: Struct = Struct('<4sI')      # magic, number of model objects
+
+#
+# References to other diagram objects;  A snapshot never copies them
+#
+DETACHED_ATTRIBUTES: Tuple[str, ...] = ('links', 'parents')
+#
+# Some model objects keep a logger;  The snapshot keeps its name
+#
+LOGGER_ATTRIBUTE: str = 'logger'
+
+MODEL_PACKAGE: str = 'umlmodel'
+
+
+class InvalidSnapshotError(Exception):
+    pass
+
+
+class ModelUnpickler(Unpickler):
+    """
+    Only loads classes defined in the model package;  A blob that refers to anything
+    else, e.g. a function to call while loading, is not a model snapshot
+    """
+    def find_class(self, module: str, name: str) -> Any:
+
+        if module.split('.')[0] == MODEL_PACKAGE:
+            try:
+                found: Any = super().find_class(module, name)
+            except (ImportError, AttributeError) as e:
+                raise InvalidSnapshotError(f'Unknown model class: {module}.{name}') from e
+
+            if isinstance(found, type) and found.__module__ == module:
+                return found
+
+        raise InvalidSnapshotError(f'Not a model class: {module}.{name}')
+
+
+class ModelSnapshot:
+    """
+    An immutable copy of some model objects, kept as a compact bytes blob.
+
+    Capturing walks the model objects once, in C, instead of deep copying them in
+    Python.  The snapshot never changes, so the clipboard, the undo history and other
+    frames can share it without copying it again.  Mutable model objects are only made
+    when something needs them;  Each `materialize()` makes fresh objects with new IDs,
+    so the same snapshot pastes any number of times.
+
+    The links to and the parents of the model objects are not captured.
+
+    The blob is a pickle, but loading it only resolves classes from the model package;
+    A blob from elsewhere cannot name any other callable
+    """
+    def __init__(self, blob: bytes = b''):
+        """
+
+        Args:
+            blob:  The bytes from `toBytes()`;  Empty for an empty snapshot
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        if blob == b'':
+            blob = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, 0)
+
+        if len(blob) < SNAPSHOT_HEADER.size:
+            raise InvalidSnapshotError(f'Snapshot too short: {len(blob)} bytes')
+
+        magic, count = SNAPSHOT_HEADER.unpack_from(blob)
+        if magic != SNAPSHOT_MAGIC:
+            raise InvalidSnapshotError(f'Not a model snapshot: {magic!r}')
+
+        self._blob:  bytes = blob
+        self._count: int   = count
+
+    @classmethod
+    def capture(cls, modelObjects: Iterable[UmlModelBase]) -> 'ModelSnapshot':
+        """
+        Args:
+            modelObjects:  The model objects to copy
+
+        Returns:  A snapshot of the model objects as they are now
+        """
+        modelStates: ModelStates = ModelStates([])
+        for modelObject in modelObjects:
+            state: Dict[str, Any] = dict(vars(modelObject))
+            for attributeName in DETACHED_ATTRIBUTES:
+                if attributeName in state:
+                    state[attributeName] = []
+            if isinstance(state.get(LOGGER_ATTRIBUTE), Logger):
+                state[LOGGER_ATTRIBUTE] = state[LOGGER_ATTRIBUTE].name
+            modelStates.append((type(modelObject), state))
+
+        header: bytes = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(modelStates))
+
+        return cls(blob=header + dumps(modelStates, protocol=HIGHEST_PROTOCOL))
+
+    def materialize(self) -> ModelObjects:
+        """
+        Returns:  New model objects, each with a new ID
+        """
+        if self._count == 0:
+            return ModelObjects([])
+
+        modelObjects: ModelObjects = ModelObjects([])
+        for modelType, state in self._loadModelStates():
+            modelObject: UmlModelBase = modelType.__new__(modelType)     # Skip __post_init__;  It generates an ID we would discard
+            modelObject.__dict__.update(state)
+            if isinstance(state.get(LOGGER_ATTRIBUTE), str):
+                setattr(modelObject, LOGGER_ATTRIBUTE, getLogger(state[LOGGER_ATTRIBUTE]))
+            modelObject.id = IDUtil.getID()
+            modelObjects.append(modelObject)
+
+        return modelObjects
+
+    def toBytes(self) -> bytes:
+        return self._blob
+
+    @classmethod
+    def fromBytes(cls, blob: bytes) -> 'ModelSnapshot':
+        return cls(blob=blob)
+
+    def _loadModelStates(self) -> ModelStates:
+        """
+        Returns:  The model states in the blob
+
+        Raises:  InvalidSnapshotError if the blob holds anything but model states
+        """
+        try:
+            modelStates: Any = ModelUnpickler(BytesIO(self._blob[SNAPSHOT_HEADER.size:])).load()
+        except (UnpicklingError, EOFError, ValueError, TypeError) as e:
+            raise InvalidSnapshotError(f'Corrupt snapshot: {e}') from e
+
+        if not isinstance(modelStates, list) or len(modelStates) != self._count:
+            raise InvalidSnapshotError('Snapshot does not hold its model objects')
+
+        for modelState in modelStates:
+            if not (isinstance(modelState, tuple) and len(modelState) == 2 and isinstance(modelState[1], dict)):
+                raise InvalidSnapshotError(f'Not a model state: {type(modelState)}')
+            modelType: Any = modelState[0]
+            if not (isinstance(modelType, type) and issubclass(modelType, UmlModelBase)):
+                raise InvalidSnapshotError(f'Not a model object type: {modelType}')
+
+        return ModelStates(modelStates)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __str__(self) -> str:
+        return f'ModelSnapshot - objects: {self._count} bytes: {len(self._blob)}'
@@ -0,0 +1,131 @@
+
+from typing import NamedTuple
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from wx import DC
+from wx import Font
+
+from codeallybasic.SingletonV3 import SingletonV3
+
+DEFAULT_MAXIMUM_SIZE: int = 8192
+
+ExtentKey = Tuple[str, str]         # font descriptor, text
+
+
+class TextExtent(NamedTuple):
+    """
+    Unpacks like the tuple that `DC.GetTextExtent` returns
+    """
+    width:  int
+    height: int
+
+
+class TextExtentCache(metaclass=SingletonV3):
+    """
+    A process-wide least recently used cache of text measurements.
+
+    Measuring text is one of the most expensive calls we make while drawing, and we make it
+    over and over for the same strings in the same fonts.  Entries are keyed on the native
+    description of the font currently selected in the device context and on the text itself.
+    """
+    def __init__(self, maximumSize: int = DEFAULT_MAXIMUM_SIZE):
+        """
+
+        Args:
+            maximumSize:  The maximum number of measurements to keep
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maximumSize: int = maximumSize
+        self._extents:     OrderedDict[ExtentKey, TextExtent] = OrderedDict()
+
+        self._hits:   int = 0
+        self._misses: int = 0
+
+    @property
+    def maximumSize(self) -> int:
+        return self._maximumSize
+
+    @maximumSize.setter
+    def maximumSize(self, newSize: int):
+        assert newSize > 0, 'The cache must be able to hold something'
+
+        self._maximumSize = newSize
+        self._evict()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def textExtent(self, dc: DC, text: str) -> TextExtent:
+        """
+        Args:
+            dc:     The device context with the font to measure with
+            text:   The text to measure
+
+        Returns:  The text width and height in pixels
+        """
+        key:    ExtentKey         = (TextExtentCache.fontDescriptor(dc.GetFont()), text)
+        extent: TextExtent | None = self._extents.get(key)
+
+        if extent is None:
+            self._misses += 1
+
+            width, height = dc.GetTextExtent(text)
+            extent = TextExtent(width=width, height=height)
+
+            self._extents[key] = extent
+            self._evict()
+        else:
+            self._hits += 1
+            self._extents.move_to_end(key)
+
+        return extent
+
+    def textWidth(self, dc: DC, text: str) -> int:
+        """
+        Args:
+            dc:     The device context with the font to measure with
+            text:   The text to measure
+
+        Returns:  The text width in pixels
+        """
+        return self.textExtent(dc=dc, text=text).width
+
+    def clear(self):
+        """
+        Empty the cache and reset the counters
+        """
+        self._extents.clear()
+        self._hits   = 0
+        self._misses = 0
+
+    def _evict(self):
+
+        while len(self._extents) > self._maximumSize:
+            self._extents.popitem(last=False)
+
+    @classmethod
+    def fontDescriptor(cls, font: Font) -> str:
+        """
+        Returns:  A string that is the same for fonts that measure text the same
+        """
+        if font.IsOk() is True:
+            return font.GetNativeFontInfoDesc()
+        else:
+            return ''
+
+    def __len__(self) -> int:
+        return len(self._extents)
+
+    def __str__(self) -> str:
+        return f'TextExtentCache - size: {len(self)}/{self._maximumSize} hits: {self._hits} misses: {self._misses}'
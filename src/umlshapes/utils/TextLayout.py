@@ -0,0 +1,102 @@
+
+from typing import List
+from typing import NamedTuple
+from typing import NewType
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from wx import DC
+
+from umlshapes.utils.DrawingUtils import DrawingUtils
+from umlshapes.utils.TextExtentCache import TextExtent
+from umlshapes.utils.TextExtentCache import TextExtentCache
+
+LayoutKey = Tuple[str, str, int | None]       # font descriptor, text, wrap width
+
+
+class LayoutLine(NamedTuple):
+    text:   str
+    width:  int
+    height: int
+
+
+LayoutLines = NewType('LayoutLines', List[LayoutLine])
+
+
+class TextLayout:
+    """
+    The lines a shape draws its text on, and the size of each line.
+
+    Breaking text into lines measures every word.  A shape keeps one of these and
+    updates it each time it paints;  The lines are only recomputed when the text,
+    the font selected in the device context or the wrap width changed.
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._key:        LayoutKey | None = None
+        self._lines:      LayoutLines      = LayoutLines([])
+        self._lineHeight: int              = 0
+
+    @property
+    def lines(self) -> LayoutLines:
+        return self._lines
+
+    @property
+    def lineHeight(self) -> int:
+        """
+        Returns:  The character height of the font the lines were measured with
+        """
+        return self._lineHeight
+
+    @property
+    def width(self) -> int:
+        """
+        Returns:  The width of the widest line
+        """
+        return max((line.width for line in self._lines), default=0)
+
+    def update(self, dc: DC, text: str, wrapWidth: int | None = None) -> bool:
+        """
+        Args:
+            dc:         The device context with the font to measure with
+            text:       The text to lay out
+            wrapWidth:  Break lines so they are no wider than this in pixels;  `None` only breaks at new lines
+
+        Returns:  `True` if the lines changed
+        """
+        key: LayoutKey = (TextExtentCache.fontDescriptor(dc.GetFont()), text, wrapWidth)
+        if key == self._key:
+            return False
+
+        if wrapWidth is None:
+            texts: List[str] = text.splitlines()
+        else:
+            texts = DrawingUtils.lineSplitter(text, dc, wrapWidth)
+
+        extents: TextExtentCache = TextExtentCache()
+        lines:   LayoutLines     = LayoutLines([])
+        for lineText in texts:
+            extent: TextExtent = extents.textExtent(dc=dc, text=lineText)
+            lines.append(LayoutLine(text=lineText, width=extent.width, height=extent.height))
+
+        self._lines      = lines
+        self._lineHeight = dc.GetCharHeight()
+        self._key        = key
+
+        return True
+
+    def invalidate(self):
+        """
+        The next update lays out the text again
+        """
+        self._key = None
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __str__(self) -> str:
+        return f'TextLayout - lines: {len(self._lines)} width: {self.width}'
@@ -0,0 +1,269 @@
+
+from typing import List
+from typing import NewType
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from math import ceil
+from math import sqrt
+
+from random import Random
+
+from wx import ClientDC
+
+from umlmodel.Class import Class
+from umlmodel.Field import Field
+from umlmodel.Method import Method
+from umlmodel.SDInstance import SDInstance
+from umlmodel.SDMessage import SDMessage
+from umlmodel.enumerations.LinkType import LinkType
+
+from umlshapes.commands.CreateLinkCommand import CreateLinkCommand
+
+from umlshapes.frames.ClassDiagramFrame import ClassDiagramFrame
+from umlshapes.frames.SequenceDiagramFrame import SequenceDiagramFrame
+
+from umlshapes.preferences.UmlPreferences import UmlPreferences
+
+from umlshapes.pubsubengine.IUmlPubSubEngine import IUmlPubSubEngine
+
+from umlshapes.sd.UmlSDInstance import UmlSDInstance
+from umlshapes.sd.UmlSDMessage import UmlSDMessage
+
+from umlshapes.shapes.UmlClass import UmlClass
+from umlshapes.shapes.eventhandlers.UmlClassEventHandler import UmlClassEventHandler
+
+from umlshapes.types.UmlPosition import UmlPosition
+from umlshapes.types.UmlPosition import UmlPositions
+
+CLASS_SPACING_X:    int = 300
+CLASS_SPACING_Y:    int = 250
+INSTANCE_SPACING_X: int = 200
+MESSAGE_SPACING_Y:  int = 20
+ORIGIN:             int = 50
+BEND_JITTER:        int = 40
+
+LINK_TYPES: List[LinkType] = [LinkType.ASSOCIATION, LinkType.AGGREGATION, LinkType.COMPOSITION, LinkType.INHERITANCE]
+
+UmlClasses     = NewType('UmlClasses',     List[UmlClass])
+UmlSDInstances = NewType('UmlSDInstances', List[UmlSDInstance])
+
+
+@dataclass
+class ClassDiagramSpecification:
+    classCount:  int = 100
+    fieldCount:  int = 5      # per class
+    methodCount: int = 5      # per class
+    linkCount:   int = 100
+    bendCount:   int = 2      # per link
+    seed:        int = 42
+
+
+@dataclass
+class SequenceDiagramSpecification:
+    instanceCount: int = 10
+    messageCount:  int = 100
+    seed:          int = 42
+
+
+class SyntheticDiagrams:
+    """
+    Fills diagram frames with made up diagrams of a given size.
+
+    The same specification always makes the same diagram, so timings from different
+    runs compare.  Shapes and links are created the way the application creates them.
+    """
+    def __init__(self, umlPubSubEngine: IUmlPubSubEngine):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._umlPubSubEngine: IUmlPubSubEngine = umlPubSubEngine
+        self._preferences:     UmlPreferences   = UmlPreferences()
+
+    def populateClassDiagram(self, diagramFrame: ClassDiagramFrame, specification: ClassDiagramSpecification) -> UmlClasses:
+        """
+        Classes are laid out on a square grid;  Links join random pairs of classes
+
+        Args:
+            diagramFrame:   The empty frame to fill
+            specification:  What to make
+
+        Returns:  The classes, in creation order
+        """
+        random:     Random     = Random(specification.seed)
+        umlClasses: UmlClasses = UmlClasses([])
+        columns:    int        = max(ceil(sqrt(specification.classCount)), 1)
+
+        with diagramFrame.batchUpdate():
+            for classNumber in range(specification.classCount):
+                umlPosition: UmlPosition = UmlPosition(
+                    x=ORIGIN + (classNumber % columns) * CLASS_SPACING_X,
+                    y=ORIGIN + (classNumber // columns) * CLASS_SPACING_Y
+                )
+                umlClass: UmlClass = self._createClass(
+                    diagramFrame=diagramFrame,
+                    modelClass=self._createModelClass(classNumber=classNumber, specification=specification),
+                    umlPosition=umlPosition
+                )
+                umlClasses.append(umlClass)
+
+            if len(umlClasses) > 1:
+                for linkNumber in range(specification.linkCount):
+                    source, destination = random.sample(umlClasses, 2)
+                    self._createLink(
+                        diagramFrame=diagramFrame,
+                        source=source,
+                        destination=destination,
+                        linkType=LINK_TYPES[linkNumber % len(LINK_TYPES)],
+                        bends=self._bendPositions(source=source, destination=destination, bendCount=specification.bendCount, random=random)
+                    )
+
+        self.logger.info(f'Class diagram: {specification}')
+
+        return umlClasses
+
+    def populateSequenceDiagram(self, diagramFrame: SequenceDiagramFrame, specification: SequenceDiagramSpecification) -> UmlSDInstances:
+        """
+        Instances are side by side;  Messages go between random pairs of instances,
+        each one further down the lifelines
+
+        Args:
+            diagramFrame:   The empty frame to fill
+            specification:  What to make
+
+        Returns:  The instances, left to right
+        """
+        random:      Random         = Random(specification.seed)
+        sdInstances: UmlSDInstances = UmlSDInstances([])
+        instanceY:   int            = self._preferences.instanceYPosition
+
+        with diagramFrame.batchUpdate():
+            for instanceNumber in range(specification.instanceCount):
+                sdInstances.append(
+                    self._createSDInstance(
+                        diagramFrame=diagramFrame,
+                        instanceName=f'instance{instanceNumber}',
+                        umlPosition=UmlPosition(x=ORIGIN + instanceNumber * INSTANCE_SPACING_X, y=instanceY)
+                    )
+                )
+
+            if len(sdInstances) > 1:
+                for messageNumber in range(specification.messageCount):
+                    source, destination = random.sample(sdInstances, 2)
+                    self._createSDMessage(
+                        diagramFrame=diagramFrame,
+                        source=source,
+                        destination=destination,
+                        messageNumber=messageNumber,
+                        messageY=instanceY + (messageNumber + 2) * MESSAGE_SPACING_Y
+                    )
+
+        self.logger.info(f'Sequence diagram: {specification}')
+
+        return sdInstances
+
+    def _createModelClass(self, classNumber: int, specification: ClassDiagramSpecification) -> Class:
+
+        modelClass: Class = Class(name=f'SyntheticClass{classNumber:05d}')
+        for fieldNumber in range(specification.fieldCount):
+            modelClass.fields.append(Field(name=f'field{fieldNumber:03d}', defaultValue=f'{fieldNumber}'))
+        for methodNumber in range(specification.methodCount):
+            modelClass.methods.append(Method(name=f'method{methodNumber:03d}'))
+
+        return modelClass
+
+    def _createClass(self, diagramFrame: ClassDiagramFrame, modelClass: Class, umlPosition: UmlPosition) -> UmlClass:
+
+        umlClass: UmlClass = UmlClass(modelClass=modelClass)
+
+        umlClass.position = umlPosition
+        umlClass.umlFrame = diagramFrame
+        diagramFrame.umlDiagram.AddShape(umlClass)
+        umlClass.Show(show=True)
+
+        eventHandler: UmlClassEventHandler = UmlClassEventHandler(previousEventHandler=umlClass.GetEventHandler())
+
+        # Don't change the order. The umlPubSubEngine property assumes the shape was assigned
+        eventHandler.SetShape(umlClass)
+        eventHandler.umlPubSubEngine = self._umlPubSubEngine
+        umlClass.SetEventHandler(eventHandler)
+
+        umlClass.autoSize()
+
+        return umlClass
+
+    def _createLink(self, diagramFrame: ClassDiagramFrame, source: UmlClass, destination: UmlClass, linkType: LinkType, bends: UmlPositions):
+
+        createLinkCommand: CreateLinkCommand = CreateLinkCommand(
+            umlFrame=diagramFrame,
+            partialName=f'{linkType}',
+            sourceShape=source,
+            destinationShape=destination,
+            linkType=linkType,
+            umlPubSubEngine=self._umlPubSubEngine,
+            linkControlPositions=bends
+        )
+        diagramFrame.commandProcessor.Submit(command=createLinkCommand, storeIt=False)
+
+    def _bendPositions(self, source: UmlClass, destination: UmlClass, bendCount: int, random: Random) -> UmlPositions:
+        """
+        Returns:  Bends spread along the straight line between the classes, a little off it
+        """
+        bends: UmlPositions = UmlPositions([])
+        for bendNumber in range(1, bendCount + 1):
+            fraction: float = bendNumber / (bendCount + 1)
+            bends.append(
+                UmlPosition(
+                    x=round(source.position.x + (destination.position.x - source.position.x) * fraction) + random.randint(-BEND_JITTER, BEND_JITTER),
+                    y=round(source.position.y + (destination.position.y - source.position.y) * fraction) + random.randint(-BEND_JITTER, BEND_JITTER)
+                )
+            )
+
+        return bends
+
+    def _createSDInstance(self, diagramFrame: SequenceDiagramFrame, instanceName: str, umlPosition: UmlPosition) -> UmlSDInstance:
+
+        sdInstance: SDInstance = SDInstance()
+        sdInstance.instanceName = instanceName
+
+        umlSDInstance: UmlSDInstance = UmlSDInstance(sdInstance=sdInstance, diagramFrame=diagramFrame, umlPubSubEngine=self._umlPubSubEngine)
+
+        dc: ClientDC = ClientDC(diagramFrame)
+        diagramFrame.PrepareDC(dc)
+
+        x, y = umlSDInstance.computeCenterXY(umlPosition)
+        umlSDInstance.Move(dc, x, y)
+        umlSDInstance.SetCanvas(diagramFrame)
+        umlSDInstance.position = umlPosition
+
+        diagramFrame.umlDiagram.AddShape(umlSDInstance)
+        umlSDInstance.Show(True)
+
+        return umlSDInstance
+
+    def _createSDMessage(self, diagramFrame: SequenceDiagramFrame, source: UmlSDInstance, destination: UmlSDInstance, messageNumber: int, messageY: int):
+
+        sourceX:      int = round(source.umlSDLifeLine.GetX())
+        destinationX: int = round(destination.umlSDLifeLine.GetX())
+
+        modelMessage: SDMessage = SDMessage(
+            message=f'message{messageNumber:05d}',
+            src=source.umlSDLifeLine.umlInstanceName.sdInstance,
+            sourceY=messageY,
+            dst=destination.umlSDLifeLine.umlInstanceName.sdInstance,
+            destinationY=messageY,
+        )
+        umlSDMessage: UmlSDMessage = UmlSDMessage(sdMessage=modelMessage, umlPubSubEngine=self._umlPubSubEngine)
+        umlSDMessage.umlFrame = diagramFrame
+
+        source.umlSDLifeLine.addMessage(umlSDMessage=umlSDMessage, destinationLifeLine=destination.umlSDLifeLine)
+
+        umlSDMessage.SetEnds(x1=sourceX, y1=messageY, x2=destinationX, y2=messageY)
+        umlSDMessage.fromY = messageY
+        umlSDMessage.toY   = messageY
+
+        umlSDMessage.Show(True)
+        diagramFrame.umlDiagram.AddShape(umlSDMessage)
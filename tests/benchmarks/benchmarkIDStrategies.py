@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+Times each IDUtil strategy
+
+    python -m tests.benchmarks.benchmarkIDStrategies [--count N] [--json]
+"""
+from typing import Dict
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from json import dumps
+
+from timeit import repeat
+
+from umlshapes.types.IDStrategy import IDStrategy
+
+from umlshapes.utils.IDUtil import IDUtil
+
+DEFAULT_COUNT:   int = 10000
+REPEAT_COUNT:    int = 5
+
+IDTimings = Dict[str, float]
+
+
+def benchmarkIDStrategies(numberOfIDs: int) -> IDTimings:
+    """
+    Args:
+        numberOfIDs:  How many IDs to make with each strategy
+
+    Returns:  The best time per ID in microseconds by strategy name
+    """
+    timings: IDTimings = {}
+    for idStrategy in IDStrategy:
+        IDUtil.setIDStrategy(idStrategy)
+        bestTime: float = min(repeat(IDUtil.getID, number=numberOfIDs, repeat=REPEAT_COUNT))
+
+        timings[idStrategy.value] = bestTime / numberOfIDs * 1_000_000
+
+    return timings
+
+
+def main():
+    parser: ArgumentParser = ArgumentParser(description='Compare the IDUtil ID strategies')
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT, help='IDs made per strategy per repeat')
+    parser.add_argument('--json',  action='store_true',              help='Print machine readable results')
+
+    args:    Namespace = parser.parse_args()
+    timings: IDTimings = benchmarkIDStrategies(numberOfIDs=args.count)
+
+    if args.json is True:
+        print(dumps({'benchmark': 'idStrategies', 'count': args.count, 'microsecondsPerID': timings}, indent=4))
+    else:
+        fastest: float = min(timings.values())
+        for strategyName, microseconds in sorted(timings.items(), key=lambda item: item[1]):
+            print(f'{strategyName:<16} {microseconds:8.3f} us/id  {microseconds / fastest:6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
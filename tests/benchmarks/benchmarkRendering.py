@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+"""
+Times the drawing and interaction paths on synthetic class and sequence diagrams
+
+    python -m tests.benchmarks.benchmarkRendering [--classes N] [--fields M] [--methods M] [--links L] [--bends B]
+                                                  [--instances I] [--messages K] [--repeat R] [--json] [--output FILE]
+
+wx needs a display;  On a build machine run it under a virtual X server
+
+    xvfb-run -a -s '-screen 0 1920x1080x24' python -m tests.benchmarks.benchmarkRendering --json --output results.json
+"""
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from argparse import ArgumentParser
+from argparse import Namespace
+
+from dataclasses import asdict
+from dataclasses import dataclass
+
+from json import dumps
+
+from os import environ
+
+from pathlib import Path
+
+from platform import platform
+from platform import python_version
+
+from random import Random
+
+from statistics import median
+
+from time import perf_counter
+
+from wx import App
+from wx import ClientDC
+from wx import Frame
+
+from wx import VERSION_STRING
+
+from umlshapes.UmlDiagram import UmlDiagram
+
+from umlshapes.frames.ClassDiagramFrame import ClassDiagramFrame
+from umlshapes.frames.SequenceDiagramFrame import SequenceDiagramFrame
+from umlshapes.frames.UmlFrame import Ltrb
+from umlshapes.frames.UmlFrame import UmlFrame
+
+from umlshapes.pubsubengine.UmlPubSubEngine import UmlPubSubEngine
+
+from umlshapes.types.DeltaXY import DeltaXY
+from umlshapes.types.UmlDimensions import UmlDimensions
+
+from tests.benchmarks.SyntheticDiagrams import ClassDiagramSpecification
+from tests.benchmarks.SyntheticDiagrams import SequenceDiagramSpecification
+from tests.benchmarks.SyntheticDiagrams import SyntheticDiagrams
+from tests.benchmarks.SyntheticDiagrams import UmlClasses
+
+DEFAULT_REPEAT:    int   = 5
+FIND_SHAPE_COUNT:  int   = 1000
+MOVE_COUNT:        int   = 50
+SELECTED_FRACTION: float = 0.1
+FRAME_WIDTH:       int   = 1600
+FRAME_HEIGHT:      int   = 1000
+
+
+@dataclass
+class Timing:
+    """
+    Milliseconds for one run of an operation
+    """
+    best:   float = 0.0
+    median: float = 0.0
+    worst:  float = 0.0
+    repeat: int   = 0
+
+
+Timings = Dict[str, Timing]
+
+
+def timeOperation(operation: Callable[[], None], repeat: int) -> Timing:
+    """
+    Args:
+        operation:  Called once per repeat
+        repeat:     How many times to call it
+
+    Returns:  The spread of the run times
+    """
+    samples: List[float] = []
+    for _ in range(repeat):
+        startTime: float = perf_counter()
+        operation()
+        samples.append((perf_counter() - startTime) * 1000)
+
+    return Timing(best=min(samples), median=median(samples), worst=max(samples), repeat=repeat)
+
+
+def benchmarkFrame(umlFrame: UmlFrame, repeat: int, seed: int) -> Timings:
+    """
+    The operations every diagram has
+
+    Args:
+        umlFrame:   A populated frame
+        repeat:     Runs per operation
+        seed:       For the shape lookup points
+
+    Returns:  Timings by operation name
+    """
+    umlDiagram: UmlDiagram = umlFrame.umlDiagram
+    random:     Random     = Random(seed)
+
+    boundaries: Ltrb = umlFrame.shapeBoundaries
+    if boundaries.right < boundaries.left:      # An empty diagram
+        boundaries = Ltrb(left=0, top=0, right=FRAME_WIDTH, bottom=FRAME_HEIGHT)
+
+    points: List[Tuple[int, int]] = [
+        (random.randint(boundaries.left, boundaries.right), random.randint(boundaries.top, boundaries.bottom))
+        for _ in range(FIND_SHAPE_COUNT)
+    ]
+
+    def redrawAll():
+        dc: ClientDC = ClientDC(umlFrame)
+        umlFrame.PrepareDC(dc)
+        umlDiagram.Redraw(dc=dc)
+
+    def redrawVisible():
+        dc: ClientDC = ClientDC(umlFrame)
+        umlFrame.PrepareDC(dc)
+        umlDiagram.Redraw(dc=dc, rect=umlFrame.visibleRectangle)
+
+    def findShapes():
+        for x, y in points:
+            umlFrame.FindShape(x, y)
+
+    def rubberBandSelect():
+        umlFrame._beginSelect(x=boundaries.left, y=boundaries.top)
+        umlFrame._selector.size = UmlDimensions(
+            width=(boundaries.right - boundaries.left) // 2,
+            height=(boundaries.bottom - boundaries.top) // 2
+        )
+        umlFrame.OnEndDragLeft(x=boundaries.right, y=boundaries.bottom)
+        umlFrame._unSelectAllShapesOnCanvas()
+
+    return {
+        'redrawAll':        timeOperation(redrawAll,        repeat=repeat),
+        'redrawVisible':    timeOperation(redrawVisible,    repeat=repeat),
+        'findShape':        timeOperation(findShapes,       repeat=repeat),
+        'rubberBandSelect': timeOperation(rubberBandSelect, repeat=repeat),
+    }
+
+
+def benchmarkClassDiagram(diagramFrame: ClassDiagramFrame, umlClasses: UmlClasses, repeat: int, seed: int) -> Timings:
+    """
+    Adds the class diagram only operations
+
+    Args:
+        diagramFrame:   A populated frame
+        umlClasses:     The classes on it
+        repeat:         Runs per operation
+        seed:           For picking the moved classes
+
+    Returns:  Timings by operation name
+    """
+    timings: Timings = benchmarkFrame(umlFrame=diagramFrame, repeat=repeat, seed=seed)
+    random:  Random  = Random(seed)
+
+    movedClasses: UmlClasses = UmlClasses(random.sample(umlClasses, max(round(len(umlClasses) * SELECTED_FRACTION), 1)))
+
+    def moveSelectedShapes():
+        for umlClass in movedClasses:
+            umlClass.selected = True
+        for step in range(MOVE_COUNT):
+            delta: int = 1 if step % 2 == 0 else -1
+            diagramFrame.moveSelectedShapes(DeltaXY(deltaX=delta, deltaY=delta))
+        diagramFrame.clearMovedShapes()
+        diagramFrame._unSelectAllShapesOnCanvas()
+
+    def autoSize():
+        for umlClass in umlClasses:
+            umlClass.autoSize()
+
+    timings['moveSelectedShapes'] = timeOperation(moveSelectedShapes, repeat=repeat)
+    timings['autoSize']           = timeOperation(autoSize,           repeat=repeat)
+
+    return timings
+
+
+def createTopLevelFrame(title: str) -> Frame:
+    return Frame(None, title=title, size=(FRAME_WIDTH, FRAME_HEIGHT))
+
+
+def runBenchmarks(classSpecification: ClassDiagramSpecification, sequenceSpecification: SequenceDiagramSpecification, repeat: int) -> Dict:
+    """
+    Returns:  The machine readable results
+    """
+    app:             App             = App()
+    umlPubSubEngine: UmlPubSubEngine = UmlPubSubEngine()
+
+    syntheticDiagrams: SyntheticDiagrams = SyntheticDiagrams(umlPubSubEngine=umlPubSubEngine)
+
+    frame:             Frame             = createTopLevelFrame(title='Class Diagram Benchmark')
+    classDiagramFrame: ClassDiagramFrame = ClassDiagramFrame(parent=frame, umlPubSubEngine=umlPubSubEngine)
+    frame.Show(True)
+
+    umlClasses:   UmlClasses = syntheticDiagrams.populateClassDiagram(diagramFrame=classDiagramFrame, specification=classSpecification)
+    classTimings: Timings    = benchmarkClassDiagram(diagramFrame=classDiagramFrame, umlClasses=umlClasses, repeat=repeat, seed=classSpecification.seed)
+    frame.Destroy()
+
+    frame = createTopLevelFrame(title='Sequence Diagram Benchmark')
+    sequenceDiagramFrame: SequenceDiagramFrame = SequenceDiagramFrame(parent=frame, umlPubSubEngine=umlPubSubEngine)
+    frame.Show(True)
+
+    syntheticDiagrams.populateSequenceDiagram(diagramFrame=sequenceDiagramFrame, specification=sequenceSpecification)
+    sequenceTimings: Timings = benchmarkFrame(umlFrame=sequenceDiagramFrame, repeat=repeat, seed=sequenceSpecification.seed)
+    frame.Destroy()
+
+    app.Destroy()
+
+    return {
+        'benchmark':   'rendering',
+        'environment': {
+            'python':   python_version(),
+            'wx':       VERSION_STRING,
+            'platform': platform(),
+            'display':  environ.get('DISPLAY', ''),
+        },
+        'classDiagram': {
+            'specification': asdict(classSpecification),
+            'milliseconds':  {name: asdict(timing) for name, timing in classTimings.items()},
+        },
+        'sequenceDiagram': {
+            'specification': asdict(sequenceSpecification),
+            'milliseconds':  {name: asdict(timing) for name, timing in sequenceTimings.items()},
+        },
+    }
+
+
+def main():
+    parser: ArgumentParser = ArgumentParser(description='Time drawing and interaction on synthetic diagrams')
+    parser.add_argument('--classes',   type=int, default=100, help='Classes on the class diagram')
+    parser.add_argument('--fields',    type=int, default=5,   help='Fields per class')
+    parser.add_argument('--methods',   type=int, default=5,   help='Methods per class')
+    parser.add_argument('--links',     type=int, default=100, help='Links on the class diagram')
+    parser.add_argument('--bends',     type=int, default=2,   help='Bends per link')
+    parser.add_argument('--instances', type=int, default=10,  help='Instances on the sequence diagram')
+    parser.add_argument('--messages',  type=int, default=100, help='Messages on the sequence diagram')
+    parser.add_argument('--seed',      type=int, default=42,  help='Makes the same diagrams each run')
+    parser.add_argument('--repeat',    type=int, default=DEFAULT_REPEAT, help='Runs per operation')
+    parser.add_argument('--json',      action='store_true', help='Print machine readable results')
+    parser.add_argument('--output',    type=Path, default=None, help='Also write the machine readable results here')
+
+    args: Namespace = parser.parse_args()
+
+    results: Dict = runBenchmarks(
+        classSpecification=ClassDiagramSpecification(
+            classCount=args.classes,
+            fieldCount=args.fields,
+            methodCount=args.methods,
+            linkCount=args.links,
+            bendCount=args.bends,
+            seed=args.seed
+        ),
+        sequenceSpecification=SequenceDiagramSpecification(instanceCount=args.instances, messageCount=args.messages, seed=args.seed),
+        repeat=args.repeat
+    )
+    report: str = dumps(results, indent=4)
+
+    if args.output is not None:
+        args.output.write_text(report)
+
+    if args.json is True:
+        print(report)
+    else:
+        for diagramName in ('classDiagram', 'sequenceDiagram'):
+            print(diagramName)
+            for operationName, timing in results[diagramName]['milliseconds'].items():
+                print(f'    {operationName:<20} best {timing["best"]:10.3f} ms  median {timing["median"]:10.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
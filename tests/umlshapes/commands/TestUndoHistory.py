@@ -0,0 +1,179 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import Command
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlshapes.commands.UndoHistory import HistoryFootprint
+from umlshapes.commands.UndoHistory import UndoHistory
+
+
+class CountingCommand(Command):
+    """
+    Adds its amount to a shared total;  Absorbs the next command when asked to
+    """
+    def __init__(self, total: list, amount: int, size: int = 100, coalescing: bool = False):
+
+        self._total:      list = total
+        self._amount:     int  = amount
+        self._size:       int  = size
+        self._coalescing: bool = coalescing
+
+        super().__init__(canUndo=True, name=f'Count-{amount}')
+
+    def GetName(self) -> str:
+        return f'Count-{self._amount}'
+
+    def CanUndo(self) -> bool:
+        return True
+
+    def Do(self) -> bool:
+        self._total[0] += self._amount
+        return True
+
+    def Undo(self) -> bool:
+        self._total[0] -= self._amount
+        return True
+
+    def coalesce(self, command: Command) -> bool:
+
+        if self._coalescing is False or not isinstance(command, CountingCommand):
+            return False
+
+        self._amount += command._amount
+        self._size   += command._size
+        return True
+
+    def estimatedSize(self) -> int:
+        return self._size
+
+
+class TestUndoHistory(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+        self._total:       list        = [0]
+        self._undoHistory: UndoHistory = UndoHistory(maxEntries=3, maxBytes=1000, coalesceMoves=True)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testUndoRedo(self):
+
+        self._undoHistory.Submit(CountingCommand(self._total, 1))
+        self._undoHistory.Submit(CountingCommand(self._total, 2))
+
+        self._undoHistory.Undo()
+        self.assertEqual(1, self._total[0], 'Undo did not revert the last command')
+
+        self._undoHistory.Redo()
+        self.assertEqual(3, self._total[0], 'Redo did not rerun the command')
+
+    def testMaximumEntries(self):
+
+        for amount in range(5):
+            self._undoHistory.Submit(CountingCommand(self._total, amount))
+
+        self.assertEqual(3, len(self._undoHistory), 'Oldest commands should have been forgotten')
+
+    def testMaximumBytes(self):
+
+        self._undoHistory.Submit(CountingCommand(self._total, 1, size=600))
+        self._undoHistory.Submit(CountingCommand(self._total, 2, size=600))
+
+        footprint: HistoryFootprint = self._undoHistory.footprint
+        self.assertEqual(1,   footprint.entryCount,     'Should be trimmed to the byte budget')
+        self.assertEqual(600, footprint.estimatedBytes, 'Incorrect accounting')
+
+    def testSubmitDiscardsRedo(self):
+
+        self._undoHistory.Submit(CountingCommand(self._total, 1))
+        self._undoHistory.Submit(CountingCommand(self._total, 2))
+        self._undoHistory.Undo()
+        self._undoHistory.Submit(CountingCommand(self._total, 4))
+
+        self.assertFalse(self._undoHistory.CanRedo(), 'Redo entries should be gone')
+        self.assertEqual(200, self._undoHistory.estimatedBytes, 'Redo entries still counted')
+
+    def testCoalesce(self):
+
+        self._undoHistory.Submit(CountingCommand(self._total, 1, coalescing=True))
+        self._undoHistory.Submit(CountingCommand(self._total, 2))
+
+        self.assertEqual(1, len(self._undoHistory), 'Commands should have coalesced')
+        self.assertEqual(200, self._undoHistory.estimatedBytes, 'Coalesced size not accounted')
+
+        self._undoHistory.Undo()
+        self.assertEqual(0, self._total[0], 'A single undo should revert both')
+
+    def testNoCoalesceAcrossSave(self):
+
+        self._undoHistory.Submit(CountingCommand(self._total, 1, coalescing=True))
+        self._undoHistory.MarkAsSaved()
+        self._undoHistory.Submit(CountingCommand(self._total, 2))
+
+        self.assertEqual(2, len(self._undoHistory), 'Must not coalesce into the saved command')
+        self.assertTrue(self._undoHistory.IsDirty(), 'Should be dirty after the save')
+
+    def testDirtyTracking(self):
+
+        self._undoHistory.Submit(CountingCommand(self._total, 1))
+        self._undoHistory.MarkAsSaved()
+        self.assertFalse(self._undoHistory.IsDirty(), 'Just saved')
+
+        self._undoHistory.Undo()
+        self.assertTrue(self._undoHistory.IsDirty(), 'Undo after save is a change')
+
+        self._undoHistory.Redo()
+        self.assertFalse(self._undoHistory.IsDirty(), 'Back at the saved command')
+
+    def testClearKeepsSavedState(self):
+
+        self._undoHistory.Submit(CountingCommand(self._total, 1))
+        self._undoHistory.MarkAsSaved()
+        self._undoHistory.ClearCommands()
+
+        self.assertFalse(self._undoHistory.IsDirty(), 'Clearing a saved history is not a change')
+        self.assertFalse(self._undoHistory.CanUndo(), 'Nothing left to undo')
+        self.assertIsNone(self._undoHistory.GetCurrentCommand(), 'No current command')
+
+    def testAccelerators(self):
+
+        self._undoHistory.SetUndoAccelerator('\tCtrl+U')
+        self._undoHistory.SetRedoAccelerator('\tCtrl+R')
+
+        self.assertEqual('&Undo\tCtrl+U', self._undoHistory.GetUndoMenuLabel(), 'Undo label should use the new accelerator')
+        self.assertEqual('&Redo\tCtrl+R', self._undoHistory.GetRedoMenuLabel(), 'Redo label should use the new accelerator')
+
+    def testMenuLabels(self):
+
+        self._undoHistory.Submit(CountingCommand(self._total, 1))
+        self._undoHistory.Submit(CountingCommand(self._total, 2))
+        self._undoHistory.Undo()
+
+        self.assertTrue(self._undoHistory.GetUndoMenuLabel().startswith('&Undo Count-1'), 'Undo should name the current command')
+        self.assertTrue(self._undoHistory.GetRedoMenuLabel().startswith('&Redo Count-2'), 'Redo should name the undone command')
+
+        self._undoHistory.Redo()
+        self.assertEqual(f'&Redo{self._undoHistory.GetRedoAccelerator()}', self._undoHistory.GetRedoMenuLabel(), 'Nothing to redo')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestUndoHistory))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,90 @@
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.lib.ogl import CONTROL_POINT_DIAGONAL
+
+from umlshapes.lib.ogl import ControlPoint
+from umlshapes.lib.ogl import RectangleShape
+
+from umlshapes.frames.SelectionHandleOverlay import SelectionHandleOverlay
+
+HANDLE_SIZE: int = 6
+
+
+class TestSelectionHandleOverlay(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self._overlay: SelectionHandleOverlay = SelectionHandleOverlay()
+        self._owner:   RectangleShape         = RectangleShape(w=100, h=100)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testFindsTopmostHandle(self):
+
+        bottom: ControlPoint = self._createHandle(x=50, y=50)
+        top:    ControlPoint = self._createHandle(x=50, y=50)
+
+        handle, _ = self._overlay.findHandle(50, 50)
+
+        self.assertIs(top, handle, 'The last handle added is on top')
+        self.assertIsNot(bottom, handle, 'The bottom handle is hidden')
+
+    def testMissReturnsNone(self):
+
+        self._createHandle(x=50, y=50)
+
+        handle, attachment = self._overlay.findHandle(500, 500)
+
+        self.assertIsNone(handle, 'Nothing at that position')
+        self.assertEqual(0, attachment, 'No attachment either')
+
+    def testRemovedHandleIsNotFound(self):
+
+        handle: ControlPoint = self._createHandle(x=50, y=50)
+
+        self._overlay.remove(handle)
+        self._overlay.remove(handle)
+
+        self.assertEqual(0, len(self._overlay), 'The handle should be gone')
+        self.assertIsNone(self._overlay.findHandle(50, 50)[0], 'A removed handle is not hit')
+
+    def testIgnoresTheOwnersHandles(self):
+
+        handle: ControlPoint = self._createHandle(x=50, y=50)
+        self._owner.GetChildren().append(handle)
+
+        self.assertIsNone(self._overlay.findHandle(50, 50, notObject=self._owner)[0], 'The owner asked to ignore its own handles')
+
+    def _createHandle(self, x: int, y: int) -> ControlPoint:
+
+        handle: ControlPoint = ControlPoint(None, self._owner, HANDLE_SIZE, 0, 0, CONTROL_POINT_DIAGONAL)
+        handle.SetX(x)
+        handle.SetY(y)
+
+        self._overlay.add(handle)
+
+        return handle
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSelectionHandleOverlay))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,84 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.lib.ogl import RectangleShape
+
+from umlshapes.frames.SelectionModel import SelectionModel
+
+
+class TestSelectionModel(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self._selectionModel: SelectionModel = SelectionModel()
+        self._notifications:  int            = 0
+
+        self._selectionModel.subscribe(self._selectionChanged)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testAddIsIdempotent(self):
+
+        shape: RectangleShape = RectangleShape(w=10, h=10)
+
+        self._selectionModel.add(shape)
+        self._selectionModel.add(shape)
+
+        self.assertEqual(1, len(self._selectionModel), 'Shape selected twice')
+        self.assertEqual(1, self._notifications, 'The second add changed nothing')
+
+    def testDiscard(self):
+
+        shape: RectangleShape = RectangleShape(w=10, h=10)
+
+        self._selectionModel.add(shape)
+        self._selectionModel.discard(shape)
+        self._selectionModel.discard(shape)
+
+        self.assertNotIn(shape, self._selectionModel, 'Shape should no longer be selected')
+        self.assertEqual(2, self._notifications, 'The second discard changed nothing')
+
+    def testBatchNotifiesOnce(self):
+
+        with self._selectionModel.batch():
+            for _ in range(10):
+                self._selectionModel.add(RectangleShape(w=10, h=10))
+            with self._selectionModel.batch():
+                self._selectionModel.clear()
+            self.assertEqual(0, self._notifications, 'Notified inside a batch')
+
+        self.assertEqual(1, self._notifications, 'Batch should notify once')
+
+    def testEmptyBatchDoesNotNotify(self):
+
+        with self._selectionModel.batch():
+            self._selectionModel.clear()
+
+        self.assertEqual(0, self._notifications, 'Nothing changed')
+
+    def _selectionChanged(self):
+        self._notifications += 1
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSelectionModel))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
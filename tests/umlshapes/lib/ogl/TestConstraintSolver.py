@@ -0,0 +1,147 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.lib.ogl import CONSTRAINT_ALIGNED_TOP
+from umlshapes.lib.ogl import CONSTRAINT_BELOW
+from umlshapes.lib.ogl import CONSTRAINT_LEFT_OF
+from umlshapes.lib.ogl import CompositeShape
+from umlshapes.lib.ogl import Constraint
+from umlshapes.lib.ogl import ConstraintSolver
+from umlshapes.lib.ogl import OGLInitialize
+from umlshapes.lib.ogl import RectangleShape
+from umlshapes.lib.ogl import ShapeCanvas
+
+ANCHOR_X:      int = 200
+ANCHOR_Y:      int = 200
+ANCHOR_WIDTH:  int = 100
+ANCHOR_HEIGHT: int = 50
+
+CHILD_WIDTH:  int = 40
+CHILD_HEIGHT: int = 20
+
+BELOW_Y:   float = ANCHOR_Y + ANCHOR_HEIGHT / 2.0 + CHILD_HEIGHT / 2.0
+LEFT_OF_X: float = ANCHOR_X - ANCHOR_WIDTH / 2.0 - CHILD_WIDTH / 2.0
+
+
+class TestConstraintSolver(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+
+    The composite has an anchor, a shape below the anchor, and a shape left
+    of the anchor whose top is aligned with the shape below
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        OGLInitialize()
+
+        self._anchor: RectangleShape = self._createChild(ANCHOR_WIDTH, ANCHOR_HEIGHT, ANCHOR_X, ANCHOR_Y)
+        self._below:  RectangleShape = self._createChild(CHILD_WIDTH, CHILD_HEIGHT, ANCHOR_X, 0)
+        self._leftOf: RectangleShape = self._createChild(CHILD_WIDTH, CHILD_HEIGHT, 0, 0)
+
+        self._composite: CompositeShape = CompositeShape()
+        self._composite.AddChild(self._anchor)
+        self._composite.AddChild(self._below)
+        self._composite.AddChild(self._leftOf)
+
+        self._composite.AddConstraint(Constraint(CONSTRAINT_BELOW,       self._anchor, [self._below]))
+        self._composite.AddConstraint(Constraint(CONSTRAINT_LEFT_OF,     self._anchor, [self._leftOf]))
+        self._composite.AddConstraint(Constraint(CONSTRAINT_ALIGNED_TOP, self._below,  [self._leftOf]))
+
+        self._composite.SetCanvas(ShapeCanvas(parent=self._listeningWindow))
+
+        self._solver: ConstraintSolver = self._composite.GetConstraintSolver()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testFullRecompute(self):
+
+        satisfied: bool = self._composite.Recompute()
+
+        self.assertTrue(satisfied, 'The constraints are consistent')
+        self._assertLaidOut()
+        # Everything moves on the first pass, the second pass confirms the
+        # children and the third confirms the composite size
+        self.assertEqual(3, self._solver.GetIterations(), 'Incorrect number of passes')
+        self.assertEqual(6, self._solver.GetEvaluations(), 'Every constraint is evaluated on the first two passes')
+
+    def testIncrementalRecompute(self):
+
+        self._composite.Recompute()
+
+        self._below.SetY(500)
+        satisfied: bool = self._composite.Recompute(changed=[self._below])
+
+        self.assertTrue(satisfied, 'The constraints are consistent')
+        self._assertLaidOut()
+        self.assertEqual(3, self._solver.GetIterations(), 'Incorrect number of passes')
+        self.assertEqual(4, self._solver.GetEvaluations(), 'The left of constraint does not involve the changed shape')
+
+    def testUnchangedShapeSolvesInOnePass(self):
+
+        self._composite.Recompute()
+
+        satisfied: bool = self._composite.Recompute(changed=[self._anchor])
+
+        self.assertTrue(satisfied, 'The constraints are consistent')
+        self._assertLaidOut()
+        self.assertEqual(1, self._solver.GetIterations(), 'Nothing should move')
+        self.assertEqual(2, self._solver.GetEvaluations(), 'Only the constraints on the anchor are evaluated')
+
+    def testRecomputeParent(self):
+
+        self._composite.Recompute()
+
+        self._below.SetY(500)
+        satisfied: bool = self._below.RecomputeParent()
+
+        self.assertTrue(satisfied, 'The constraints are consistent')
+        self._assertLaidOut()
+        self.assertEqual(4, self._solver.GetEvaluations(), 'The parent should only re-evaluate what involves the moved child')
+
+    def testRecomputeParentWithoutParent(self):
+
+        self.assertTrue(self._composite.RecomputeParent(), 'A top level shape has nothing to recompute')
+
+    def _assertLaidOut(self):
+
+        self.assertEqual(ANCHOR_X, self._anchor.GetX(), 'The anchor is not constrained')
+        self.assertEqual(ANCHOR_Y, self._anchor.GetY(), 'The anchor is not constrained')
+
+        self.assertEqual(ANCHOR_X, self._below.GetX(), 'Below only constrains y')
+        self.assertEqual(BELOW_Y,  self._below.GetY(), 'Not below the anchor')
+
+        self.assertEqual(LEFT_OF_X, self._leftOf.GetX(), 'Not left of the anchor')
+        self.assertEqual(BELOW_Y,   self._leftOf.GetY(), 'Not top aligned with the shape below')
+
+    def _createChild(self, width: int, height: int, x: int, y: int) -> RectangleShape:
+
+        child: RectangleShape = RectangleShape(width, height)
+        child.SetX(x)
+        child.SetY(y)
+
+        return child
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestConstraintSolver))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,132 @@
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.lib.ogl import Diagram
+from umlshapes.lib.ogl import RectangleShape
+
+
+class EqualShape(RectangleShape):
+    """
+    Like the UML shapes, equal to any other shape of its kind
+    """
+    def __eq__(self, other):
+        return isinstance(other, EqualShape)
+
+    def __hash__(self):
+        return 0
+
+
+class TestDiagram(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self._diagram: Diagram = Diagram()
+
+        self._bottom: RectangleShape = RectangleShape(w=10, h=10)
+        self._middle: RectangleShape = RectangleShape(w=10, h=10)
+        self._top:    RectangleShape = RectangleShape(w=10, h=10)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testAddKeepsOrder(self):
+
+        self._addAll()
+
+        self.assertEqual([self._bottom, self._middle, self._top], self._diagram.GetShapeList(), 'Shapes should be bottommost first')
+
+    def testAddAfter(self):
+
+        self._diagram.AddShape(self._bottom)
+        self._diagram.AddShape(self._top)
+        self._diagram.AddShape(self._middle, addAfter=self._bottom)
+
+        self.assertEqual([self._bottom, self._middle, self._top], self._diagram.GetShapeList(), 'Not added after the requested shape')
+
+    def testInsertAtFront(self):
+
+        self._diagram.AddShape(self._middle)
+        self._diagram.AddShape(self._top)
+        self._diagram.InsertShape(self._bottom)
+
+        self.assertEqual([self._bottom, self._middle, self._top], self._diagram.GetShapeList(), 'Not inserted at the front')
+
+    def testRemoveKeepsOrder(self):
+
+        self._addAll()
+        self._diagram.RemoveShape(self._middle)
+        self._diagram.RemoveShape(self._middle)
+
+        self.assertEqual([self._bottom, self._top], self._diagram.GetShapeList(), 'Wrong shape removed')
+        self.assertFalse(self._diagram.ContainsShape(self._middle), 'Removed shape still contained')
+
+    def testRemoveUsesIdentity(self):
+
+        first:  EqualShape = EqualShape(w=10, h=10)
+        second: EqualShape = EqualShape(w=10, h=10)
+
+        self._diagram.AddShape(first)
+        self._diagram.AddShape(second)
+        self._diagram.RemoveShape(second)
+
+        self.assertIs(first, self._diagram.GetShapeList()[0], 'Removed the equal shape instead')
+        self.assertEqual(1, self._diagram.GetCount(), 'Only one shape should be removed')
+
+    def testAddAfterTopmost(self):
+
+        self._diagram.AddShape(self._bottom)
+        self._diagram.AddShape(self._middle, addAfter=self._bottom)
+        self._diagram.AddShape(self._top)
+
+        self.assertEqual([self._bottom, self._middle, self._top], self._diagram.GetShapeList(), 'Adding after the topmost shape adds on top')
+        self.assertEqual([self._top, self._middle, self._bottom], self._diagram.GetCandidateShapes(0, 0), 'Candidates are topmost first')
+
+    def testAddAfterMissingShape(self):
+
+        self._diagram.AddShape(self._bottom)
+
+        self.assertRaises(ValueError, lambda: self._diagram.AddShape(self._top, addAfter=self._middle))
+
+    def testShapeListIsReadOnly(self):
+
+        self._addAll()
+
+        self.assertRaises(TypeError, lambda: self._diagram.GetShapeList().remove(self._middle))
+        self.assertRaises(TypeError, lambda: self._diagram.GetShapeList().append(self._middle))
+        self.assertEqual(3, self._diagram.GetCount(), 'The diagram should not change')
+
+    def testSetShapeListReorders(self):
+
+        self._addAll()
+        self._diagram.SetShapeList([self._top, self._middle, self._bottom])
+
+        self.assertEqual([self._top, self._middle, self._bottom], self._diagram.GetShapeList(), 'Order not replaced')
+        self.assertEqual([self._bottom, self._middle, self._top], self._diagram.GetCandidateShapes(0, 0), 'Candidates are topmost first')
+
+    def _addAll(self):
+
+        self._diagram.AddShape(self._bottom)
+        self._diagram.AddShape(self._middle)
+        self._diagram.AddShape(self._top)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestDiagram))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,115 @@
+from typing import List
+from typing import Tuple
+
+from math import cos
+from math import radians
+from math import sin
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+from unittest import skipUnless
+from unittest.mock import patch
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlshapes.lib.ogl import pointarray
+
+from umlshapes.lib.ogl.pointarray import HasNumPy
+from umlshapes.lib.ogl.pointarray import PointArray
+
+Points = List[Tuple[float, float]]
+
+POINTS: Points = [(0, 0), (10, 0), (10, 5.5), (-3, 7)]
+
+ANGLE:     float = radians(30)
+SIN_THETA: float = sin(ANGLE)
+COS_THETA: float = cos(ANGLE)
+
+
+class TestPointArray(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testScale(self):
+
+        points: Points = PointArray(POINTS).Scale(2, 0.5).ToList()
+
+        self.assertEqual([(0, 0), (20, 0), (20, 2.75), (-6, 3.5)], points, 'Incorrect scale')
+
+    def testTranslate(self):
+
+        points: Points = PointArray(POINTS).Translate(1, -1).ToList()
+
+        self.assertEqual([(1, -1), (11, -1), (11, 4.5), (-2, 6)], points, 'Incorrect translation')
+
+    def testRotateMatchesFormula(self):
+
+        x: float = 4
+        y: float = 2
+
+        expected: Points = [
+            (x1 * COS_THETA - y1 * SIN_THETA + x * (1 - COS_THETA) + y * SIN_THETA,
+             x1 * SIN_THETA + y1 * COS_THETA + y * (1 - COS_THETA) + x * SIN_THETA)
+            for x1, y1 in POINTS
+        ]
+        points: Points = PointArray(POINTS).Rotate(x, y, SIN_THETA, COS_THETA).ToList()
+
+        for (expectedX, expectedY), (actualX, actualY) in zip(expected, points):
+            self.assertAlmostEqual(expectedX, actualX, places=9, msg='Incorrect x')
+            self.assertAlmostEqual(expectedY, actualY, places=9, msg='Incorrect y')
+
+    def testCopyIsIndependent(self):
+
+        original: PointArray = PointArray(POINTS)
+        original.Copy().Translate(100, 100)
+
+        self.assertEqual([(float(x), float(y)) for x, y in POINTS], original.ToList(), 'The copy changed the original')
+
+    def testToIntListTruncates(self):
+
+        points: List[Tuple[int, int]] = PointArray([(1.9, -1.9)]).ToIntList()
+
+        self.assertEqual([(1, -1)], points, 'Should truncate like int()')
+        self.assertIsInstance(points[0][0], int, 'The dc needs integers')
+
+    @skipUnless(HasNumPy(), 'NumPy is not installed')
+    def testNumPyMatchesFallback(self):
+
+        vectorized: Tuple[Points, ...] = self._transformAll()
+        with patch.object(pointarray, 'numpy', None):
+            self.assertFalse(HasNumPy(), 'The fallback should be in use')
+            looped: Tuple[Points, ...] = self._transformAll()
+
+        self.assertEqual(looped, vectorized, 'NumPy and the fallback must give identical results')
+
+    def _transformAll(self) -> Tuple[Points, ...]:
+
+        scaled:     Points = PointArray(POINTS).Scale(1.5, 0.25).ToList()
+        translated: Points = PointArray(POINTS).Translate(-7.5, 3).ToList()
+        rotated:    Points = PointArray(POINTS).Rotate(4, 2, SIN_THETA, COS_THETA).ToList()
+        combined:   Points = PointArray(POINTS).Scale(3, 3).Rotate(1, 1, SIN_THETA, COS_THETA).Translate(2, 2).ToIntList()
+
+        return scaled, translated, rotated, combined
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPointArray))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
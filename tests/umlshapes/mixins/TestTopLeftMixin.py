@@ -134,6 +134,21 @@ class TestTopLeftMixin(UnitTestBaseW):
         self.assertEqual(self._expectedTopLeft, actualTopLeft, 'Broken top left report')
         self.assertEqual(self._expectedTopLeft, actualTopLeft, 'Broken top left report')
 
+    def testInsideExactRectangle(self):
+
+        shape: MixinShape = MixinShape()
+
+        self.assertTrue(shape.isInsideRectangle(shape.rectangle), 'The edges are inside')
+
+    def testNotInsideSmallerRectangle(self):
+
+        shape: MixinShape = MixinShape()
+
+        rectangle: Rectangle = shape.rectangle
+        rectangle.right -= 1
+
+        self.assertFalse(shape.isInsideRectangle(rectangle), 'The right edge sticks out')
+
 
 def suite() -> TestSuite:
     import unittest
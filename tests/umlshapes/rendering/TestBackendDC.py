@@ -0,0 +1,183 @@
+from typing import Any
+from typing import List
+from typing import Tuple
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import Bitmap
+from wx import Brush
+from wx import Colour
+from wx import Font
+from wx import Pen
+from wx import Point
+from wx import Rect
+from wx import Size
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.rendering.BackendDC import BackendDC
+from umlshapes.rendering.IDrawingBackend import BackendPoints
+from umlshapes.rendering.IDrawingBackend import IDrawingBackend
+from umlshapes.rendering.IDrawingBackend import TextExtent
+
+Call = Tuple[Any, ...]
+
+
+class RecordingBackend(IDrawingBackend):
+    """
+    Remembers the drawing calls;  Ignores the drawing state
+    """
+    def __init__(self):
+        self.calls: List[Call] = []
+
+    def setPen(self, pen: Pen):
+        pass
+
+    def setBrush(self, brush: Brush):
+        pass
+
+    def setFont(self, font: Font):
+        pass
+
+    def setTextForeground(self, colour: Colour):
+        pass
+
+    def drawLine(self, x1: float, y1: float, x2: float, y2: float):
+        self.calls.append(('line', x1, y1, x2, y2))
+
+    def drawLines(self, points: BackendPoints):
+        self.calls.append(('lines', points))
+
+    def drawRectangle(self, x: float, y: float, width: float, height: float, radius: float = 0):
+        self.calls.append(('rectangle', x, y, width, height, radius))
+
+    def drawEllipse(self, x: float, y: float, width: float, height: float):
+        self.calls.append(('ellipse', x, y, width, height))
+
+    def drawEllipticArc(self, x: float, y: float, width: float, height: float, startAngle: float, endAngle: float):
+        self.calls.append(('arc', x, y, width, height, round(startAngle), round(endAngle)))
+
+    def drawPolygon(self, points: BackendPoints):
+        self.calls.append(('polygon', points))
+
+    def drawSpline(self, points: BackendPoints):
+        self.calls.append(('spline', points))
+
+    def drawText(self, text: str, x: float, y: float):
+        self.calls.append(('text', text, x, y))
+
+    def drawBitmap(self, bitmap: Bitmap, x: float, y: float, useMask: bool = False):
+        self.calls.append(('bitmap', x, y))
+
+    def textExtent(self, text: str) -> TextExtent:
+        return len(text), 1
+
+    def setClippingRegion(self, x: float, y: float, width: float, height: float):
+        self.calls.append(('clip', x, y, width, height))
+
+    def destroyClippingRegion(self):
+        self.calls.append(('unclip',))
+
+
+class TestBackendDC(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self._backend:   RecordingBackend = RecordingBackend()
+        self._backendDC: BackendDC        = BackendDC(backend=self._backend)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testRectangleOverloads(self):
+
+        self._backendDC.DrawRectangle(10, 20, 30, 40)
+        self._backendDC.DrawRectangle(x=10, y=20, width=30, height=40)
+        self._backendDC.DrawRectangle(Rect(10, 20, 30, 40))
+        self._backendDC.DrawRectangle(rect=Rect(10, 20, 30, 40))
+        self._backendDC.DrawRectangle(Point(10, 20), Size(30, 40))
+        self._backendDC.DrawRectangle(pt=Point(10, 20), sz=Size(30, 40))
+
+        expected: Call = ('rectangle', 10, 20, 30, 40, 0)
+        self.assertEqual([expected] * 6, self._backend.calls, 'Every overload should draw the same rectangle')
+
+    def testRoundedRectangleOverloads(self):
+
+        self._backendDC.DrawRoundedRectangle(10, 20, 30, 40, 5)
+        self._backendDC.DrawRoundedRectangle(Rect(10, 20, 30, 40), 5)
+
+        expected: Call = ('rectangle', 10, 20, 30, 40, 5)
+        self.assertEqual([expected] * 2, self._backend.calls, 'Radius lost')
+
+    def testEllipseAndCircle(self):
+
+        self._backendDC.DrawEllipse(Rect(10, 20, 30, 40))
+        self._backendDC.DrawCircle(50, 50, 10)
+        self._backendDC.DrawCircle(Point(50, 50), 10)
+
+        self.assertEqual(
+            [('ellipse', 10, 20, 30, 40), ('ellipse', 40, 40, 20, 20), ('ellipse', 40, 40, 20, 20)],
+            self._backend.calls,
+            'Circles are ellipses in their bounding box'
+        )
+
+    def testLineAndTextOverloads(self):
+
+        self._backendDC.DrawLine(1, 2, 3, 4)
+        self._backendDC.DrawLine(Point(1, 2), Point(3, 4))
+        self._backendDC.DrawText('Ozzee', 5, 6)
+        self._backendDC.DrawText('Ozzee', Point(5, 6))
+
+        self.assertEqual(
+            [('line', 1, 2, 3, 4), ('line', 1, 2, 3, 4), ('text', 'Ozzee', 5, 6), ('text', 'Ozzee', 5, 6)],
+            self._backend.calls,
+            'Point overloads not unpacked'
+        )
+
+    def testPointsOffset(self):
+
+        self._backendDC.DrawPolygon([Point(0, 0), (10, 0), (10, 10)], xoffset=5, yoffset=1)
+
+        self.assertEqual([('polygon', [(5, 1), (15, 1), (15, 11)])], self._backend.calls, 'Offset not applied')
+
+    def testEllipticArc(self):
+
+        self._backendDC.DrawEllipticArc(10, 20, 30, 40, 0, 90)
+
+        self.assertEqual([('arc', 10, 20, 30, 40, 0, 90)], self._backend.calls, 'Arc should pass through')
+
+    def testArc(self):
+        #
+        # A quarter circle of radius 10 around (50, 50), from three o'clock to twelve o'clock
+        #
+        self._backendDC.DrawArc(60, 50, 50, 40, 50, 50)
+
+        self.assertEqual([('arc', 40, 40, 20, 20, 0, 90)], self._backend.calls, 'Arc should be an elliptic arc in its circle box')
+
+    def testClipping(self):
+
+        self._backendDC.SetClippingRegion(Rect(1, 2, 3, 4))
+        self._backendDC.DestroyClippingRegion()
+
+        self.assertEqual([('clip', 1, 2, 3, 4), ('unclip',)], self._backend.calls, 'Clipping not forwarded')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestBackendDC))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
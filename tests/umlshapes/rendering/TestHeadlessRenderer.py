@@ -0,0 +1,166 @@
+
+from typing import List
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from math import ceil
+
+from wx import Bitmap
+from wx import Rect
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.lib.ogl import CONTROL_POINT_VERTICAL
+from umlshapes.lib.ogl import ControlPoint
+from umlshapes.lib.ogl import OGLInitialize
+from umlshapes.lib.ogl import RectangleShape
+
+from umlshapes.rendering.HeadlessRenderer import HeadlessRenderer
+from umlshapes.rendering.HeadlessRenderer import RenderedTile
+
+MARGIN:       int = 10
+SHAPE_WIDTH:  int = 100
+SHAPE_HEIGHT: int = 50
+TILE_SIZE:    int = 512
+
+
+class DrawCounter:
+    """
+    Counts how many times the shape is drawn
+    """
+    drawCount: int = 0
+
+    def OnDraw(self, dc):
+        self.drawCount += 1
+        super().OnDraw(dc)      # type: ignore
+
+
+class CountingShape(DrawCounter, RectangleShape):
+    pass
+
+
+class CountingControlPoint(DrawCounter, ControlPoint):
+    pass
+
+
+class TestHeadlessRenderer(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        OGLInitialize()
+
+        self._near: CountingShape = self._createShape(x=100, y=100)
+        self._far:  CountingShape = self._createShape(x=1000, y=800)
+
+        # Far outside both shapes;  It would stretch the boundaries if it was kept
+        self._controlPoint: CountingControlPoint = CountingControlPoint(None, self._near, 6, 0, 0, CONTROL_POINT_VERTICAL)
+        self._controlPoint.SetX(5000)
+        self._controlPoint.SetY(5000)
+
+        self._renderer: HeadlessRenderer = HeadlessRenderer(shapes=[self._near, self._controlPoint, self._far], margin=MARGIN)
+
+        self._expectedBoundaries: Rect = self._near.GetDamageRectangle().Union(self._far.GetDamageRectangle()).Inflate(MARGIN, MARGIN)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testBoundaries(self):
+        self.assertEqual(self._expectedBoundaries, self._renderer.boundaries, 'The shapes plus the margin')
+
+    def testRenderSize(self):
+
+        bitmap: Bitmap = self._renderer.render()
+
+        self.assertEqual(self._expectedBoundaries.GetSize(), bitmap.GetSize(), 'Full size render is the boundaries')
+
+    def testRenderScaledUp(self):
+        self._assertScaledSize(scale=2.0)
+
+    def testRenderScaledDown(self):
+        self._assertScaledSize(scale=0.5)
+
+    def testTileCount(self):
+
+        tiles: List[RenderedTile] = list(self._renderer.tiles(tileSize=TILE_SIZE))
+
+        expectedRows:    int = ceil(self._expectedBoundaries.height / TILE_SIZE)
+        expectedColumns: int = ceil(self._expectedBoundaries.width / TILE_SIZE)
+
+        self.assertEqual(expectedRows * expectedColumns, len(tiles), 'Incorrect tile count')
+        self.assertEqual(expectedRows - 1,    tiles[-1].row,    'The last tile is in the last row')
+        self.assertEqual(expectedColumns - 1, tiles[-1].column, 'The last tile is in the last column')
+
+    def testTilesCoverBoundaries(self):
+
+        tiles: List[RenderedTile] = list(self._renderer.tiles(tileSize=TILE_SIZE))
+
+        covered:   Rect = Rect(tiles[0].area)
+        totalArea: int  = 0
+        for tile in tiles:
+            covered = covered.Union(tile.area)
+            totalArea += tile.area.width * tile.area.height
+            self.assertEqual(tile.area.GetSize(), tile.bitmap.GetSize(), 'A tile bitmap is its area at scale 1')
+
+        self.assertEqual(self._expectedBoundaries, covered, 'The tiles should cover the diagram')
+        self.assertEqual(self._expectedBoundaries.width * self._expectedBoundaries.height, totalArea, 'The tiles should not overlap')
+
+    def testShapesInExcludesFarShape(self):
+
+        area: Rect = self._near.GetDamageRectangle()
+
+        self.assertEqual([self._near], self._renderer.shapesIn(area), 'Only the near shape reaches the area')
+
+    def testFarShapeNotDrawn(self):
+
+        self._renderer.renderArea(area=self._near.GetDamageRectangle())
+
+        self.assertEqual(1, self._near.drawCount, 'The near shape should be drawn')
+        self.assertEqual(0, self._far.drawCount, 'The far shape should be culled')
+
+    def testControlPointsSkipped(self):
+
+        self._renderer.render()
+
+        self.assertEqual(2, self._renderer.shapeCount, 'The control point is not kept')
+        self.assertEqual(0, self._controlPoint.drawCount, 'The control point should not be drawn')
+        self.assertEqual(1, self._near.drawCount, 'Every shape is drawn once')
+        self.assertEqual(1, self._far.drawCount, 'Every shape is drawn once')
+
+    def _assertScaledSize(self, scale: float):
+
+        bitmap: Bitmap = self._renderer.render(scale=scale)
+
+        self.assertEqual(ceil(self._expectedBoundaries.width * scale),  bitmap.GetWidth(),  f'Incorrect width at scale {scale}')
+        self.assertEqual(ceil(self._expectedBoundaries.height * scale), bitmap.GetHeight(), f'Incorrect height at scale {scale}')
+
+    def _createShape(self, x: int, y: int) -> CountingShape:
+
+        shape: CountingShape = CountingShape(SHAPE_WIDTH, SHAPE_HEIGHT)
+        shape.SetX(x)
+        shape.SetY(y)
+
+        return shape
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestHeadlessRenderer))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,108 @@
+
+from typing import List
+
+from io import BytesIO
+
+from os import urandom
+
+from struct import unpack_from
+
+from zlib import crc32
+from zlib import decompress
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlshapes.rendering.PngStreamWriter import PNG_SIGNATURE
+from umlshapes.rendering.PngStreamWriter import PngStreamError
+from umlshapes.rendering.PngStreamWriter import PngStreamWriter
+
+WIDTH:  int = 37
+HEIGHT: int = 50
+
+
+class TestPngStreamWriter(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+        self._pixels: bytes = urandom(WIDTH * HEIGHT * 3)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testSingleBand(self):
+        self.assertEqual(self._pixels, self._decode(self._encode(bandRows=HEIGHT, workers=1)), 'Pixels changed')
+
+    def testManyBandsInParallel(self):
+        self.assertEqual(self._pixels, self._decode(self._encode(bandRows=7, workers=4)), 'Pixels changed')
+
+    def testPartialRow(self):
+
+        writer: PngStreamWriter = PngStreamWriter(stream=BytesIO(), width=WIDTH, height=HEIGHT)
+
+        self.assertRaises(PngStreamError, lambda: writer.writeBand(b'\x00'))
+
+    def testIncomplete(self):
+
+        writer: PngStreamWriter = PngStreamWriter(stream=BytesIO(), width=WIDTH, height=HEIGHT)
+        writer.writeBand(self._pixels[:WIDTH * 3])
+
+        self.assertRaises(PngStreamError, writer.close)
+
+    def _encode(self, bandRows: int, workers: int) -> bytes:
+
+        stream:   BytesIO = BytesIO()
+        bandSize: int     = bandRows * WIDTH * 3
+        with PngStreamWriter(stream=stream, width=WIDTH, height=HEIGHT, workers=workers) as writer:
+            for start in range(0, len(self._pixels), bandSize):
+                writer.writeBand(self._pixels[start:start + bandSize])
+
+        return stream.getvalue()
+
+    def _decode(self, png: bytes) -> bytes:
+        """
+        Checks the chunks and returns the unfiltered pixels
+        """
+        self.assertEqual(PNG_SIGNATURE, png[:len(PNG_SIGNATURE)], 'Not a PNG')
+
+        position: int         = len(PNG_SIGNATURE)
+        idat:     List[bytes] = []
+        while position < len(png):
+            length,    = unpack_from('>I', png, position)
+            chunkType: bytes = png[position + 4:position + 8]
+            data:      bytes = png[position + 8:position + 8 + length]
+            crc,       = unpack_from('>I', png, position + 8 + length)
+
+            self.assertEqual(crc32(data, crc32(chunkType)), crc, f'Bad {chunkType!r} checksum')
+            if chunkType == b'IHDR':
+                self.assertEqual((WIDTH, HEIGHT), unpack_from('>II', data), 'Wrong size')
+            elif chunkType == b'IDAT':
+                idat.append(data)
+
+            position += 12 + length
+
+        filtered: bytes = decompress(b''.join(idat))      # Also checks the adler32
+        rowBytes: int   = WIDTH * 3 + 1
+
+        return b''.join(filtered[row * rowBytes + 1:(row + 1) * rowBytes] for row in range(HEIGHT))
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestPngStreamWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
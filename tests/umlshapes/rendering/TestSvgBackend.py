@@ -0,0 +1,150 @@
+from typing import List
+
+from io import StringIO
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import fromstring
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import BLACK_PEN
+from wx import PENSTYLE_SHORT_DASH
+from wx import RED
+from wx import TRANSPARENT_BRUSH
+
+from wx import Brush
+from wx import Pen
+from wx import Rect
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.rendering.BackendDC import BackendDC
+from umlshapes.rendering.SvgBackend import SVG_NAMESPACE
+from umlshapes.rendering.SvgBackend import SvgBackend
+
+from umlshapes.utils.ResourceUtils import ResourceUtils
+
+SVG: str = f'{{{SVG_NAMESPACE}}}'
+
+
+class TestSvgBackend(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self._stream:     StringIO   = StringIO()
+        self._svgBackend: SvgBackend = SvgBackend(stream=self._stream, area=Rect(100, 200, 300, 400))
+        self._backendDC:  BackendDC  = BackendDC(backend=self._svgBackend)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testEmptyDocument(self):
+
+        svg: Element = self._closeAndParse()
+
+        self.assertEqual(f'{SVG}svg', svg.tag, 'Not an SVG document')
+        self.assertEqual('300', svg.get('width'), 'Width should be the area width')
+        self.assertEqual('0 0 300 400', svg.get('viewBox'), 'View box should be the area size')
+        self.assertEqual('translate(-100,-200)', svg.find(f'{SVG}g').get('transform'), 'Diagram coordinates not moved to the origin')   # type: ignore
+
+    def testPrimitives(self):
+
+        self._backendDC.DrawLine(0, 0, 10, 10)
+        self._backendDC.DrawLines([(0, 0), (5, 5), (10, 0)])
+        self._backendDC.DrawRectangle(Rect(10, 20, 30, 40))
+        self._backendDC.DrawRoundedRectangle(10, 20, 30, 40, 5)
+        self._backendDC.DrawEllipse(10, 20, 30, 40)
+        self._backendDC.DrawPolygon([(0, 0), (10, 0), (10, 10)])
+        self._backendDC.DrawSpline([(0, 0), (10, 10), (20, 0), (30, 10)])
+
+        svg: Element = self._closeAndParse()
+
+        for tag in ['line', 'polyline', 'ellipse', 'polygon', 'path']:
+            self.assertEqual(1, len(svg.findall(f'.//{SVG}{tag}')), f'Expected one {tag}')
+
+        rectangles: List[Element] = svg.findall(f'.//{SVG}rect')
+        self.assertEqual(2, len(rectangles), 'Expected two rectangles')
+        self.assertEqual('5', rectangles[1].get('rx'), 'Rounded corner lost')
+        self.assertEqual(7, self._svgBackend.elementCount, 'Incorrect element count')
+
+    def testFilledArc(self):
+
+        self._backendDC.DrawEllipticArc(0, 0, 20, 20, 0, 90)
+
+        paths: List[Element] = self._closeAndParse().findall(f'.//{SVG}path')
+
+        self.assertEqual(2, len(paths), 'A filled arc is a pie slice and a stroked curve')
+        self.assertEqual('none', paths[1].get('fill'), 'The curve is not filled')
+
+    def testUnfilledArc(self):
+
+        self._backendDC.SetBrush(TRANSPARENT_BRUSH)
+        self._backendDC.DrawArc(60, 50, 50, 40, 50, 50)
+
+        paths: List[Element] = self._closeAndParse().findall(f'.//{SVG}path')
+
+        self.assertEqual(1, len(paths), 'Only the curve is drawn')
+        self.assertTrue(paths[0].get('d', '').startswith('M 60 50 A 10 10'), 'The arc starts at three o\'clock')
+
+    def testStroke(self):
+
+        self._backendDC.SetPen(Pen(RED, 2, PENSTYLE_SHORT_DASH))
+        self._backendDC.SetBrush(Brush(RED))
+        self._backendDC.DrawRectangle(0, 0, 10, 10)
+
+        rectangle: Element = self._closeAndParse().find(f'.//{SVG}rect')     # type: ignore
+
+        self.assertEqual('#ff0000', rectangle.get('stroke'), 'Wrong stroke colour')
+        self.assertEqual('#ff0000', rectangle.get('fill'),   'Wrong fill colour')
+        self.assertEqual('6,6',     rectangle.get('stroke-dasharray'), 'Dashes scale with the pen width')
+
+    def testTextIsEscapedAndSizedInPixels(self):
+
+        self._backendDC.SetFont(ResourceUtils.defaultFont())
+        self._backendDC.DrawText('Ozzee <the dog> & Fran', 10, 20)
+
+        text: Element = self._closeAndParse().find(f'.//{SVG}text')        # type: ignore
+
+        self.assertEqual('Ozzee <the dog> & Fran', text.text, 'Text not escaped')
+        self.assertFalse(text.get('font-size', '').endswith('pt'), 'The layout is measured in pixels')
+        self.assertGreater(int(text.get('font-size', '0')), 0, 'Missing font size')
+
+    def testClippingGroupsAreClosed(self):
+
+        self._backendDC.SetClippingRegion(0, 0, 10, 10)
+        self._backendDC.DrawLine(0, 0, 10, 10)
+        self._backendDC.SetClippingRegion(5, 5, 10, 10)
+        self._backendDC.SetPen(BLACK_PEN)
+        self._backendDC.DrawLine(5, 5, 10, 10)
+
+        svg: Element = self._closeAndParse()
+
+        self.assertEqual(2, len(svg.findall(f'.//{SVG}clipPath')), 'Each clipping region gets a clip path')
+        self.assertEqual(2, len(svg.findall(f'.//{SVG}g[@clip-path]')), 'Each clipping region gets a group')
+
+    def _closeAndParse(self) -> Element:
+
+        self._svgBackend.close()
+
+        return fromstring(self._stream.getvalue())
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSvgBackend))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,114 @@
+
+from typing import cast
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import Bitmap
+from wx import MemoryDC
+from wx import NullBitmap
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlmodel.Class import Class
+from umlmodel.Field import Field
+from umlmodel.Method import Method
+
+from umlshapes.lib.ogl import OGLInitialize
+
+from umlshapes.shapes.UmlClass import UmlClass
+
+from umlshapes.types.UmlPosition import UmlPosition
+
+
+class TestUmlClass(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        OGLInitialize()
+
+        self._modelClass: Class    = Class(name='RenderCached')
+        self._umlClass:   UmlClass = UmlClass(modelClass=self._modelClass)
+        self._umlClass.position = UmlPosition(x=50, y=50)
+
+        self._bitmap: Bitmap = Bitmap(400, 400)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testRenderCacheHit(self):
+
+        firstBitmap: Bitmap = self._drawCached()
+
+        self.assertIs(firstBitmap, self._drawCached(), 'Nothing changed, the bitmap should be reused')
+
+    def testRenderCacheMissOnMethodAppend(self):
+
+        firstBitmap: Bitmap = self._drawCached()
+
+        self._modelClass.methods.append(Method(name='appendedInPlace'))
+
+        self.assertIsNot(firstBitmap, self._drawCached(), 'An appended method should miss the cache')
+
+    def testRenderCacheMissOnFieldAppend(self):
+
+        firstBitmap: Bitmap = self._drawCached()
+
+        self._modelClass.fields.append(Field(name='appendedInPlace'))
+
+        self.assertIsNot(firstBitmap, self._drawCached(), 'An appended field should miss the cache')
+
+    def testRenderCacheMissOnRename(self):
+
+        firstBitmap: Bitmap = self._drawCached()
+
+        self._modelClass.name = 'Renamed'
+
+        self.assertIsNot(firstBitmap, self._drawCached(), 'A rename should miss the cache')
+
+    def testRenderCacheMissOnMethodEdit(self):
+
+        method: Method = Method(name='edited')
+        self._modelClass.methods.append(method)
+        firstBitmap: Bitmap = self._drawCached()
+
+        method.name = 'editedInPlace'
+
+        self.assertIsNot(firstBitmap, self._drawCached(), 'An edited method should miss the cache')
+
+    def _drawCached(self) -> Bitmap:
+        """
+        Draw through the render cache whatever the preference says
+
+        Returns:  The bitmap the class was blitted from
+        """
+        dc: MemoryDC = MemoryDC(self._bitmap)
+        # noinspection PyProtectedMember
+        self._umlClass._drawFromRenderCache(dc=dc)
+        dc.SelectObject(NullBitmap)
+
+        # noinspection PyProtectedMember
+        return cast(Bitmap, self._umlClass._renderCache)
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestUmlClass))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
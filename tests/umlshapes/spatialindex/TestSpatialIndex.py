@@ -0,0 +1,106 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlshapes.spatialindex.SpatialIndex import IndexHits
+from umlshapes.spatialindex.SpatialIndex import SpatialIndex
+
+from umlshapes.types.Common import Rectangle
+
+TEST_CELL_SIZE: int = 100
+
+
+class TestSpatialIndex(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+        self._spatialIndex: SpatialIndex = SpatialIndex(cellSize=TEST_CELL_SIZE)
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testPointQueryHit(self):
+
+        self._spatialIndex.insert(1, Rectangle(left=10, top=10, right=50, bottom=50))
+
+        hits: IndexHits = self._spatialIndex.pointQuery(x=20, y=20)
+        self.assertEqual({1}, hits, 'Point is inside the entry')
+
+    def testPointQueryMiss(self):
+
+        self._spatialIndex.insert(1, Rectangle(left=10, top=10, right=50, bottom=50))
+
+        hits: IndexHits = self._spatialIndex.pointQuery(x=60, y=60)
+        self.assertEqual(0, len(hits), 'Point is in the same cell but outside the entry')
+
+    def testPointQuerySpansCells(self):
+
+        self._spatialIndex.insert(1, Rectangle(left=90, top=90, right=250, bottom=250))
+
+        hits: IndexHits = self._spatialIndex.pointQuery(x=220, y=220)
+        self.assertEqual({1}, hits, 'Entry should be registered in every cell it overlaps')
+
+    def testPointQueryNegativeCoordinates(self):
+
+        self._spatialIndex.insert(1, Rectangle(left=-150, top=-150, right=-10, bottom=-10))
+
+        hits: IndexHits = self._spatialIndex.pointQuery(x=-120, y=-20)
+        self.assertEqual({1}, hits, 'Negative coordinates are on the grid too')
+
+    def testInsertReplaces(self):
+
+        self._spatialIndex.insert(1, Rectangle(left=10, top=10, right=50, bottom=50))
+        self._spatialIndex.insert(1, Rectangle(left=510, top=510, right=550, bottom=550))
+
+        self.assertEqual(1, len(self._spatialIndex), 'Re-inserting should not duplicate the entry')
+        self.assertEqual(0, len(self._spatialIndex.pointQuery(x=20, y=20)), 'Old location should be gone')
+        self.assertEqual({1}, self._spatialIndex.pointQuery(x=520, y=520), 'Should be at the new location')
+
+    def testRemove(self):
+
+        self._spatialIndex.insert(1, Rectangle(left=10, top=10, right=250, bottom=250))
+        self._spatialIndex.remove(1)
+
+        self.assertFalse(1 in self._spatialIndex, 'Entry should be gone')
+        self.assertEqual(0, len(self._spatialIndex._cells), 'Empty cells should be discarded')
+
+    def testRemoveUnknownKey(self):
+        self._spatialIndex.remove(99)
+        self.assertEqual(0, len(self._spatialIndex), 'Removing an unknown key is a no-op')
+
+    def testRectangleQuery(self):
+
+        self._spatialIndex.insert(1, Rectangle(left=10,  top=10,  right=50,  bottom=50))
+        self._spatialIndex.insert(2, Rectangle(left=300, top=300, right=350, bottom=350))
+        self._spatialIndex.insert(3, Rectangle(left=900, top=900, right=950, bottom=950))
+
+        hits: IndexHits = self._spatialIndex.rectangleQuery(Rectangle(left=40, top=40, right=310, bottom=310))
+        self.assertEqual({1, 2}, hits, 'Should only find the intersecting entries')
+
+    def testBoundingRectangle(self):
+
+        rectangle: Rectangle = Rectangle(left=10, top=20, right=30, bottom=40)
+        self._spatialIndex.insert(1, rectangle)
+
+        self.assertEqual(rectangle, self._spatialIndex.boundingRectangle(1), 'Should be what we inserted')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestSpatialIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,80 @@
+
+from typing import Set
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from uuid import UUID
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlshapes.types.IDStrategy import IDStrategy
+
+from umlshapes.utils.IDUtil import IDUtil
+
+ID_COUNT: int = 1000
+
+
+class TestIDUtil(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        IDUtil.setIDStrategy(IDStrategy.HUMAN_READABLE)
+
+    def testCounterUnique(self):
+        self._checkUnique(IDStrategy.COUNTER)
+
+    def testUUID4Unique(self):
+        self._checkUnique(IDStrategy.UUID4)
+
+    def testUUID7Unique(self):
+        self._checkUnique(IDStrategy.UUID7)
+
+    def testUUID7Version(self):
+
+        IDUtil.setIDStrategy(IDStrategy.UUID7)
+
+        uuid: UUID = UUID(IDUtil.getID())
+        self.assertEqual(7, uuid.version, 'Not a version 7 UUID')
+
+    def testUUID7Ordered(self):
+
+        IDUtil.setIDStrategy(IDStrategy.UUID7)
+
+        first:  str = IDUtil.getID()
+        second: str = IDUtil.getID()
+        self.assertLessEqual(first[:13], second[:13], 'Time stamp should not go backwards')
+
+    def testChangeStrategy(self):
+
+        IDUtil.setIDStrategy(IDStrategy.UUID4)
+        self.assertEqual(IDStrategy.UUID4, IDUtil.idStrategy(), 'Strategy not changed')
+
+    def _checkUnique(self, idStrategy: IDStrategy):
+
+        IDUtil.setIDStrategy(idStrategy)
+
+        ids: Set[str] = {IDUtil.getID() for _ in range(ID_COUNT)}
+        self.assertEqual(ID_COUNT, len(ids), f'{idStrategy.value} IDs are not unique')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestIDUtil))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,146 @@
+
+from pickle import dumps
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from codeallybasic.UnitTestBase import UnitTestBase
+
+from umlmodel.Class import Class
+from umlmodel.Note import Note
+from umlmodel.Method import Method
+from umlmodel.enumerations.Visibility import Visibility
+
+from umlshapes.utils.ModelSnapshot import InvalidSnapshotError
+from umlshapes.utils.ModelSnapshot import ModelObjects
+from umlshapes.utils.ModelSnapshot import ModelSnapshot
+from umlshapes.utils.ModelSnapshot import SNAPSHOT_HEADER
+from umlshapes.utils.ModelSnapshot import SNAPSHOT_MAGIC
+
+
+class Payload:
+    """
+    Runs a function when unpickled
+    """
+    def __reduce__(self):
+        return print, ('Should never be printed',)
+
+
+class TestModelSnapshot(UnitTestBase):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self._modelClass: Class = Class(name='Ozzee')
+        self._modelClass.methods.append(Method(name='bark'))
+
+        self._modelParent: Class = Class(name='Dog')
+        self._modelClass.addParent(self._modelParent)
+
+        self._modelNote: Note = Note(content='Good dog')
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testRoundTrip(self):
+
+        snapshot:     ModelSnapshot = ModelSnapshot.capture([self._modelClass, self._modelNote])
+        modelObjects: ModelObjects  = snapshot.materialize()
+
+        self.assertEqual(2, len(snapshot), 'Incorrect count')
+
+        modelClass: Class = modelObjects[0]       # type: ignore
+        self.assertEqual('Ozzee', modelClass.name,            'Name not copied')
+        self.assertEqual('bark',  modelClass.methods[0].name, 'Methods not copied')
+        self.assertEqual('Good dog', modelObjects[1].content, 'Note content not copied')     # type: ignore
+
+    def testCopiesAreIndependent(self):
+
+        snapshot:   ModelSnapshot = ModelSnapshot.capture([self._modelClass])
+        modelClass: Class         = snapshot.materialize()[0]     # type: ignore
+
+        modelClass.methods.append(Method(name='sit'))
+        self._modelClass.name = 'Fran'
+
+        again: Class = snapshot.materialize()[0]      # type: ignore
+        self.assertEqual(1,       len(self._modelClass.methods), 'Original changed through the copy')
+        self.assertEqual(1,       len(again.methods),            'Snapshot changed through a copy')
+        self.assertEqual('Ozzee', again.name,                    'Snapshot changed through the original')
+
+    def testNewIdentifiers(self):
+
+        snapshot: ModelSnapshot = ModelSnapshot.capture([self._modelClass])
+
+        first:  Class = snapshot.materialize()[0]      # type: ignore
+        second: Class = snapshot.materialize()[0]      # type: ignore
+
+        self.assertNotEqual(self._modelClass.id, first.id, 'Copy needs a new id')
+        self.assertNotEqual(first.id, second.id,           'Each paste needs a new id')
+
+    def testParentsNotCaptured(self):
+
+        modelClass: Class = ModelSnapshot.capture([self._modelClass]).materialize()[0]      # type: ignore
+
+        self.assertEqual(0, len(modelClass.parents), 'Parents should not be copied')
+        self.assertEqual(0, len(modelClass.links),   'Links should not be copied')
+
+    def testBytesRoundTrip(self):
+
+        blob:     bytes         = ModelSnapshot.capture([self._modelNote]).toBytes()
+        snapshot: ModelSnapshot = ModelSnapshot.fromBytes(blob)
+
+        self.assertEqual(1, len(snapshot), 'Count lost in bytes')
+        self.assertEqual('Good dog', snapshot.materialize()[0].content, 'Content lost in bytes')     # type: ignore
+
+    def testInvalidBytes(self):
+        self.assertRaises(InvalidSnapshotError, lambda: ModelSnapshot.fromBytes(b'not a snapshot'))
+
+    def testForeignCallableRejected(self):
+
+        blob: bytes = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, 1) + dumps([(Note, {'content': Payload()})])
+
+        self.assertRaises(InvalidSnapshotError, lambda: ModelSnapshot.fromBytes(blob).materialize())
+
+    def testNonModelTypeRejected(self):
+
+        blob: bytes = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, 1) + dumps([(Visibility, {})])
+
+        self.assertRaises(InvalidSnapshotError, lambda: ModelSnapshot.fromBytes(blob).materialize())
+
+    def testCorruptBytesRejected(self):
+
+        blob: bytes = ModelSnapshot.capture([self._modelNote]).toBytes()
+
+        self.assertRaises(InvalidSnapshotError, lambda: ModelSnapshot.fromBytes(blob[:-4]).materialize())
+
+    def testLoggerRestored(self):
+
+        modelNote: Note = ModelSnapshot.capture([self._modelNote]).materialize()[0]      # type: ignore
+
+        self.assertIs(self._modelNote.logger, modelNote.logger, 'The copy should use the same named logger')
+
+    def testEmpty(self):
+
+        snapshot: ModelSnapshot = ModelSnapshot()
+
+        self.assertEqual(0, len(snapshot),               'Should be empty')
+        self.assertEqual(0, len(snapshot.materialize()), 'Nothing to paste')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestModelSnapshot))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
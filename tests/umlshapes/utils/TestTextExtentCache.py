@@ -0,0 +1,101 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import Bitmap
+from wx import MemoryDC
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.lib.ogl.oglmisc import FORMAT_NONE
+from umlshapes.lib.ogl.oglmisc import FormatText
+
+from umlshapes.utils.ResourceUtils import ResourceUtils
+from umlshapes.utils.TextExtentCache import TextExtent
+from umlshapes.utils.TextExtentCache import TextExtentCache
+
+
+class TestTextExtentCache(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self._bitmap: Bitmap   = Bitmap(100, 100)
+        self._dc:     MemoryDC = MemoryDC(self._bitmap)
+        self._dc.SetFont(ResourceUtils.defaultFont())
+
+        self._textExtentCache: TextExtentCache = TextExtentCache()
+        self._saveMaximumSize: int             = self._textExtentCache.maximumSize
+        self._textExtentCache.clear()
+
+    def tearDown(self):
+        super().tearDown()
+        self._textExtentCache.maximumSize = self._saveMaximumSize
+        self._textExtentCache.clear()
+
+    def testSameAsDC(self):
+
+        extent:   TextExtent = self._textExtentCache.textExtent(dc=self._dc, text='Ozzee the dog')
+        expected: TextExtent = TextExtent(*self._dc.GetTextExtent('Ozzee the dog'))
+
+        self.assertEqual(expected, extent, 'Cache must not change the measurement')
+
+    def testHitsAndMisses(self):
+
+        self._textExtentCache.textWidth(dc=self._dc, text='Ozzee')
+        self._textExtentCache.textWidth(dc=self._dc, text='Ozzee')
+        self._textExtentCache.textWidth(dc=self._dc, text='Fran')
+
+        self.assertEqual(1, self._textExtentCache.hits,   'Incorrect hit count')
+        self.assertEqual(2, self._textExtentCache.misses, 'Incorrect miss count')
+
+    def testLeastRecentlyUsedEvicted(self):
+
+        self._textExtentCache.maximumSize = 2
+
+        self._textExtentCache.textWidth(dc=self._dc, text='first')
+        self._textExtentCache.textWidth(dc=self._dc, text='second')
+        self._textExtentCache.textWidth(dc=self._dc, text='first')     # now most recently used
+        self._textExtentCache.textWidth(dc=self._dc, text='third')     # evicts 'second'
+
+        self.assertEqual(2, len(self._textExtentCache), 'Cache should be bounded')
+
+        self._textExtentCache.textWidth(dc=self._dc, text='first')
+        self.assertEqual(2, self._textExtentCache.hits, "'first' should have survived")
+
+        self._textExtentCache.textWidth(dc=self._dc, text='second')
+        self.assertEqual(4, self._textExtentCache.misses, "'second' should have been evicted")
+
+    def testFormatTextMeasuresWords(self):
+
+        lines = FormatText(self._dc, 'Ozzee Ozzee Fran', width=10000, height=100, formatMode=FORMAT_NONE)
+
+        self.assertEqual(['Ozzee Ozzee Fran'], lines, 'Everything fits on one line')
+        self.assertEqual(3, len(self._textExtentCache), 'Only the space and the distinct words are measured')
+
+    def testFormatTextWraps(self):
+
+        wordWidth: int = self._textExtentCache.textWidth(dc=self._dc, text='Ozzee')
+
+        lines = FormatText(self._dc, 'Ozzee Ozzee Ozzee', width=wordWidth, height=100, formatMode=FORMAT_NONE)
+
+        self.assertEqual(['Ozzee', 'Ozzee', 'Ozzee'], lines, 'One word fits on each line')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTextExtentCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,76 @@
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from wx import Bitmap
+from wx import MemoryDC
+
+from codeallyadvanced.ui.UnitTestBaseW import UnitTestBaseW
+
+from umlshapes.utils.ResourceUtils import ResourceUtils
+from umlshapes.utils.TextLayout import TextLayout
+
+NOTE_TEXT: str = 'Ozzee the dog\nFran the cat'
+
+
+class TestTextLayout(UnitTestBaseW):
+    """
+    Auto generated by the one and only:
+        Gato Malo – Humberto A. Sanchez II
+        Generated: 18 October 2026
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self._bitmap: Bitmap   = Bitmap(100, 100)
+        self._dc:     MemoryDC = MemoryDC(self._bitmap)
+        self._dc.SetFont(ResourceUtils.defaultFont())
+
+        self._textLayout: TextLayout = TextLayout()
+
+    def tearDown(self):
+        super().tearDown()
+
+    def testBreaksAtNewLines(self):
+
+        self._textLayout.update(dc=self._dc, text=NOTE_TEXT)
+
+        self.assertEqual(['Ozzee the dog', 'Fran the cat'], [line.text for line in self._textLayout.lines], 'Should only break at new lines')
+
+    def testLineExtents(self):
+
+        self._textLayout.update(dc=self._dc, text=NOTE_TEXT)
+
+        expectedWidth, _ = self._dc.GetTextExtent('Ozzee the dog')
+        self.assertEqual(expectedWidth, self._textLayout.lines[0].width, 'Line width does not match the dc')
+
+    def testUnchangedIsNotLaidOutAgain(self):
+
+        self.assertTrue(self._textLayout.update(dc=self._dc, text=NOTE_TEXT, wrapWidth=50), 'First update lays out')
+        self.assertFalse(self._textLayout.update(dc=self._dc, text=NOTE_TEXT, wrapWidth=50), 'Nothing changed')
+
+        self.assertTrue(self._textLayout.update(dc=self._dc, text=NOTE_TEXT, wrapWidth=60), 'The width changed')
+        self.assertTrue(self._textLayout.update(dc=self._dc, text='Ozzee', wrapWidth=60),   'The text changed')
+
+    def testWrapsToWidth(self):
+
+        wordWidth, _ = self._dc.GetTextExtent('Ozzee ')
+
+        self._textLayout.update(dc=self._dc, text='Ozzee Ozzee Ozzee', wrapWidth=wordWidth)
+
+        self.assertEqual(3, len(self._textLayout), 'One word fits on each line')
+
+
+def suite() -> TestSuite:
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+
+    testSuite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(testCaseClass=TestTextLayout))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()